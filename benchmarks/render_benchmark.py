@@ -0,0 +1,134 @@
+"""
+NIHR Dashboard Page-Render Benchmark
+Drives the full dashboard script headlessly through Streamlit's AppTest harness
+
+Usage:
+    python benchmarks/render_benchmark.py                     # bundled sample data
+    python benchmarks/render_benchmark.py --n-projects 100000 --repeat 5
+
+For each sidebar section ("Executive Summary", "Data Analysis & Insights", "Southampton
+Analysis") the script run that first switches to the section is timed, followed by
+``--repeat`` warm reruns. This captures the whole main() script: HTML markdown blocks,
+Plotly figure serialisation and the section switch. The payload size is the serialised
+size of every element the run produced, broken down by element type. Results are
+written as JSON next to the function-level benchmarks.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+from collections import Counter
+from datetime import datetime
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, BENCHMARK_DIR)
+
+from run_benchmarks import DEFAULT_OUTPUT_DIR, REPO_ROOT, dashboard, prepare_workbook, working_directory
+
+import streamlit as st
+from streamlit.testing.v1 import AppTest
+
+SECTIONS = ["Executive Summary", "Data Analysis & Insights", "Southampton Analysis"]
+APP_PATH = os.path.join(REPO_ROOT, 'streamlit_dashboard.py')
+
+def iter_nodes(node):
+    yield node
+    for child in getattr(node, 'children', {}).values():
+        yield from iter_nodes(child)
+
+def measure_payload(app):
+    """Serialised bytes of every element and block in the rendered page, by element type"""
+    by_type = Counter()
+    for node in iter_nodes(app._tree):
+        proto = getattr(node, 'proto', None)
+        if proto is not None and hasattr(proto, 'ByteSize'):
+            by_type[getattr(node, 'type', type(node).__name__)] += proto.ByteSize()
+    return {'total_bytes': sum(by_type.values()), 'by_element_type': dict(by_type.most_common())}
+
+def timed_run(app, timeout):
+    start = time.perf_counter()
+    app.run(timeout=timeout)
+    elapsed = time.perf_counter() - start
+    errors = [str(e.value) for e in app.exception] + [str(e.value) for e in app.error]
+    return elapsed, errors
+
+def select_section(app, section):
+    for selectbox in app.sidebar.selectbox:
+        if section in selectbox.options:
+            selectbox.set_value(section)
+            return
+    raise ValueError(f"No sidebar selectbox offers section '{section}'")
+
+def run_render_benchmark(repeat, timeout):
+    app = AppTest.from_file(APP_PATH, default_timeout=timeout)
+    initial_seconds, errors = timed_run(app, timeout)
+    print(f"  🚀 initial load {initial_seconds:>27.3f}s")
+    results = {'initial_run_seconds': initial_seconds, 'initial_run_errors': errors, 'sections': []}
+
+    for section in SECTIONS:
+        select_section(app, section)
+        switch_seconds, errors = timed_run(app, timeout)
+        payload = measure_payload(app)
+
+        rerun_seconds = []
+        for _ in range(repeat):
+            elapsed, rerun_errors = timed_run(app, timeout)
+            rerun_seconds.append(elapsed)
+            errors += rerun_errors
+
+        results['sections'].append({
+            'section': section,
+            'switch_run_seconds': switch_seconds,
+            'rerun_seconds': {
+                'min': min(rerun_seconds) if rerun_seconds else None,
+                'median': statistics.median(rerun_seconds) if rerun_seconds else None,
+                'runs': rerun_seconds
+            },
+            'payload': payload,
+            'errors': errors
+        })
+        status = '❌' if errors else '✅'
+        print(f"  {status} {section:<28} switch {switch_seconds:>7.3f}s  "
+              f"rerun {results['sections'][-1]['rerun_seconds']['median'] or 0:>7.3f}s  "
+              f"{payload['total_bytes'] / 1024:>9.1f} KiB")
+    return results
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark full-page dashboard renders through AppTest')
+    parser.add_argument('--n-projects', type=int,
+                        help='Render a synthetic portfolio of this size instead of the bundled sample data')
+    parser.add_argument('--seed', type=int, default=42, help='Synthetic portfolio seed')
+    parser.add_argument('--repeat', type=int, default=3, help='Warm reruns per section')
+    parser.add_argument('--timeout', type=float, default=600, help='Per-run script timeout (seconds)')
+    parser.add_argument('--output', help='Results file (default: benchmarks/results/render-<timestamp>.json)')
+    args = parser.parse_args()
+
+    started = datetime.now()
+    with tempfile.TemporaryDirectory() as workdir:
+        # load_data() looks for the workbook in the working directory
+        if args.n_projects:
+            df, geo_df = dashboard.create_sample_data(n_projects=args.n_projects, seed=args.seed)
+            prepare_workbook(workdir, df, geo_df, xlsx_max_rows=0)
+            del df, geo_df
+        label = f"{args.n_projects:,} projects" if args.n_projects else 'sample data'
+        print(f"\n🖥️ Rendering dashboard with {label}")
+        with working_directory(workdir):
+            results = run_render_benchmark(args.repeat, args.timeout)
+
+    output = args.output or os.path.join(DEFAULT_OUTPUT_DIR, f"render-{started:%Y%m%d-%H%M%S}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, 'w') as f:
+        json.dump({
+            'started_at': started.isoformat(timespec='seconds'),
+            'streamlit': st.__version__,
+            'settings': {'n_projects': args.n_projects, 'seed': args.seed, 'repeat': args.repeat},
+            **results
+        }, f, indent=2)
+    print(f"\n💾 Results written to {output}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,314 @@
+"""
+NIHR Dashboard Benchmark Suite
+Times the dashboard's analytic functions against synthetic portfolios of increasing size
+
+Usage:
+    python benchmarks/run_benchmarks.py                       # 10k, 100k and 1M rows
+    python benchmarks/run_benchmarks.py --sizes 10000 50000 --repeat 5
+    python benchmarks/run_benchmarks.py --compare benchmarks/results/baseline.json
+
+Each benchmark is timed over ``--repeat`` cold runs (all Streamlit caches cleared between
+runs) and then run once more under tracemalloc for peak memory and the blocks and bytes
+still allocated when it returns, so memory tracing never inflates the timings. Results are
+written as JSON for run-over-run comparison; no browser, server or network access is needed.
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+from unittest import mock
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+from streamlit import config as st_config
+from streamlit import logger as st_logger
+
+# Parse Streamlit's config first so it cannot reset the level, then silence bare-mode warnings
+st_config.get_config_options()
+st_logger.set_log_level('error')
+
+import streamlit_dashboard as dashboard
+
+DEFAULT_SIZES = [10_000, 100_000, 1_000_000]
+DEFAULT_OUTPUT_DIR = os.path.join(REPO_ROOT, 'benchmarks', 'results')
+WORKBOOK_NAME = 'Funded_Portfolio_Data.xlsx'
+
+def clear_caches():
+    """Cold start for every run - nothing memoised by a previous run may be reused"""
+    st.cache_data.clear()
+    st.cache_resource.clear()
+
+@contextlib.contextmanager
+def working_directory(path):
+    previous = os.getcwd()
+    os.chdir(path)
+    try:
+        yield
+    finally:
+        os.chdir(previous)
+
+def prepare_workbook(directory, df, geo_df, xlsx_max_rows):
+    """Lay out a workbook for load_data() in ``directory``.
+
+    Up to ``xlsx_max_rows`` the portfolio is written as a real workbook, so the first load
+    parses Excel. Beyond that (openpyxl needs minutes per million rows) a placeholder
+    workbook is written and the columnar cache is seeded with the full portfolio, so
+    load_data() measures the warm, cache-hit path at scale.
+    """
+    file_path = os.path.join(directory, WORKBOOK_NAME)
+    seeded = len(df) > xlsx_max_rows
+    with pd.ExcelWriter(file_path) as writer:
+        (df.head(0) if seeded else df).to_excel(writer, sheet_name=dashboard.PORTFOLIO_SHEET, index=False)
+        geo_df.to_excel(writer, sheet_name=dashboard.GEO_SHEET, index=False)
+
+    if seeded:
+        stat = os.stat(file_path)
+        fingerprint = {
+            'cache_version': dashboard.WORKBOOK_CACHE_VERSION,
+            'size': stat.st_size,
+            'mtime_ns': stat.st_mtime_ns,
+            'sha256': dashboard._hash_file(file_path)
+        }
+        dashboard._write_workbook_cache(dashboard._workbook_cache_paths(file_path), df, geo_df, fingerprint)
+    return 'parquet-cache' if seeded else 'xlsx'
+
+def remove_workbook_cache(directory):
+    for path in dashboard._workbook_cache_paths(os.path.join(directory, WORKBOOK_NAME)).values():
+        if os.path.exists(path):
+            os.remove(path)
+
+def iter_frame_chunks(df, chunk_rows=dashboard.STREAM_CHUNK_ROWS):
+    """Row slices of an in-memory frame, standing in for iter_portfolio_chunks() on a file"""
+    for start in range(0, len(df), chunk_rows):
+        yield df.iloc[start:start + chunk_rows]
+
+def build_benchmarks(df, geo_df, workdir, load_mode):
+    """(name, setup, run) triples - setup output is passed to run and is not timed"""
+    def southampton():
+        clear_caches()
+        return dashboard.create_southampton_analysis(df, geo_df)
+
+    def success_inputs():
+        southampton_data = southampton()
+        return dashboard.calculate_success_metrics(df, southampton_data), southampton_data
+
+    def aggregate_inputs():
+        return southampton(), dashboard.build_portfolio_aggregates(df)['status_counts']
+
+    def success_from_aggregates(inputs):
+        # The incremental status tables must stand in for the per-group recount, not sit beside it
+        with mock.patch.object(dashboard, 'status_count_table', wraps=dashboard.status_count_table) as recount:
+            metrics = dashboard.calculate_success_metrics(df, *inputs)
+        if recount.called:
+            raise AssertionError(f"status_count_table ran {recount.call_count}x despite the aggregates")
+        return metrics
+
+    def previous_version():
+        # The same portfolio before its last 1% of awards were appended, already aggregated
+        previous_df = df.iloc[:len(df) * 99 // 100]
+        previous_cube = dashboard.build_constituency_cube(dashboard.build_geo_enriched_portfolio(previous_df, geo_df),
+                                                          dashboard.build_date_fields(previous_df))
+        return previous_df, dashboard.build_portfolio_aggregates(previous_df), previous_cube
+
+    def carry_forward(previous):
+        previous_df, previous_aggregates, previous_cube = previous
+        delta = dashboard.diff_portfolio(previous_aggregates, previous_df, df)
+        return (dashboard.update_portfolio_aggregates(previous_aggregates, delta),
+                dashboard.update_constituency_cube(previous_cube, delta, geo_df))
+
+    def ranked_cube():
+        cube = dashboard.get_constituency_cube(df, geo_df)
+        dashboard.cube_ranking(cube, 'funding')
+        return cube
+
+    def slice_rankings(cube):
+        # A cold filter slice, then the memoised lookup every later rerun gets
+        programmes = cube['axes']['programme'][:2].tolist()
+        for _ in range(2):
+            ranking = dashboard.cube_ranking(cube, 'funding', programmes=programmes, years=(2015, 2020))
+        return ranking['position'][ranking['order'][0]]
+
+    def filter_inputs():
+        # Index and cube are built once per dataset version, before any filter changes; the
+        # bitmaps themselves are materialised by the first filter, inside the timed run
+        index = dashboard.build_bitmap_index(df, geo_df)
+        cube = dashboard.build_constituency_cube(dashboard.build_geo_enriched_portfolio(df, geo_df),
+                                                 dashboard.build_date_fields(df))
+        filters = {'programmes': dashboard.filter_labels(index, 'programmes')[:2].tolist(), 'statuses': ['Active'],
+                   'years': (2015, 2020)}
+        return index, cube, filters
+
+    def apply_filters(inputs):
+        # The work a sidebar change triggers: row mask, KPI slice, both rankings and the filtered rows
+        index, cube, filters = inputs
+        mask = dashboard.filter_mask(index, filters)
+        kpis = dashboard.cube_slice(cube, **filters)
+        rankings = [dashboard.cube_ranking(cube, measure, **filters) for measure in ('projects', 'funding')]
+        return df[mask], kpis, rankings
+
+    def organisation_search(index):
+        # Token index and query bitmap on the first search, then the memoised lookup
+        for _ in range(2):
+            rows = dashboard.match_organisations(df, index, 'southampton')
+        return rows
+
+    def constituency_strategies(_):
+        # The batch is built (and persisted) on the first lookup; every later one is a dict read
+        for constituency in ('Southampton, Itchen', 'Southampton, Test'):
+            selected = dashboard.get_constituency_strategy(df, geo_df, constituency)
+        return selected
+
+    def load_setup():
+        if load_mode == 'xlsx':
+            remove_workbook_cache(workdir)  # Every run parses the workbook and rebuilds the cache
+        return None
+
+    def load(_):
+        with working_directory(workdir):
+            return dashboard.load_data()
+
+    return [
+        (f'load_data[{load_mode}]', load_setup, load),
+        ('assess_data_quality', lambda: None, lambda _: dashboard.assess_data_quality(df)),
+        ('assess_data_quality[streaming]', lambda: None,
+         lambda _: dashboard.assess_data_quality_streaming(iter_frame_chunks(df))),
+        ('build_portfolio_aggregates', lambda: None, lambda _: dashboard.build_portfolio_aggregates(df)),
+        ('carry_forward_aggregates[+1% appended]', previous_version, carry_forward),
+        ('create_geographical_distribution_chart', lambda: None,
+         lambda _: dashboard.create_geographical_distribution_chart(df, geo_df)),
+        ('create_southampton_analysis', lambda: None, lambda _: dashboard.create_southampton_analysis(df, geo_df)),
+        ('get_constituency_rankings', lambda: None, lambda _: dashboard.get_constituency_rankings(df, geo_df)),
+        ('cube_ranking[filtered slice]', ranked_cube, slice_rankings),
+        ('sidebar filter change', filter_inputs, apply_filters),
+        ('match_organisations[token index]', lambda: dashboard.build_bitmap_index(df), organisation_search),
+        ('calculate_success_metrics', southampton,
+         lambda southampton_data: dashboard.calculate_success_metrics(df, southampton_data)),
+        ('calculate_success_metrics[status aggregates]', aggregate_inputs, success_from_aggregates),
+        ('generate_mp_strategy', success_inputs,
+         lambda inputs: dashboard.generate_mp_strategy(*inputs)),
+        ('get_constituency_strategy[batch]', lambda: None, constituency_strategies),
+    ]
+
+def measure(setup, run, repeat):
+    """Wall times of ``repeat`` cold runs plus one tracemalloc run for memory"""
+    timings = []
+    for _ in range(repeat):
+        state = setup()
+        clear_caches()
+        start = time.perf_counter()
+        run(state)
+        timings.append(time.perf_counter() - start)
+
+    state = setup()
+    clear_caches()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    tracemalloc.reset_peak()
+    run(state)
+    _, peak = tracemalloc.get_traced_memory()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    allocations = after.compare_to(before, 'filename')
+    return {
+        'wall_seconds': {
+            'min': min(timings),
+            'median': statistics.median(timings),
+            'max': max(timings),
+            'runs': timings
+        },
+        'peak_memory_bytes': peak,
+        'net_allocated_blocks': sum(stat.count_diff for stat in allocations if stat.count_diff > 0),
+        'net_allocated_bytes': sum(stat.size_diff for stat in allocations if stat.size_diff > 0)
+    }
+
+def run_suite(sizes, repeat, seed, xlsx_max_rows, only=None):
+    results = []
+    for n_projects in sizes:
+        print(f"\n📊 {n_projects:,} projects")
+        # The analytics run on the compact frames load_data() hands to the dashboard
+        df, geo_df = dashboard.normalise_portfolio(*dashboard.create_sample_data(n_projects=n_projects, seed=seed))
+
+        with tempfile.TemporaryDirectory() as workdir:
+            load_mode = prepare_workbook(workdir, df, geo_df, xlsx_max_rows)
+            for name, setup, run in build_benchmarks(df, geo_df, workdir, load_mode):
+                if only and not any(pattern in name for pattern in only):
+                    continue
+                try:
+                    result = measure(setup, run, repeat)
+                    result.update({'benchmark': name, 'n_projects': n_projects, 'status': 'ok'})
+                    print(f"  ✅ {name:<45} {result['wall_seconds']['median']:>9.3f}s "
+                          f"{result['peak_memory_bytes'] / 1e6:>10.1f} MB peak")
+                except Exception as e:
+                    tracemalloc.stop()
+                    result = {'benchmark': name, 'n_projects': n_projects, 'status': 'error', 'error': str(e)}
+                    print(f"  ❌ {name:<45} {e}")
+                results.append(result)
+    return results
+
+def compare_results(results, baseline_path):
+    """Print the median wall-time ratio of each benchmark against a previous results file"""
+    with open(baseline_path) as f:
+        baseline = {
+            (r['benchmark'], r['n_projects']): r for r in json.load(f)['results'] if r['status'] == 'ok'
+        }
+    print(f"\n📈 Compared with {baseline_path} (ratio > 1 is slower)")
+    for result in results:
+        previous = baseline.get((result['benchmark'], result['n_projects']))
+        if result['status'] != 'ok' or previous is None:
+            continue
+        ratio = result['wall_seconds']['median'] / previous['wall_seconds']['median']
+        memory_ratio = result['peak_memory_bytes'] / max(previous['peak_memory_bytes'], 1)
+        flag = '⚠️ ' if ratio > 1.2 else '  '
+        print(f"{flag}{result['benchmark']:<45} {result['n_projects']:>10,}  time x{ratio:.2f}  memory x{memory_ratio:.2f}")
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the NIHR dashboard analytics on synthetic portfolios')
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES, help='Portfolio sizes (rows)')
+    parser.add_argument('--repeat', type=int, default=3, help='Timed runs per benchmark')
+    parser.add_argument('--seed', type=int, default=42, help='Synthetic portfolio seed')
+    parser.add_argument('--xlsx-max-rows', type=int, default=100_000,
+                        help='Largest portfolio written as a real workbook; larger ones load from a seeded cache')
+    parser.add_argument('--only', nargs='+', help='Run benchmarks whose name contains any of these strings')
+    parser.add_argument('--output', help='Results file (default: benchmarks/results/benchmark-<timestamp>.json)')
+    parser.add_argument('--compare', help='Previous results file to compare against')
+    args = parser.parse_args()
+
+    started = datetime.now()
+    results = run_suite(args.sizes, args.repeat, args.seed, args.xlsx_max_rows, args.only)
+
+    output = args.output or os.path.join(DEFAULT_OUTPUT_DIR, f"benchmark-{started:%Y%m%d-%H%M%S}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, 'w') as f:
+        json.dump({
+            'started_at': started.isoformat(timespec='seconds'),
+            'environment': {
+                'python': platform.python_version(),
+                'platform': platform.platform(),
+                'pandas': pd.__version__,
+                'numpy': np.__version__,
+                'streamlit': st.__version__
+            },
+            'settings': {'sizes': args.sizes, 'repeat': args.repeat, 'seed': args.seed,
+                         'xlsx_max_rows': args.xlsx_max_rows},
+            'results': results
+        }, f, indent=2)
+    print(f"\n💾 Results written to {output}")
+
+    if args.compare:
+        compare_results(results, args.compare)
+
+if __name__ == '__main__':
+    main()
@@ -17,9 +17,20 @@ from plotly.subplots import make_subplots
 import warnings
 from datetime import datetime, timedelta
 import re
+import os
+import json
+import hashlib
+import inspect
+import functools
+import itertools
+import logging
+from collections import deque
 from difflib import SequenceMatcher
 from scipy import stats
+from scipy.sparse import coo_matrix, csr_matrix
+from scipy.sparse.csgraph import connected_components
 import base64
+import bisect
 import io
 import time
 from PIL import Image
@@ -505,6 +516,347 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
+# Performance instrumentation - named timing spans around loading, joins, metrics and charts.
+# Off unless NIHR_DASHBOARD_TIMING is set: @timed then returns functions unchanged and
+# timing_span() hands back a shared no-op, so normal reruns pay nothing for it.
+TIMING_ENABLED = os.environ.get('NIHR_DASHBOARD_TIMING', '').lower() in ('1', 'true', 'yes', 'on')
+TIMING_HISTORY = 500
+timing_log = logging.getLogger('nihr_dashboard.timing')
+debug_log = logging.getLogger('nihr_dashboard')
+
+if TIMING_ENABLED and not timing_log.handlers:
+    # One JSON object per line on stderr, e.g. {"span": "quality.assess", "duration_ms": 41.2, "rows": 10000, ...}
+    _timing_handler = logging.StreamHandler()
+    _timing_handler.setFormatter(logging.Formatter('%(message)s'))
+    timing_log.addHandler(_timing_handler)
+    timing_log.setLevel(logging.INFO)
+    timing_log.propagate = False
+
+@st.cache_resource(show_spinner=False)
+def _timing_store():
+    """Recent spans, shared by every rerun and session of this server process"""
+    return deque(maxlen=TIMING_HISTORY)
+
+def _row_count(value):
+    """Rows in a DataFrame/Series, or in the first one of a (df, geo_df) style tuple"""
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        return len(value)
+    if isinstance(value, tuple):
+        return next((len(item) for item in value if isinstance(item, (pd.DataFrame, pd.Series))), None)
+    return None
+
+def record_span(name, seconds, rows=None, **fields):
+    """Store a finished span and emit it as a structured log line"""
+    span = {
+        'span': name,
+        'duration_ms': round(seconds * 1000, 3),
+        'rows': rows,
+        'recorded_at': datetime.now().isoformat(timespec='milliseconds'),
+        **fields
+    }
+    _timing_store().append(span)
+    timing_log.info(json.dumps(span, default=str))
+    return span
+
+class _TimingSpan:
+    """Times a ``with`` block; call note() inside it to attach row counts or other fields"""
+    __slots__ = ('name', 'rows', 'fields', '_start')
+
+    def __init__(self, name, rows=None, **fields):
+        self.name, self.rows, self.fields = name, rows, fields
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is not None:
+            self.fields['error'] = exc_type.__name__
+        record_span(self.name, time.perf_counter() - self._start, self.rows, **self.fields)
+        return False
+
+    def note(self, rows=None, **fields):
+        if rows is not None:
+            self.rows = rows
+        self.fields.update(fields)
+
+class _NullSpan:
+    """Stand-in returned while timing is disabled"""
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+    def note(self, rows=None, **fields):
+        pass
+
+_NULL_SPAN = _NullSpan()
+
+def timing_span(name, rows=None, **fields):
+    """Context manager recording a named span (a no-op unless timing is enabled)"""
+    if not TIMING_ENABLED:
+        return _NULL_SPAN
+    return _TimingSpan(name, rows, **fields)
+
+def timed(name):
+    """Decorator recording a span per call, sized by the first DataFrame argument"""
+    def decorator(func):
+        if not TIMING_ENABLED:
+            return func
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            rows = next((count for count in map(_row_count, args) if count is not None), None)
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                record_span(name, time.perf_counter() - start, rows)
+        return wrapper
+    return decorator
+
+def get_timing_spans():
+    return list(_timing_store())
+
+def clear_timing_spans():
+    _timing_store().clear()
+
+def summarise_timing_spans(spans):
+    """Per-span call count and duration totals, slowest first"""
+    frame = pd.DataFrame(spans).astype({'rows': 'Int64'})
+    summary = frame.groupby('span', sort=False).agg(
+        calls=('duration_ms', 'size'),
+        total_ms=('duration_ms', 'sum'),
+        mean_ms=('duration_ms', 'mean'),
+        max_ms=('duration_ms', 'max'),
+        last_rows=('rows', 'last')
+    )
+    return summary.sort_values('total_ms', ascending=False).round(1)
+
+def display_timing_panel():
+    """Optional sidebar admin panel with the recorded spans"""
+    if not TIMING_ENABLED:
+        return
+
+    with st.sidebar.expander("⏱️ Performance Timing"):
+        if st.button("Clear timings", key="clear_timing_spans"):
+            clear_timing_spans()
+
+        spans = get_timing_spans()
+        if not spans:
+            st.caption("No spans recorded yet - cached results skip the instrumented code")
+            return
+
+        st.caption(f"Last {len(spans)} spans (cache hits are not recorded)")
+        st.dataframe(summarise_timing_spans(spans), use_container_width=True)
+        st.dataframe(pd.DataFrame(spans[-25:][::-1]), use_container_width=True, hide_index=True)
+        st.download_button(
+            "Download spans (JSON lines)",
+            data='\n'.join(json.dumps(span, default=str) for span in spans),
+            file_name='timing_spans.jsonl',
+            mime='application/json'
+        )
+
+# Workbook sheets and the columnar cache that sits next to the workbook
+PORTFOLIO_SHEET = 'Funded Portfolio'
+GEO_SHEET = 'Geographical Lookups'
+WORKBOOK_CACHE_VERSION = 1
+
+def _workbook_cache_paths(file_path):
+    """Return the Parquet cache and manifest paths for a workbook"""
+    base, _ = os.path.splitext(file_path)
+    return {
+        'portfolio': f'{base}.portfolio.parquet',
+        'geo': f'{base}.geo.parquet',
+        'manifest': f'{base}.cache.json'
+    }
+
+def _hash_file(file_path, block_size=1 << 20):
+    """SHA-256 of the workbook contents, read in 1MB blocks"""
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as handle:
+        for block in iter(lambda: handle.read(block_size), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+def _read_cache_manifest(cache_paths):
+    """Read the cache manifest, returning None if it is missing or unreadable"""
+    try:
+        with open(cache_paths['manifest'], 'r', encoding='utf-8') as handle:
+            manifest = json.load(handle)
+    except (OSError, ValueError):
+        return None
+
+    if manifest.get('cache_version') != WORKBOOK_CACHE_VERSION:
+        return None
+    if not (os.path.exists(cache_paths['portfolio']) and os.path.exists(cache_paths['geo'])):
+        return None
+    return manifest
+
+def _write_json(path, payload):
+    with open(path, 'w', encoding='utf-8') as handle:
+        json.dump(payload, handle)
+
+def _atomic_write(cache_path, writer):
+    """Write to a temporary file and swap it in so other processes never see a partial cache"""
+    tmp_path = f'{cache_path}.tmp-{os.getpid()}'
+    try:
+        writer(tmp_path)
+        os.replace(tmp_path, cache_path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+def _prepare_for_parquet(frame):
+    """Store mixed-type object columns (e.g. numeric and text IDs) as text so Arrow can write them"""
+    frame = frame.copy()
+    for col in frame.columns:
+        if frame[col].dtype == 'object':
+            inferred = pd.api.types.infer_dtype(frame[col], skipna=True)
+            if inferred.startswith('mixed'):
+                frame[col] = frame[col].where(frame[col].isna(), frame[col].astype(str)).infer_objects()
+    return frame
+
+def _write_workbook_cache(cache_paths, df, geo_df, fingerprint):
+    """Persist both sheets in columnar form; caching is best-effort and never blocks loading"""
+    try:
+        _atomic_write(cache_paths['portfolio'], lambda path: df.to_parquet(path, index=False))
+        _atomic_write(cache_paths['geo'], lambda path: geo_df.to_parquet(path, index=False))
+        _atomic_write(cache_paths['manifest'], lambda path: _write_json(path, fingerprint))
+    except Exception:
+        # No Parquet engine (pyarrow) or an unwritable directory - keep reading the workbook directly
+        return False
+    return True
+
+@timed('load.workbook')
+def _read_workbook(file_path):
+    """Read both sheets of the portfolio workbook, using the columnar cache when it is current.
+
+    The cache is keyed on the workbook's size, modification time and SHA-256 content hash:
+    an unchanged size and mtime reuses the cache directly, a touched-but-identical file is
+    re-validated by hash, and any real change triggers a fresh parse and cache rebuild.
+    """
+    cache_paths = _workbook_cache_paths(file_path)
+    stat = os.stat(file_path)
+    manifest = _read_cache_manifest(cache_paths)
+
+    fingerprint = {
+        'cache_version': WORKBOOK_CACHE_VERSION,
+        'size': stat.st_size,
+        'mtime_ns': stat.st_mtime_ns
+    }
+
+    if manifest and manifest['size'] == stat.st_size and manifest['mtime_ns'] == stat.st_mtime_ns:
+        content_hash = manifest['sha256']
+    else:
+        content_hash = _hash_file(file_path)
+    fingerprint['sha256'] = content_hash
+
+    if manifest and manifest['size'] == stat.st_size and manifest['sha256'] == content_hash:
+        try:
+            df = pd.read_parquet(cache_paths['portfolio'])
+            geo_df = pd.read_parquet(cache_paths['geo'])
+            if manifest['mtime_ns'] != stat.st_mtime_ns:
+                # Same contents, new timestamp - refresh the manifest so the next load skips hashing
+                _atomic_write(cache_paths['manifest'], lambda path: _write_json(path, fingerprint))
+            return _tag_dataset_version(df, geo_df, content_hash)
+        except Exception:
+            pass  # Unreadable cache - fall back to parsing the workbook and rebuilding it
+
+    # Load the main dataset
+    df = pd.read_excel(file_path, sheet_name=PORTFOLIO_SHEET)
+    geo_df = pd.read_excel(file_path, sheet_name=GEO_SHEET)
+
+    # Clean column names
+    df.columns = df.columns.str.strip()
+    geo_df.columns = geo_df.columns.str.strip()
+
+    # Cached and freshly parsed loads must return identical frames
+    df = _prepare_for_parquet(df)
+    geo_df = _prepare_for_parquet(geo_df)
+    _write_workbook_cache(cache_paths, df, geo_df, fingerprint)
+
+    return _tag_dataset_version(df, geo_df, content_hash)
+
+# Low-cardinality text columns stored as categoricals once the portfolio is loaded
+CATEGORY_COLUMNS = [
+    'Programme', 'Project_Status', 'Lead_Organisation', 'Postcode', 'English Region',
+    'Devolved Administration', 'Parliamentary Constituency'
+]
+MAX_CATEGORY_RATIO = 0.5  # Other text columns qualify when distinct values are at most half the rows
+
+def _parse_date_column(series):
+    """Parsed datetimes, or None if any real (non-placeholder) value fails to parse"""
+    parsed = pd.to_datetime(series, errors='coerce')
+    unparsed = parsed.isna() & series.notna()
+    if unparsed.any():
+        leftovers = series[unparsed].astype(str).str.strip()
+        if not leftovers.isin(MISSING_VALUE_PATTERNS).all():
+            return None
+    return parsed
+
+def compact_dtypes(frame, category_columns=CATEGORY_COLUMNS, max_category_ratio=MAX_CATEGORY_RATIO):
+    """Schema-aware dtype normalisation: categoricals, downcast integers and parsed dates.
+
+    Text date columns are parsed once here so consumers get datetimes; a column is left as
+    text if any value other than a missing-value placeholder fails to parse. Floats are kept
+    at 64-bit so award totals are unchanged. Returns the compact frame and a report of the
+    conversions and memory saved.
+    """
+    before = frame.memory_usage(deep=True)
+    compact = frame.copy()
+    conversions = {}
+    for col in compact.columns:
+        series = compact[col]
+        if isinstance(series.dtype, pd.CategoricalDtype) or pd.api.types.is_datetime64_any_dtype(series.dtype):
+            continue
+        is_text = pd.api.types.is_object_dtype(series.dtype) or pd.api.types.is_string_dtype(series.dtype)
+
+        if is_text and 'date' in col.lower():
+            parsed = _parse_date_column(series)
+            if parsed is not None:
+                compact[col] = parsed
+                conversions[col] = 'datetime'
+        elif is_text:
+            if col in category_columns or series.nunique() <= max_category_ratio * len(series):
+                compact[col] = series.astype('category')
+                conversions[col] = 'category'
+        elif pd.api.types.is_integer_dtype(series.dtype) and not pd.api.types.is_extension_array_dtype(series.dtype):
+            downcast = pd.to_numeric(series, downcast='integer')
+            if downcast.dtype != series.dtype:
+                compact[col] = downcast
+                conversions[col] = str(downcast.dtype)
+
+    after = compact.memory_usage(deep=True)
+    report = {
+        'before_bytes': int(before.sum()),
+        'after_bytes': int(after.sum()),
+        'saved_bytes': int(before.sum() - after.sum()),
+        'conversions': conversions
+    }
+    return compact, report
+
+def normalise_portfolio(df, geo_df):
+    """Compact both sheets once at load time; every downstream function sees the compact frames.
+
+    The combined memory report is kept in ``df.attrs['dtype_report']``.
+    """
+    df, portfolio_report = compact_dtypes(df)
+    geo_df, geo_report = compact_dtypes(geo_df)
+    before = portfolio_report['before_bytes'] + geo_report['before_bytes']
+    after = portfolio_report['after_bytes'] + geo_report['after_bytes']
+    df.attrs['dtype_report'] = {
+        'before_bytes': before,
+        'after_bytes': after,
+        'saved_bytes': before - after,
+        'saved_percentage': (before - after) / before * 100 if before else 0.0,
+        'conversions': {'portfolio': portfolio_report['conversions'], 'geo': geo_report['conversions']}
+    }
+    return df, geo_df
+
 @st.cache_data
 def load_data():
     """Load and prepare the NIHR dataset"""
@@ -519,21 +871,15 @@ def load_data():
         for file_path in file_paths:
             try:
                 # Check if file exists and is accessible
-                import os
                 if not os.path.exists(file_path):
                     continue
                 
                 # Try to access the file with better error handling
                 try:
-                    # Load the main dataset
-                    df = pd.read_excel(file_path, sheet_name='Funded Portfolio')
-                    geo_df = pd.read_excel(file_path, sheet_name='Geographical Lookups')
-                    
-                    # Clean column names
-                    df.columns = df.columns.str.strip()
-                    geo_df.columns = geo_df.columns.str.strip()
+                    # Load both sheets (from the columnar cache when the workbook is unchanged)
+                    df, geo_df = _read_workbook(file_path)
                     
-                    return df, geo_df
+                    return normalise_portfolio(df, geo_df)
                     
                 except PermissionError:
                     st.warning(f"⚠️ File is locked or in use: {file_path}. Please close Excel and try again.")
@@ -548,165 +894,741 @@ def load_data():
         
         # If no file found, show info and use sample data
         st.info("Using sample data for demonstration (real data file not found)")
-        return create_sample_data()
+        return normalise_portfolio(*create_sample_data())
     except Exception as e:
         st.error(f"Error loading data: {str(e)}")
         # Return sample data for demonstration
-        return create_sample_data()
+        return normalise_portfolio(*create_sample_data())
+
+# Default distributions for the synthetic portfolio (match the original demo data)
+SAMPLE_PROGRAMME_WEIGHTS = {
+    'Research for Patient Benefit': 0.3, 'Health Technology Assessment': 0.2,
+    'Public Health Research': 0.2, 'Health Services Research': 0.2, 'Training': 0.1
+}
+SAMPLE_STATUS_WEIGHTS = {'Active': 0.3, 'Completed': 0.7}
+SAMPLE_ORGANISATION_WEIGHTS = {
+    'University of Southampton': 0.4, 'University of Oxford': 0.2,
+    'Imperial College London': 0.2, 'King\'s College London': 0.2
+}
+
+# Postcode areas with their home town and English region / devolved nation
+SAMPLE_POSTCODE_AREAS = [
+    ('SO', 'Southampton', 'South East'), ('PO', 'Portsmouth', 'South East'), ('BN', 'Brighton', 'South East'),
+    ('OX', 'Oxford', 'South East'), ('RG', 'Reading', 'South East'), ('GU', 'Guildford', 'South East'),
+    ('ME', 'Medway', 'South East'), ('CT', 'Canterbury', 'South East'), ('MK', 'Milton Keynes', 'South East'),
+    ('E', 'East London', 'London'), ('N', 'North London', 'London'), ('SE', 'South East London', 'London'),
+    ('SW', 'South West London', 'London'), ('W', 'West London', 'London'), ('NW', 'North West London', 'London'),
+    ('M', 'Manchester', 'North West'), ('L', 'Liverpool', 'North West'), ('PR', 'Preston', 'North West'),
+    ('BL', 'Bolton', 'North West'), ('CH', 'Chester', 'North West'), ('LA', 'Lancaster', 'North West'),
+    ('B', 'Birmingham', 'West Midlands'), ('CV', 'Coventry', 'West Midlands'), ('WV', 'Wolverhampton', 'West Midlands'),
+    ('ST', 'Stoke-on-Trent', 'West Midlands'), ('WR', 'Worcester', 'West Midlands'),
+    ('LS', 'Leeds', 'Yorkshire and The Humber'), ('S', 'Sheffield', 'Yorkshire and The Humber'),
+    ('BD', 'Bradford', 'Yorkshire and The Humber'), ('HU', 'Hull', 'Yorkshire and The Humber'),
+    ('YO', 'York', 'Yorkshire and The Humber'),
+    ('NG', 'Nottingham', 'East Midlands'), ('LE', 'Leicester', 'East Midlands'), ('DE', 'Derby', 'East Midlands'),
+    ('LN', 'Lincoln', 'East Midlands'), ('NN', 'Northampton', 'East Midlands'),
+    ('NR', 'Norwich', 'East of England'), ('CB', 'Cambridge', 'East of England'), ('IP', 'Ipswich', 'East of England'),
+    ('CO', 'Colchester', 'East of England'), ('LU', 'Luton', 'East of England'),
+    ('BS', 'Bristol', 'South West'), ('PL', 'Plymouth', 'South West'), ('EX', 'Exeter', 'South West'),
+    ('BA', 'Bath', 'South West'), ('GL', 'Gloucester', 'South West'),
+    ('NE', 'Newcastle', 'North East'), ('SR', 'Sunderland', 'North East'), ('DH', 'Durham', 'North East'),
+    ('TS', 'Middlesbrough', 'North East'),
+    ('CF', 'Cardiff', 'Wales'), ('SA', 'Swansea', 'Wales'), ('LL', 'Llandudno', 'Wales'),
+    ('EH', 'Edinburgh', 'Scotland'), ('G', 'Glasgow', 'Scotland'), ('AB', 'Aberdeen', 'Scotland'),
+    ('DD', 'Dundee', 'Scotland'),
+    ('BT', 'Belfast', 'Northern Ireland')
+]
+DEVOLVED_REGIONS = {'Wales': 'Wales', 'Scotland': 'Scotland', 'Northern Ireland': 'Northern Ireland'}
+
+# Ways a title gets re-keyed by hand: case, stray punctuation and spacing, US spellings
+TITLE_VARIANTS = [
+    lambda titles: titles.str.upper(),
+    lambda titles: titles.str.lower() + '.',
+    lambda titles: titles.str.replace(' of ', '  of ', regex=False).str.replace('-', ' ', regex=False),
+    lambda titles: titles.str.replace('ise', 'ize', regex=False).str.replace('programme', 'program', regex=False)
+                         .str.replace('behavioural', 'behavioral', regex=False).str.replace('Economic', 'Cost', regex=False),
+]
+
+def _format_codes(prefix, numbers, width):
+    """Zero-padded identifiers ('PROJ_00042') built with array arithmetic instead of f-strings"""
+    numbers = np.asarray(numbers, dtype=np.int64)
+    width = max(width, len(str(int(numbers.max()))) if len(numbers) else width)
+    digits = (numbers[:, None] // (10 ** np.arange(width - 1, -1, -1))) % 10 + ord('0')
+    prefix_bytes = np.frombuffer(prefix.encode(), dtype=np.uint8)
+    raw = np.hstack([np.broadcast_to(prefix_bytes, (len(numbers), len(prefix_bytes))), digits.astype(np.uint8)])
+    return np.ascontiguousarray(raw).view(f'S{raw.shape[1]}').ravel().astype(str).astype(object)
+
+def _weighted_choice(rng, weights, size):
+    """Draw category labels from a {label: weight} mapping"""
+    labels = np.array(list(weights), dtype=object)
+    probabilities = np.array(list(weights.values()), dtype=float)
+    return labels[rng.choice(len(labels), size=size, p=probabilities / probabilities.sum())]
+
+def generate_synthetic_geography(n_constituencies=650, districts_per_constituency=3, postcodes_per_district=12, seed=42):
+    """Synthetic 'Geographical Lookups' sheet covering many constituencies.
+
+    Constituencies are spread across real postcode areas; the first two are always
+    Southampton, Test and Southampton, Itchen in the SO area, so every dashboard path
+    has its target constituency.
+    """
+    rng = np.random.default_rng(seed)
+    areas = pd.DataFrame(SAMPLE_POSTCODE_AREAS, columns=['area', 'town', 'region'])
+
+    # Southampton first, then constituencies spread over the remaining areas
+    area_ids = np.concatenate([[0, 0], rng.integers(0, len(areas), max(n_constituencies - 2, 0))])[:n_constituencies]
+    area_ids = np.sort(area_ids, kind='stable')
+    seat_numbers = pd.Series(area_ids).groupby(area_ids).cumcount().to_numpy()
+    towns = areas['town'].to_numpy()[area_ids]
+    compass = np.array(['Central', 'North', 'South', 'East', 'West'], dtype=object)
+    constituencies = towns + ' ' + compass[seat_numbers % len(compass)]
+    repeat_suffix = np.where(seat_numbers >= len(compass), ' ' + (seat_numbers // len(compass) + 1).astype(str), '')
+    constituencies = (constituencies + repeat_suffix).astype(object)
+    southampton = area_ids == 0
+    constituencies[np.flatnonzero(southampton)[:2]] = ['Southampton, Test', 'Southampton, Itchen'][:southampton.sum()]
+
+    # Outward districts numbered within each area (SO14, SO15, ...), then inward codes per district
+    district_constituency = np.repeat(np.arange(n_constituencies), districts_per_constituency)
+    district_area = area_ids[district_constituency]
+    district_numbers = pd.Series(district_area).groupby(district_area).cumcount().to_numpy() + 14
+    outward = areas['area'].to_numpy()[district_area] + district_numbers.astype(str)
+
+    postcode_district = np.repeat(np.arange(len(outward)), postcodes_per_district)
+    inward_ids = np.tile(np.arange(postcodes_per_district), len(outward))
+    letters = np.array(list('ABDEFGHJLNPQRSTUWXYZ'), dtype=object)
+    inward = (
+        (inward_ids % 9 + 1).astype(str).astype(object)
+        + letters[(inward_ids // 9) % len(letters)]
+        + letters[rng.integers(0, len(letters), len(inward_ids))]
+    )
+
+    postcode_constituency = district_constituency[postcode_district]
+    regions = areas['region'].to_numpy()[area_ids[postcode_constituency]]
+    geo_df = pd.DataFrame({
+        'Postcodes': outward[postcode_district] + ' ' + inward,
+        'Parliamentary Constituency': constituencies[postcode_constituency],
+        'English Region': np.where(np.isin(regions, list(DEVOLVED_REGIONS)), None, regions),
+        'Devolved Administration': pd.Series(regions).map(DEVOLVED_REGIONS).fillna('England').to_numpy()
+    })
+    return geo_df.drop_duplicates('Postcodes', ignore_index=True)
+
+def generate_synthetic_portfolio(n_projects=10000, seed=42, programme_weights=None, status_weights=None,
+                                 organisation_weights=None, n_organisations=None, geo_df=None,
+                                 n_constituencies=650, missing_rate=0.05, zero_award_rate=0.02,
+                                 near_duplicate_rate=0.02):
+    """Vectorised synthetic NIHR portfolio for demos and load testing (about 2s per million rows).
+
+    Programme, status and lead organisation follow the given {label: weight} distributions;
+    ``n_organisations`` instead draws from a Zipf-like long tail of synthetic institutions.
+    Project postcodes are drawn from ``geo_df`` (generated with ``n_constituencies`` if not
+    supplied) with uneven constituency popularity, and regions follow the postcode.
+    ``near_duplicate_rate`` of titles are re-keyed variants (case, punctuation, spelling).
+    The same seed always produces the same portfolio.
+
+    Returns (df, geo_df) like load_data().
+    """
+    rng = np.random.default_rng(seed)
+    if geo_df is None:
+        geo_df = generate_synthetic_geography(n_constituencies=n_constituencies, seed=seed)
+
+    if n_organisations:
+        ranks = np.arange(1, n_organisations + 1)
+        organisation_names = [f'{kind} {i}' for i, kind in zip(ranks, np.resize(['University', 'NHS Foundation Trust', 'Research Institute'], n_organisations))]
+        organisation_weights = dict(zip(organisation_names, 1.0 / ranks))
+        organisation_weights['University of Southampton'] = 1.0
+    organisation_weights = organisation_weights or SAMPLE_ORGANISATION_WEIGHTS
+
+    # Uneven constituency popularity: a few research hubs hold most of the projects
+    constituency_codes, constituency_names = pd.factorize(geo_df['Parliamentary Constituency'])
+    popularity = rng.lognormal(0, 1.2, len(constituency_names))
+    postcode_order = np.argsort(constituency_codes, kind='stable')
+    postcodes_per_constituency = np.bincount(constituency_codes, minlength=len(constituency_names))
+    first_postcode = np.concatenate([[0], np.cumsum(postcodes_per_constituency)[:-1]])
+    project_constituency = rng.choice(len(constituency_names), size=n_projects, p=popularity / popularity.sum())
+    geo_rows = postcode_order[first_postcode[project_constituency] + (rng.random(n_projects) * postcodes_per_constituency[project_constituency]).astype(np.int64)]
+
+    # Project titles from a design x intervention x condition vocabulary - realistic repeats
+    designs = np.array(['Randomised trial', 'Feasibility study', 'Cohort study', 'Evaluation', 'Systematic review',
+                        'Pilot study', 'Mixed-methods study', 'Economic evaluation', 'Implementation study', 'Qualitative study'], dtype=object)
+    interventions = np.array(['digital self-management', 'physiotherapy', 'group exercise', 'pharmacist-led review', 'telehealth monitoring',
+                              'early intervention', 'community outreach', 'nurse-led care', 'school-based programme', 'text message reminders',
+                              'cognitive behavioural therapy', 'surgical repair', 'vaccination uptake', 'dietary support', 'home visits'], dtype=object)
+    conditions = np.array(['type 2 diabetes', 'COPD', 'chronic pain', 'dementia', 'depression', 'heart failure', 'stroke recovery',
+                           'childhood asthma', 'obesity', 'hip fracture', 'sepsis', 'anxiety', 'osteoarthritis', 'long COVID',
+                           'multiple sclerosis', 'frailty', 'psoriasis', 'epilepsy', 'kidney disease', 'breast cancer'], dtype=object)
+    title_ids = rng.integers(0, len(designs) * len(interventions) * len(conditions), n_projects)
+    unique_title_ids, title_rows = np.unique(title_ids, return_inverse=True)
+    unique_titles = (
+        designs[unique_title_ids // (len(interventions) * len(conditions))] + ' of '
+        + interventions[(unique_title_ids // len(conditions)) % len(interventions)] + ' for '
+        + conditions[unique_title_ids % len(conditions)]
+    )
+
+    first_day, last_day = np.datetime64('2011-04-01'), np.datetime64('2024-12-31')
+    start_days = first_day + rng.integers(0, (last_day - first_day).astype(int) + 1, n_projects)
+    start_dates = start_days.astype('datetime64[ns]')
+    end_dates = (start_days + rng.integers(365, 5 * 365, n_projects)).astype('datetime64[ns]')
 
-def create_sample_data():
-    """Create sample data for demonstration purposes"""
-    np.random.seed(42)
-    n_projects = 10000
-    
-    # Create sample funded portfolio data
     df = pd.DataFrame({
-        'Project_ID': [f'PROJ_{i:05d}' for i in range(n_projects)],
-        'Project_Title': [f'Research Project {i}' for i in range(n_projects)],
-        'Programme': np.random.choice(['Research for Patient Benefit', 'Health Technology Assessment', 
-                                          'Public Health Research', 'Health Services Research', 'Training'], 
-                                         n_projects, p=[0.3, 0.2, 0.2, 0.2, 0.1]),
-        'Project_Status': np.random.choice(['Active', 'Completed'], n_projects, p=[0.3, 0.7]),
-        'Award_Amount': np.random.lognormal(13, 1, n_projects),
-        'Start_Date': pd.date_range('2011-04-01', '2024-12-31', periods=n_projects),
-        'End_Date': pd.date_range('2012-04-01', '2027-12-31', periods=n_projects),
-        'Lead_Organisation': np.random.choice(['University of Southampton', 'University of Oxford', 
-                                            'Imperial College London', 'King\'s College London'], 
-                                           n_projects, p=[0.4, 0.2, 0.2, 0.2]),
-        'Postcode': [f'SO{np.random.randint(10,99)} {np.random.randint(1,9)}{chr(np.random.randint(65,91))}{chr(np.random.randint(65,91))}' 
-                    for _ in range(n_projects)]
+        'Project_ID': _format_codes('PROJ_', np.arange(n_projects), 5),
+        'Project_Title': unique_titles[title_rows.ravel()],
+        'Programme': _weighted_choice(rng, programme_weights or SAMPLE_PROGRAMME_WEIGHTS, n_projects),
+        'Project_Status': _weighted_choice(rng, status_weights or SAMPLE_STATUS_WEIGHTS, n_projects),
+        'Award_Amount': rng.lognormal(13, 1, n_projects),
+        'Start_Date': start_dates,
+        'End_Date': end_dates,
+        'Lead_Organisation': _weighted_choice(rng, organisation_weights, n_projects),
+        'Postcode': geo_df['Postcodes'].to_numpy()[geo_rows],
+        'English Region': geo_df['English Region'].to_numpy()[geo_rows],
+        'Devolved Administration': geo_df['Devolved Administration'].to_numpy()[geo_rows]
     })
-    
+
     # Add some missing values and data quality issues
-    missing_indices = np.random.choice(n_projects, size=int(n_projects * 0.05), replace=False)
+    missing_indices = rng.choice(n_projects, size=int(n_projects * missing_rate), replace=False)
     df.loc[missing_indices[:len(missing_indices)//2], 'Award_Amount'] = np.nan
     df.loc[missing_indices[len(missing_indices)//2:], 'Postcode'] = 'N/A'
-    
+
     # Add some zero values
-    zero_indices = np.random.choice(n_projects, size=int(n_projects * 0.02), replace=False)
+    zero_indices = rng.choice(n_projects, size=int(n_projects * zero_award_rate), replace=False)
     df.loc[zero_indices, 'Award_Amount'] = 0
-    
-    # Create sample geographical data
-    postcodes = [f'SO{i} {j}AB' for i in range(10, 99) for j in range(1, 10)]
-    n_postcodes = len(postcodes)  # This will be 89 * 9 = 801
-    
-    geo_df = pd.DataFrame({
-        'Postcodes': postcodes,
-        'Parliamentary Constituency': ['Southampton, Test'] * (n_postcodes // 2) + ['Southampton, Itchen'] * (n_postcodes - n_postcodes // 2),
-        'English Region': ['South East'] * n_postcodes,
-        'Devolved Administration': ['England'] * n_postcodes
-    })
 
-    # Add region and devolved administration columns to main dataframe
-    df['English Region'] = np.random.choice(['South East', 'London', 'South West', 'East of England', 'West Midlands', 'East Midlands'], len(df))
-    df['Devolved Administration'] = 'England'  # All sample data is England-based
+    # Re-keyed titles: the same project title entered with different case, punctuation or spelling
+    variant_indices = rng.choice(n_projects, size=int(n_projects * near_duplicate_rate), replace=False)
+    variant_kinds = rng.integers(0, len(TITLE_VARIANTS), len(variant_indices))
+    for kind, make_variant in enumerate(TITLE_VARIANTS):
+        rows = variant_indices[variant_kinds == kind]
+        df.loc[rows, 'Project_Title'] = make_variant(df.loc[rows, 'Project_Title'])
 
-    # Ensure column name consistency - make sure main dataframe uses 'Postcode' to match sample data
-    df = df.rename(columns={'Postcode': 'Postcode'})
-    
     return df, geo_df
 
-def assess_data_quality(df):
-    """Comprehensive data quality assessment"""
-    quality_results = {}
-    
-    # 1. Missing Values Analysis
-    missing_patterns = ['', ' ', 'n/a', 'na', 'N/A', 'NA', 'not available', 'Not Available', 
-                       'NOT AVAILABLE', 'not known', 'Not Known', 'NOT KNOWN', 'tbc', 'TBC', 
-                       'To be confirmed', 'unknown', 'Unknown', 'UNKNOWN', '.', '-', '?', 
-                       'null', 'NULL', 'none', 'None', 'NONE']
-    
+@timed('load.sample_data')
+def create_sample_data(n_projects=10000, seed=42):
+    """Create sample data for demonstration purposes"""
+    df, geo_df = generate_synthetic_portfolio(n_projects=n_projects, seed=seed)
+    return _tag_dataset_version(df, geo_df, f'sample-{n_projects}-{seed}')
+
+# Dataset versioning - every derived cache is keyed on the version of the data it was built from
+@st.cache_resource(show_spinner=False)
+def _dataset_cache_registry():
+    """Entries served per dataset version, and the source versions behind each version key.
+
+    Kept outside the script so it survives reruns.
+    """
+    return {'entries': {}, 'sources': {}}
+
+def _tag_dataset_version(df, geo_df, version):
+    """Record the source version (workbook hash or sample id) on both frames"""
+    df.attrs['dataset_version'] = version
+    geo_df.attrs['dataset_version'] = version
+    return df, geo_df
+
+def _frame_fingerprint(frame):
+    """Cheap fingerprint of one frame: its source version plus shape, columns and index.
+
+    Filtered subsets inherit ``attrs`` from their parent, so the index hash keeps them
+    distinct from the full frame. Frames without a recorded version are hashed in full.
+    """
+    digest = hashlib.sha1()
+    digest.update(str(frame.attrs.get('dataset_version')).encode())
+    digest.update(repr((frame.shape, list(frame.columns))).encode())
+    if 'dataset_version' in frame.attrs:
+        digest.update(pd.util.hash_pandas_object(frame.index, index=False).values.tobytes())
+    else:
+        digest.update(pd.util.hash_pandas_object(frame, index=True).values.tobytes())
+    return digest.hexdigest()[:16]
+
+def get_dataset_version(*frames):
+    """Return a version key for one or more frames, used to key the derived caches.
+
+    The source versions of the frames are recorded against the key, so a refresh can evict
+    every key derived from the superseded data: both frames, either one alone, or a filtered view.
+    """
+    version = '-'.join(_frame_fingerprint(frame) for frame in frames)
+    _dataset_cache_registry()['sources'][version] = {frame.attrs.get('dataset_version') for frame in frames}
+    return version
+
+def dataset_cache(func=None, shared=False, **cache_kwargs):
+    """st.cache_data for functions whose first argument is a dataset version.
+
+    Frames are passed as underscore-prefixed arguments so Streamlit does not hash them;
+    the version argument is the cache key. Registered caches can then be evicted per
+    version by refresh_data() instead of clearing every cache in the app.
+
+    ``shared=True`` uses st.cache_resource instead, handing every caller the same object
+    without a copy - for large read-only frames that must never be mutated by callers.
+    """
+    def decorator(inner):
+        cache_api = st.cache_resource if shared else st.cache_data
+        cached = cache_api(show_spinner=False, **cache_kwargs)(inner)
+        signature = inspect.signature(inner)
+
+        @functools.wraps(inner)
+        def versioned(dataset_version, *args, **kwargs):
+            # Remember the hashed arguments of every entry so its version can be evicted later
+            bound = signature.bind(dataset_version, *args, **kwargs)
+            cache_key = tuple((name, value) for name, value in bound.arguments.items() if not name.startswith('_'))
+            entries = _dataset_cache_registry()['entries'].setdefault(dataset_version, {})
+            entries[(inner.__qualname__, cache_key)] = cached
+            return cached(dataset_version, *args, **kwargs)
+
+        versioned.clear = cached.clear
+        return versioned
+
+    return decorator(func) if func is not None else decorator
+
+def invalidate_dataset_caches(stale_source):
+    """Evict the entries of every version key built from a superseded source version"""
+    registry = _dataset_cache_registry()
+    stale_versions = [version for version, sources in registry['sources'].items() if stale_source in sources]
+    for version in stale_versions:
+        del registry['sources'][version]
+        for (_, cache_key), cached in registry['entries'].pop(version, {}).items():
+            cached.clear(**dict(cache_key))
+
+def refresh_data(df, geo_df):
+    """Reload the portfolio and evict only the cache entries of the previous version.
+
+    Projects that are new, changed or removed (matched on Project_ID) are folded into the
+    previous version's aggregates, so the quality, ranking and success tables are updated
+    from the delta instead of rescanning every row. Returns the reloaded frames and
+    whether the data actually changed.
+    """
+    stale_version = get_dataset_version(df, geo_df)
+    load_data.clear()
+    new_df, new_geo_df = load_data()
+    data_changed = get_dataset_version(new_df, new_geo_df) != stale_version
+    if data_changed:
+        # Fold the changed rows into the previous version's aggregates before evicting them
+        carry_forward_aggregates(df, geo_df, new_df, new_geo_df)
+        invalidate_dataset_caches(df.attrs.get('dataset_version'))
+    return new_df, new_geo_df, data_changed
+
+def find_date_columns(df):
+    """Date columns by the dashboard's naming convention"""
+    return [col for col in df.columns if 'date' in col.lower() or 'Date' in col]
+
+def parse_dates(series):
+    """Datetimes for a date column; unparseable values become NaT"""
+    return series if pd.api.types.is_datetime64_any_dtype(series.dtype) else pd.to_datetime(series, errors='coerce')
+
+@timed('dates.parse')
+def build_date_fields(df):
+    """Every date column parsed once, plus the derived fields the dashboard reuses.
+
+    Returns a frame on ``df``'s index with one datetime column per date column and
+    'start_year' (from Start_Date, else the first date column) and 'duration_years'
+    (End_Date - Start_Date in years of 365.25 days) where the columns exist.
+    """
+    fields = pd.DataFrame(index=df.index)
+    date_cols = find_date_columns(df)
+    for col in date_cols:
+        fields[col] = parse_dates(df[col])
+
+    start_col = 'Start_Date' if 'Start_Date' in fields.columns else (date_cols[0] if date_cols else None)
+    if start_col:
+        fields['start_year'] = fields[start_col].dt.year
+    if 'Start_Date' in fields.columns and 'End_Date' in fields.columns:
+        fields['duration_years'] = (fields['End_Date'] - fields['Start_Date']).dt.days / 365.25
+    return fields
+
+@dataset_cache(shared=True, max_entries=4)
+def _cached_date_fields(dataset_version, _df):
+    return build_date_fields(_df)
+
+def get_date_fields(df, rows=None):
+    """Typed date fields of ``df``, parsed once per dataset version and shared read-only.
+
+    Pass ``rows`` - any frame filtered from ``df`` or its geo-enriched copy - to get the
+    fields for just those rows.
+    """
+    fields = _cached_date_fields(get_dataset_version(df), df)
+    return fields if rows is None else fields.loc[rows.index]
+
+# Text placeholders that mean "missing", grouped for the Issues & Solutions breakdown
+MISSING_PATTERN_CATEGORIES = {
+    'Standard Null': ['', ' ', 'null', 'NULL'],
+    'N/A Variations': ['n/a', 'na', 'N/A', 'NA'],
+    'Not Available': ['not available', 'Not Available', 'NOT AVAILABLE'],
+    'Not Known': ['not known', 'Not Known', 'NOT KNOWN'],
+    'To Be Confirmed': ['tbc', 'TBC', 'To be confirmed'],
+    'Unknown': ['unknown', 'Unknown', 'UNKNOWN'],
+    'None Variations': ['none', 'None', 'NONE'],
+    'Symbols': ['.', '-', '?']
+}
+MISSING_VALUE_PATTERNS = [pattern for patterns in MISSING_PATTERN_CATEGORIES.values() for pattern in patterns]
+
+def _distinct_values(series):
+    """Integer codes per row (-1 for missing) and the distinct values they point to"""
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        return series.cat.codes.to_numpy(), series.cat.categories
+    codes, uniques = pd.factorize(series, use_na_sentinel=True)
+    return codes, uniques
+
+def detect_missing_values(df, patterns=MISSING_VALUE_PATTERNS):
+    """Missing-value counts per column: real nulls plus text placeholders such as 'N/A' or 'TBC'.
+
+    Each text column is reduced to its distinct values (categorical codes are used as-is),
+    so the strip-and-match runs once per distinct value rather than once per row. Returns
+    {column: {'count', 'percentage', 'null_count', 'pattern_count', 'patterns'}} where
+    'patterns' maps each matched placeholder to its row count.
+    """
+    pattern_set = frozenset(patterns)
+    n_rows = len(df)
     missing_counts = {}
     for col in df.columns:
-        # Standard missing values
-        standard_missing = df[col].isna().sum()
-        
-        # Pattern-based missing values
-        pattern_missing = 0
-        if df[col].dtype == 'object':
-            pattern_missing = df[col].astype(str).str.strip().isin(missing_patterns).sum()
-        
-        total_missing = standard_missing + pattern_missing
+        series = df[col]
+        null_count = int(series.isna().sum())
+        pattern_counts = {}
+
+        is_text = (pd.api.types.is_object_dtype(series.dtype) or pd.api.types.is_string_dtype(series.dtype)
+                   or isinstance(series.dtype, pd.CategoricalDtype))
+        if is_text and n_rows > null_count:
+            codes, uniques = _distinct_values(series)
+            distinct = pd.Series(uniques)
+            if not isinstance(distinct.dtype, pd.StringDtype):
+                distinct = distinct[distinct.map(type).eq(str).to_numpy()]  # Mixed columns - only text can match
+            stripped = distinct.str.strip()
+            matched = stripped.isin(pattern_set)
+            if matched.any():
+                row_counts = np.bincount(codes[codes >= 0], minlength=len(uniques))
+                for position, pattern in stripped[matched].items():
+                    pattern_counts[pattern] = pattern_counts.get(pattern, 0) + int(row_counts[position])
+
+        pattern_count = sum(pattern_counts.values())
+        total_missing = null_count + pattern_count
         missing_counts[col] = {
             'count': total_missing,
-            'percentage': (total_missing / len(df)) * 100
+            'percentage': (total_missing / n_rows) * 100 if n_rows else 0.0,
+            'null_count': null_count,
+            'pattern_count': pattern_count,
+            'patterns': pattern_counts
+        }
+    return missing_counts
+
+def summarise_missing_patterns(missing_counts):
+    """Row counts per placeholder and per category across all columns"""
+    by_pattern = dict.fromkeys(MISSING_VALUE_PATTERNS, 0)
+    for column_counts in missing_counts.values():
+        for pattern, count in column_counts['patterns'].items():
+            by_pattern[pattern] = by_pattern.get(pattern, 0) + count
+    by_category = {
+        category: sum(by_pattern.get(pattern, 0) for pattern in patterns)
+        for category, patterns in MISSING_PATTERN_CATEGORIES.items()
+    }
+    columns = {col: counts['pattern_count'] for col, counts in missing_counts.items() if counts['pattern_count']}
+    return {'by_pattern': by_pattern, 'by_category': by_category, 'by_column': columns,
+            'total': sum(by_pattern.values())}
+
+# Field names whose repeated values are legitimate, so they are never treated as duplicate keys
+DUPLICATE_EXCLUDED_FIELDS = ['project_status', 'status', 'postcode', 'postal_code', 'zip_code',
+                             'region', 'area', 'location', 'programme_type', 'category', 'type']
+_HASH_MULTIPLIER = np.uint64(0x100000001B3)  # FNV-1a prime for combining column hashes into row hashes
+
+def find_duplicate_keys(df):
+    """Key columns checked for duplicates: {stat name: (column, skip nulls)}"""
+    keys = {}
+    if 'Project_ID' in df.columns:
+        keys['project_id_duplicates'] = ('Project_ID', False)
+    # Project titles/names - nulls never form a duplicate group
+    for col in df.columns:
+        if (any(keyword in col.lower() for keyword in ['title', 'name']) and 'project' in col.lower()
+                and col.lower() not in DUPLICATE_EXCLUDED_FIELDS):
+            keys[f'{col.lower()}_duplicates'] = (col, True)
+    # Other identifier columns (Project_ID is already covered)
+    for col in df.columns:
+        if (any(keyword in col.lower() for keyword in ['id', 'reference', 'number', 'code'])
+                and col != 'Project_ID' and col.lower() not in DUPLICATE_EXCLUDED_FIELDS):
+            keys.setdefault(f'{col.lower()}_duplicates', (col, False))
+    return keys
+
+def group_duplicate_hashes(hashes, valid=None):
+    """Dense duplicate-group id per row from a hash array; -1 for rows without a duplicate"""
+    codes, _ = pd.factorize(hashes)
+    if valid is not None:
+        codes = np.where(valid, codes, -1)
+    counts = np.bincount(codes[codes >= 0], minlength=codes.max() + 1 if len(codes) else 0)
+    repeated = np.flatnonzero(counts > 1)
+    group_ids = np.full(len(counts), -1, dtype=np.int64)
+    group_ids[repeated] = np.arange(len(repeated))
+    return np.where(codes >= 0, group_ids[codes], -1), len(repeated)
+
+def _hash_column(series):
+    """64-bit hash per row; equal values (and all nulls) hash equally.
+
+    Text is factorised first and its integer codes hashed - hashing every string with
+    hash_pandas_object costs several times more than the factorise itself.
+    """
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        codes = series.cat.codes.to_numpy()
+    elif pd.api.types.is_object_dtype(series.dtype) or pd.api.types.is_string_dtype(series.dtype):
+        codes, _ = pd.factorize(series, use_na_sentinel=True)
+    else:
+        return pd.util.hash_pandas_object(series, index=False).to_numpy()
+    return pd.util.hash_array(codes.astype(np.int64))
+
+@timed('quality.duplicate_index')
+def build_duplicate_index(df):
+    """Duplicate groups for whole rows and every key column, from one hash per column.
+
+    Each column is hashed once (pd.util.hash_pandas_object / hash_array); whole-row hashes
+    combine the column hashes, so the full-row check never compares the text itself. Returns
+    {stat name: {'column', 'group_ids', 'group_count', 'row_count'}} where 'group_ids'
+    gives each row's duplicate group (-1 if it has none) and 'row_count' counts every row
+    in a group, first occurrence included. The stat names match
+    quality_results['duplicate_analysis'], plus 'complete_duplicates' for whole rows.
+    """
+    column_hashes = {col: _hash_column(df[col]) for col in df.columns}
+
+    row_hashes = np.zeros(len(df), dtype=np.uint64)
+    with np.errstate(over='ignore'):
+        for hashes in column_hashes.values():
+            row_hashes = (row_hashes ^ hashes) * _HASH_MULTIPLIER
+
+    targets = {'complete_duplicates': (None, row_hashes, None)}
+    for stat, (col, skip_nulls) in find_duplicate_keys(df).items():
+        targets[stat] = (col, column_hashes[col], df[col].notna().to_numpy() if skip_nulls else None)
+
+    duplicate_index = {}
+    for stat, (col, hashes, valid) in targets.items():
+        group_ids, group_count = group_duplicate_hashes(hashes, valid)
+        duplicate_index[stat] = {
+            'column': col,
+            'group_ids': group_ids,
+            'group_count': group_count,
+            'row_count': int((group_ids >= 0).sum())
         }
+    return duplicate_index
+
+@dataset_cache(shared=True, max_entries=4)
+def _cached_duplicate_index(dataset_version, _df):
+    return build_duplicate_index(_df)
+
+def get_duplicate_index(df):
+    """Duplicate groups of ``df``, built once per dataset version and shared read-only"""
+    return _cached_duplicate_index(get_dataset_version(df), df)
+
+def duplicate_group_table(df, duplicate_entry):
+    """One row per duplicate group, largest first, for drill-down"""
+    group_ids = duplicate_entry['group_ids']
+    in_group = np.flatnonzero(group_ids >= 0)
+    if len(in_group) == 0:
+        return pd.DataFrame(columns=['Group', 'Rows', 'Value'])
+
+    ids = group_ids[in_group]
+    sizes = np.bincount(ids)
+    first_rows = in_group[np.unique(ids, return_index=True)[1]]
+    column = duplicate_entry['column']
+    values = df[column].iloc[first_rows].astype(str).to_numpy() if column else (
+        'Identical rows incl. ' + df.iloc[first_rows, 0].astype(str)).to_numpy()
+    table = pd.DataFrame({'Group': np.arange(len(sizes)), 'Rows': sizes, 'Value': values})
+    return table.sort_values(['Rows', 'Group'], ascending=[False, True], ignore_index=True)
+
+def duplicate_group_rows(df, duplicate_entry, group):
+    """The portfolio rows that make up one duplicate group"""
+    return df.iloc[np.flatnonzero(duplicate_entry['group_ids'] == group)]
+
+# Near-duplicate project titles (MinHash signatures over character shingles + LSH banding)
+NEAR_DUPLICATE_THRESHOLD = 0.9  # Jaccard similarity of title shingles
+MINHASH_PERMUTATIONS = 128
+SHINGLE_SIZE = 3
+_MINHASH_PRIME = (1 << 31) - 1
+
+def normalise_titles(titles):
+    """Lower-case, punctuation-free, single-spaced titles"""
+    return (pd.Series(titles, dtype='str').str.lower()
+            .str.replace(r'[^a-z0-9]+', ' ', regex=True).str.strip())
+
+def _shingle_ids(texts, size=SHINGLE_SIZE):
+    """(document, shingle id) pairs for the distinct character shingles of each text"""
+    shingles, documents = [], []
+    for doc, text in enumerate(texts):
+        grams = {text[i:i + size] for i in range(len(text) - size + 1)} or {text}
+        shingles.extend(grams)
+        documents.extend([doc] * len(grams))
+    shingle_ids, _ = pd.factorize(pd.Series(shingles, dtype='str'))
+    return np.asarray(documents, dtype=np.int64), shingle_ids.astype(np.int64)
+
+def minhash_signatures(documents, shingle_ids, num_perm=MINHASH_PERMUTATIONS, seed=1):
+    """MinHash signature matrix (documents x num_perm) using universal hashing of shingle ids"""
+    rng = np.random.default_rng(seed)
+    a = rng.integers(1, _MINHASH_PRIME, num_perm, dtype=np.int64)
+    b = rng.integers(0, _MINHASH_PRIME, num_perm, dtype=np.int64)
+
+    doc_starts = np.flatnonzero(np.r_[True, documents[1:] != documents[:-1]])
+    signatures = np.empty((len(doc_starts), num_perm), dtype=np.int64)
+    block = max(1, (1 << 21) // max(len(shingle_ids), 1))  # Bound the temporary hash matrix to ~16 MB
+    for start in range(0, num_perm, block):
+        stop = min(start + block, num_perm)
+        hashes = (a[start:stop, None] * shingle_ids[None, :] + b[start:stop, None]) % _MINHASH_PRIME
+        signatures[:, start:stop] = np.minimum.reduceat(hashes, doc_starts, axis=1).T
+    return signatures
+
+def lsh_band_layout(num_perm, threshold):
+    """(bands, rows per band) whose candidate curve rises just below the similarity threshold"""
+    target = threshold * 0.85  # Cast the candidate net wider; candidates are verified afterwards
+    layouts = [(num_perm // rows, rows) for rows in range(1, num_perm + 1)]
+    return min(layouts, key=lambda layout: abs((1 / layout[0]) ** (1 / layout[1]) - target))
+
+def find_near_duplicate_groups(texts, threshold=NEAR_DUPLICATE_THRESHOLD, num_perm=MINHASH_PERMUTATIONS):
+    """Cluster id per text, joining texts whose shingle Jaccard similarity reaches ``threshold``.
+
+    LSH banding only proposes texts sharing a whole band of their MinHash signature; each
+    candidate's exact Jaccard similarity is then checked against its bucket's first text,
+    so the work stays near-linear with no pairwise comparison. Clusters are the connected
+    components of the verified pairs.
+    """
+    n_texts = len(texts)
+    if n_texts < 2:
+        return np.arange(n_texts)
+
+    documents, shingle_ids = _shingle_ids(texts)
+    shingles = csr_matrix((np.ones(len(documents), dtype=np.int32), (documents, shingle_ids)),
+                          shape=(n_texts, shingle_ids.max() + 1))
+    shingle_counts = np.diff(shingles.indptr)
+    signatures = minhash_signatures(documents, shingle_ids, num_perm)
+    bands, rows = lsh_band_layout(num_perm, threshold)
+    sources, targets = [], []
+    for band in range(bands):
+        band_keys = pd.util.hash_pandas_object(
+            pd.DataFrame(signatures[:, band * rows:(band + 1) * rows]), index=False).to_numpy()
+        buckets, _ = pd.factorize(band_keys)
+        order = np.argsort(buckets, kind='stable')
+        sorted_buckets = buckets[order]
+        first = np.r_[True, sorted_buckets[1:] != sorted_buckets[:-1]]
+        leaders = order[np.flatnonzero(first)][np.cumsum(first) - 1]
+        members = ~first
+        if not members.any():
+            continue
+        candidates, leaders = order[members], leaders[members]
+        shared = np.asarray(shingles[candidates].multiply(shingles[leaders]).sum(axis=1)).ravel()
+        similarity = shared / (shingle_counts[candidates] + shingle_counts[leaders] - shared)
+        verified = similarity >= threshold
+        sources.append(leaders[verified])
+        targets.append(candidates[verified])
+
+    if not sources:
+        return np.arange(n_texts)
+    sources, targets = np.concatenate(sources), np.concatenate(targets)
+    graph = coo_matrix((np.ones(len(sources), dtype=np.int8), (sources, targets)), shape=(n_texts, n_texts))
+    return connected_components(graph, directed=False)[1]
+
+def cluster_distinct_titles(distinct_titles, threshold=NEAR_DUPLICATE_THRESHOLD):
+    """Cluster id per distinct raw title; titles equal after normalisation always share one.
+
+    Normalised texts are clustered in sorted order so the result depends only on the set of
+    titles, not the order rows arrived in.
+    """
+    norm_codes, norm_texts = pd.factorize(normalise_titles(distinct_titles), sort=True)
+    return find_near_duplicate_groups(list(norm_texts), threshold)[norm_codes]
+
+@timed('quality.near_duplicate_titles')
+def build_title_clusters(df, column='Project_Title', threshold=NEAR_DUPLICATE_THRESHOLD):
+    """Near-duplicate clusters of project titles, exact repeats included.
+
+    Titles are normalised (case, punctuation, spacing) and only distinct normalised titles
+    are signed, so repeated titles cost nothing extra. Returns 'cluster_ids' per row (-1
+    for missing titles and titles with no near-duplicate), 'row_count' (records in a
+    cluster of two or more) and the cluster-level summary used by the Data Quality tab.
+    """
+    titles = df[column]
+    row_codes, distinct_titles = pd.factorize(titles, use_na_sentinel=True)
+    title_clusters = cluster_distinct_titles(distinct_titles, threshold)
+
+    # Row -> distinct title -> cluster
+    row_clusters = np.where(row_codes >= 0, title_clusters[np.maximum(row_codes, 0)], -1)
+    records = np.bincount(row_clusters[row_clusters >= 0], minlength=title_clusters.max() + 1 if len(title_clusters) else 0)
+    clustered = (row_clusters >= 0) & (records[np.maximum(row_clusters, 0)] > 1)
+    cluster_ids = np.where(clustered, row_clusters, -1)
+
+    title_frequency = pd.Series(np.bincount(row_codes[row_codes >= 0], minlength=len(distinct_titles)))
+    variants = pd.DataFrame({
+        'cluster': title_clusters,
+        'title': pd.Series(distinct_titles, dtype='str'),
+        'records': title_frequency
+    })
+    variants = variants[records[variants['cluster']] > 1]
+    return {
+        'column': column,
+        'threshold': threshold,
+        'cluster_ids': cluster_ids,
+        'row_count': int(clustered.sum()),
+        'cluster_count': int((records > 1).sum()),
+        'variants': variants.sort_values(['cluster', 'records'], ascending=[True, False], ignore_index=True)
+    }
+
+@dataset_cache(shared=True, max_entries=8)
+def _cached_title_clusters(dataset_version, column, threshold, _df):
+    return build_title_clusters(_df, column, threshold)
+
+def get_title_clusters(df, column='Project_Title', threshold=NEAR_DUPLICATE_THRESHOLD):
+    """Near-duplicate title clusters, built once per dataset version and threshold"""
+    if column not in df.columns:
+        return None
+    return _cached_title_clusters(get_dataset_version(df), column, threshold, df)
+
+def title_cluster_table(title_clusters, fuzzy_only=True):
+    """Reviewable cluster table, largest first; ``fuzzy_only`` hides clusters of identical titles"""
+    variants = title_clusters['variants']
+    table = variants.groupby('cluster', sort=False).agg(
+        Records=('records', 'sum'),
+        Variants=('title', 'size'),
+        Titles=('title', lambda titles: ' | '.join(titles.head(3)))
+    )
+    if fuzzy_only:
+        table = table[table['Variants'] > 1]
+    table = table.sort_values(['Records', 'Variants'], ascending=False).rename_axis('Cluster').reset_index()
+    return table
+
+EXPECTED_DATE_RANGE = (pd.Timestamp('2011-01-01'), pd.Timestamp('2030-12-31'))
+
+@timed('quality.assess')
+def assess_data_quality(df, aggregates=None):
+    """Comprehensive data quality assessment.
+
+    ``aggregates`` (get_portfolio_aggregates(df)) supplies the missing-value and duplicate
+    counts, so a carried-forward version does not rescan every row for them.
+    """
+    quality_results = {}
     
+    # 1. Missing Values Analysis
+    if aggregates is None:
+        missing_counts = detect_missing_values(df)
+    else:
+        missing_counts = missing_values_report(aggregates['missing_values'], aggregates['rows'])
     quality_results['missing_values'] = missing_counts
+    quality_results['missing_patterns'] = summarise_missing_patterns(missing_counts)
     
     # 2. Comprehensive Duplicate Analysis
-    duplicate_stats = {}
-    
-    # Complete row duplicates
-    # Count ALL records that are part of duplicate groups (like conditional formatting)
-    complete_duplicates = df.duplicated(keep=False).sum()
-    duplicate_stats['complete_duplicates'] = complete_duplicates
-    
-    # Project ID duplicates
-    if 'Project_ID' in df.columns:
-        # Count ALL records that are part of duplicate groups (like conditional formatting)
-        project_id_duplicates = df['Project_ID'].duplicated(keep=False).sum()
-        duplicate_stats['project_id_duplicates'] = project_id_duplicates
-    
-    # Define excluded fields (valid duplicate categories)
-    excluded_fields = ['project_status', 'status', 'postcode', 'postal_code', 'zip_code',
-                      'region', 'area', 'location', 'programme_type', 'category', 'type']
-
-    # Project title duplicates (excluding valid duplicate fields)
-    title_columns = [col for col in df.columns if any(keyword in col.lower()
-                    for keyword in ['title', 'name']) and 'project' in col.lower()]
-
-    for col in title_columns:
-        if (col in df.columns and
-            col.lower() not in excluded_fields):  # Exclude valid duplicate fields
-            # Count ALL records that are part of duplicate groups (like conditional formatting)
-            # This includes the first occurrence, not just the duplicates
-            # Note: duplicated() automatically excludes NaN values, but conditional formatting would include them
-            non_null_data = df[col].dropna()
-            title_duplicates = non_null_data.duplicated(keep=False).sum()
-            
-            # Debug information
-            print(f"DEBUG Duplicate Analysis for {col}:")
-            print(f"  Total records: {len(df)}")
-            print(f"  Non-null records: {len(non_null_data)}")
-            print(f"  Duplicates found: {title_duplicates}")
-            print(f"  Unique values: {non_null_data.nunique()}")
-            
-            if title_duplicates > 0:  # Only include if duplicates found
-                duplicate_stats[f'{col.lower()}_duplicates'] = title_duplicates
-
-    # Key identifier duplicates (excluding valid duplicate fields)
-    id_columns = [col for col in df.columns if any(keyword in col.lower()
-                 for keyword in ['id', 'reference', 'number', 'code'])]
-    for col in id_columns:
-        if (col in df.columns and
-            col not in ['Project_ID'] and  # Avoid double counting
-            col.lower() not in excluded_fields):  # Exclude valid duplicate fields
-            # Count ALL records that are part of duplicate groups (like conditional formatting)
-            id_duplicates = df[col].duplicated(keep=False).sum()
-            if id_duplicates > 0:
-                duplicate_stats[f'{col.lower()}_duplicates'] = id_duplicates
+    # Count ALL records that are part of duplicate groups (like conditional formatting),
+    # first occurrence included; group membership comes from the shared hash index
+    if aggregates is None:
+        duplicate_index = get_duplicate_index(df)
+        duplicate_stats = {'complete_duplicates': duplicate_index['complete_duplicates']['row_count']}
+        for stat, entry in duplicate_index.items():
+            if stat == 'complete_duplicates':
+                continue
+            # Project IDs are always reported; other keys only when duplicates exist
+            if stat == 'project_id_duplicates' or entry['row_count'] > 0:
+                duplicate_stats[stat] = entry['row_count']
+            debug_log.debug("Duplicate analysis for %s: %d records, %d duplicates in %d groups",
+                            entry['column'], len(df), entry['row_count'], entry['group_count'])
+    else:
+        # Same counts from the distinct key hashes the aggregates keep up to date
+        duplicate_stats = summarise_duplicate_hash_counts(aggregates['duplicates'])
+        del duplicate_stats['total_duplicates']
     
-    # Total duplicates across all fields (but this might be wrong for display)
+    # Total duplicates across all fields
     total_duplicates = sum(duplicate_stats.values())
+
+    # Project titles are the main duplicates: count records whose title has an exact or
+    # near-identical twin (MinHash/LSH clusters) and report that as the headline total
+    title_clusters = get_title_clusters(df)
+    if title_clusters is not None:
+        duplicate_stats['project_title_near_duplicates'] = title_clusters['row_count']
+        duplicate_stats['project_title_clusters'] = title_clusters['cluster_count']
+        total_duplicates = title_clusters['row_count']
     duplicate_stats['total_duplicates'] = total_duplicates
     
-    # Debug information for total duplicates
-    print(f"DEBUG Total Duplicates Calculation:")
-    print(f"  Dataset size: {len(df)}")
-    for key, value in duplicate_stats.items():
-        if key != 'total_duplicates':
-            print(f"  {key}: {value}")
-    print(f"  Calculated Total: {total_duplicates}")
-    
-    # IMPORTANT: User manually verified Project Title duplicates as 2066
-    # Override with correct count until we resolve the discrepancy
-    if 'project_title_duplicates' in duplicate_stats:
-        duplicate_stats['project_title_duplicates'] = 2066
-        # Recalculate total with corrected project title count
-        total_duplicates = 2066  # Since project titles are the main duplicates
-        duplicate_stats['total_duplicates'] = total_duplicates
-        print(f"OVERRIDE: Using manually verified Project Title duplicates: 2066")
+    debug_log.debug("Total duplicates over %d records: %d (%s)", len(df), total_duplicates, duplicate_stats)
     
     quality_results['duplicate_analysis'] = duplicate_stats
     
@@ -722,19 +1644,19 @@ def assess_data_quality(df):
         }
     
     # 4. Date Range Analysis
-    date_columns = [col for col in df.columns if 'date' in col.lower() or 'Date' in col]
+    date_columns = find_date_columns(df)
+    date_fields = get_date_fields(df)
     quality_results['date_analysis'] = {}
     
     for col in date_columns:
         if col in df.columns:
             try:
-                date_series = pd.to_datetime(df[col], errors='coerce')
+                date_series = date_fields[col]
                 min_date = date_series.min()
                 max_date = date_series.max()
                 
                 # Check for dates outside expected range (2011-2030)
-                expected_min = pd.Timestamp('2011-01-01')
-                expected_max = pd.Timestamp('2030-12-31')
+                expected_min, expected_max = EXPECTED_DATE_RANGE
                 
                 outside_range = ((date_series < expected_min) | (date_series > expected_max)).sum()
                 
@@ -747,10 +1669,14 @@ def assess_data_quality(df):
                 quality_results['date_analysis'][col] = {'error': 'Could not parse dates'}
     
     # 5. Overall Quality Score
-    total_records = len(df)
-    total_fields = len(df.columns)
+    quality_results['overall_score'] = score_quality(quality_results, len(df), len(df.columns))
     
+    return quality_results
+
+def score_quality(quality_results, total_records, total_fields):
+    """Completeness, consistency and overall scores (and grade) from the assessment counts"""
     # Calculate completeness score
+    missing_counts = quality_results['missing_values']
     total_missing = sum([missing_counts[col]['count'] for col in missing_counts])
     completeness_score = max(0, 100 - (total_missing / (total_records * total_fields)) * 100)
     
@@ -776,15 +1702,507 @@ def assess_data_quality(df):
     # Overall score
     overall_score = (completeness_score + consistency_score) / 2
     
-    quality_results['overall_score'] = {
+    return {
         'completeness': completeness_score,
         'consistency': consistency_score,
         'overall': overall_score,
         'grade': 'A' if overall_score >= 90 else 'B' if overall_score >= 80 else 'C' if overall_score >= 70 else 'D'
     }
-    
+
+@dataset_cache
+def _cached_quality_assessment(dataset_version, _df):
+    started = time.perf_counter()
+    quality_results = assess_data_quality(_df, get_portfolio_aggregates(_df))
+    quality_results['assessment_timing'] = {
+        'compute_seconds': time.perf_counter() - started,
+        'computed_at': pd.Timestamp.now(),
+        'dataset_version': dataset_version
+    }
+    return quality_results
+
+def get_quality_assessment(df):
+    """Data quality results for this dataset version, computed once and reused on every rerun.
+
+    ``quality_results['assessment_timing']`` records how long the assessment took and when it
+    ran - a constant ``computed_at`` across reruns and sessions confirms the cache is serving.
+    """
+    return _cached_quality_assessment(get_dataset_version(df), df)
+
+# Streaming quality assessment - portfolio files larger than memory, profiled chunk by chunk
+STREAM_CHUNK_ROWS = 100_000
+QUANTILE_SKETCH_ACCURACY = 0.01  # Relative error of sketch quantiles (logarithmic buckets, as in DDSketch)
+
+def iter_portfolio_chunks(file_path, chunk_rows=STREAM_CHUNK_ROWS, sheet_name=PORTFOLIO_SHEET):
+    """Portfolio rows in frames of at most ``chunk_rows``, never holding the whole file.
+
+    Parquet is read by row batch, CSV with pandas' chunked reader and workbooks through
+    openpyxl's read-only row iterator. Column names are stripped as in load_data() and
+    chunks carry consecutive row numbers as their index.
+    """
+    extension = os.path.splitext(file_path)[1].lower()
+    if extension == '.parquet':
+        import pyarrow.parquet as pq
+        chunks = (batch.to_pandas() for batch in pq.ParquetFile(file_path).iter_batches(batch_size=chunk_rows))
+    elif extension == '.csv':
+        chunks = pd.read_csv(file_path, chunksize=chunk_rows)
+    else:
+        chunks = _iter_sheet_chunks(file_path, sheet_name, chunk_rows)
+
+    offset = 0
+    for chunk in chunks:
+        chunk.columns = chunk.columns.astype(str).str.strip()
+        chunk.index = pd.RangeIndex(offset, offset + len(chunk))
+        offset += len(chunk)
+        yield chunk
+
+def _iter_sheet_chunks(file_path, sheet_name, chunk_rows):
+    from openpyxl import load_workbook
+    workbook = load_workbook(file_path, read_only=True, data_only=True)
+    try:
+        rows = workbook[sheet_name].iter_rows(values_only=True)
+        header = next(rows, None)
+        while header is not None:
+            block = list(itertools.islice(rows, chunk_rows))
+            if not block:
+                break
+            # Read-only sheets can report formatted-but-empty rows past the data
+            yield pd.DataFrame(block, columns=header).dropna(how='all').infer_objects()
+    finally:
+        workbook.close()
+
+_NULL_HASH = np.uint64(0x9E3779B97F4A7C15)  # Nulls need their own hash - pandas hashes 0 and 0.0 to 0
+
+def _stable_hash_column(series):
+    """64-bit hash per row that depends only on the value, so every chunk hashes alike (nulls share _NULL_HASH).
+
+    Numbers hash as float64 and dates as nanoseconds, so integer and float chunks of the
+    same column agree; text hashes only its distinct values.
+    """
+    if pd.api.types.is_numeric_dtype(series.dtype) or pd.api.types.is_datetime64_any_dtype(series.dtype):
+        if pd.api.types.is_datetime64_any_dtype(series.dtype):
+            values = series.to_numpy(dtype='datetime64[ns]').view(np.int64)
+        else:
+            values = series.to_numpy(dtype=np.float64, na_value=np.nan)
+        return np.where(series.isna().to_numpy(), _NULL_HASH, pd.util.hash_array(values))
+    codes, uniques = _distinct_values(series)
+    value_hashes = pd.util.hash_array(pd.Index(uniques).astype(str).to_numpy(dtype=object))
+    return np.append(value_hashes, _NULL_HASH)[codes]  # Code -1 (null) picks the trailing null hash
+
+def _hash_counts(hashes, counts=None):
+    """Distinct hashes and how many rows carry each; merging partials re-applies this to their union"""
+    distinct, inverse = np.unique(hashes, return_inverse=True)
+    return distinct, np.bincount(inverse, weights=counts, minlength=len(distinct)).astype(np.int64)
+
+def _moments(values):
+    """(count, mean, sum of squared deviations) - merged with Chan's parallel update"""
+    if len(values) == 0:
+        return (0, 0.0, 0.0)
+    mean = float(values.mean())
+    return (len(values), mean, float(((values - mean) ** 2).sum()))
+
+def _merge_moments(left, right):
+    count = left[0] + right[0]
+    if count == 0:
+        return (0, 0.0, 0.0)
+    delta = right[1] - left[1]
+    return (count, left[1] + delta * right[0] / count, left[2] + right[2] + delta ** 2 * left[0] * right[0] / count)
+
+def quantile_sketch(values, accuracy=QUANTILE_SKETCH_ACCURACY):
+    """Mergeable quantile sketch: value counts per logarithmic bucket.
+
+    Bucket k holds magnitudes in (gamma^(k-1), gamma^k] with gamma = (1 + a) / (1 - a), so
+    any quantile read back is within relative error ``accuracy`` however many sketches are
+    merged, and the sketch stays a few hundred buckets for award amounts.
+    """
+    log_gamma = np.log((1 + accuracy) / (1 - accuracy))
+    def buckets(magnitudes):
+        keys = np.ceil(np.log(magnitudes) / log_gamma).astype(np.int64)
+        return pd.Series(keys).value_counts(sort=False)
+    return {
+        'accuracy': accuracy,
+        'positive': buckets(values[values > 0]),
+        'negative': buckets(-values[values < 0]),
+        'zero': int((values == 0).sum())
+    }
+
+def merge_quantile_sketches(left, right):
+    return {
+        'accuracy': left['accuracy'],
+        'positive': left['positive'].add(right['positive'], fill_value=0).astype(np.int64),
+        'negative': left['negative'].add(right['negative'], fill_value=0).astype(np.int64),
+        'zero': left['zero'] + right['zero']
+    }
+
+def _sketch_values(sketch):
+    """Representative value and count per bucket, in ascending value order"""
+    gamma = (1 + sketch['accuracy']) / (1 - sketch['accuracy'])
+    negative = sketch['negative'].sort_index(ascending=False)
+    positive = sketch['positive'].sort_index()
+    values = np.concatenate([
+        -2 * gamma ** negative.index.to_numpy(dtype=np.float64) / (gamma + 1),
+        [0.0],
+        2 * gamma ** positive.index.to_numpy(dtype=np.float64) / (gamma + 1)
+    ])
+    counts = np.concatenate([negative.to_numpy(), [sketch['zero']], positive.to_numpy()])
+    return values, counts
+
+def sketch_quantile(sketch, q):
+    """Approximate ``q`` quantile of every value added to the sketch (NaN if empty)"""
+    values, counts = _sketch_values(sketch)
+    total = counts.sum()
+    if total == 0:
+        return np.nan
+    return float(values[np.searchsorted(np.cumsum(counts), q * (total - 1), side='right')])
+
+def sketch_count_outside(sketch, low, high):
+    """Approximate number of values below ``low`` or above ``high``"""
+    values, counts = _sketch_values(sketch)
+    return int(counts[(values < low) | (values > high)].sum())
+
+def _combine_hashes(column_hashes, n_rows):
+    row_hashes = np.zeros(n_rows, dtype=np.uint64)
+    with np.errstate(over='ignore'):
+        for hashes in column_hashes:
+            row_hashes = (row_hashes ^ hashes) * _HASH_MULTIPLIER
+    return row_hashes
+
+def stable_row_hashes(frame, columns=None):
+    """Value hash per column and row hashes combining them, comparable across chunks and versions.
+
+    ``columns`` limits both to a subset of the frame's columns (default: all of them).
+    """
+    columns = list(frame.columns) if columns is None else columns
+    column_hashes = {col: _stable_hash_column(frame[col]) for col in columns}
+    return column_hashes, _combine_hashes(column_hashes.values(), len(frame))
+
+def duplicate_hash_counts(frame, hashes=None):
+    """{stat: (column, distinct hashes, row counts)} for whole rows and every duplicate key column.
+
+    ``hashes`` reuses a stable_row_hashes(frame) result.
+    """
+    column_hashes, row_hashes = hashes or stable_row_hashes(frame)
+    duplicates = {'complete_duplicates': (None, *_hash_counts(row_hashes))}
+    for stat, (col, skip_nulls) in find_duplicate_keys(frame).items():
+        hashes = column_hashes[col][frame[col].notna().to_numpy()] if skip_nulls else column_hashes[col]
+        duplicates[stat] = (col, *_hash_counts(hashes))
+    return duplicates
+
+def title_value_counts(frame, column='Project_Title'):
+    """Rows per distinct title (as text), the mergeable input of near-duplicate clustering"""
+    title_counts = frame[column].value_counts(sort=False)
+    return title_counts[title_counts > 0].rename(index=str)
+
+def merge_missing_counts(left, right, sign=1):
+    """Add (or with ``sign=-1`` subtract) detect_missing_values() counts column by column"""
+    merged = {}
+    for col in list(left) + [col for col in right if col not in left]:
+        sides = [(counts[col], weight) for counts, weight in ((left, 1), (right, sign)) if col in counts]
+        patterns = {}
+        for column_counts, weight in sides:
+            for pattern, count in column_counts['patterns'].items():
+                patterns[pattern] = patterns.get(pattern, 0) + weight * count
+        merged[col] = {
+            key: sum(weight * column_counts[key] for column_counts, weight in sides)
+            for key in ('count', 'null_count', 'pattern_count')
+        }
+        merged[col]['patterns'] = {pattern: count for pattern, count in patterns.items() if count}
+    return merged
+
+def merge_duplicate_hash_counts(left, right, sign=1):
+    """Add (or subtract) duplicate_hash_counts() results; hashes whose count reaches zero are dropped"""
+    merged = {}
+    for stat in {**left, **right}:
+        entries = [(entry, weight) for entry, weight in ((left.get(stat), 1), (right.get(stat), sign)) if entry]
+        hashes, counts = _hash_counts(np.concatenate([entry[1] for entry, _ in entries]),
+                                      np.concatenate([weight * entry[2] for entry, weight in entries]))
+        merged[stat] = (entries[0][0][0], hashes[counts > 0], counts[counts > 0])
+    return merged
+
+def merge_title_counts(left, right, sign=1):
+    merged = pd.concat([left, sign * right]).groupby(level=0, sort=False).sum()
+    return merged[merged > 0]
+
+def missing_values_report(missing_counts, total_records):
+    """detect_missing_values() output (percentages included) from merged counts"""
+    return {
+        col: {
+            'count': counts['count'],
+            'percentage': (counts['count'] / total_records) * 100 if total_records else 0.0,
+            'null_count': counts['null_count'],
+            'pattern_count': counts['pattern_count'],
+            'patterns': counts['patterns']
+        }
+        for col, counts in missing_counts.items()
+    }
+
+def summarise_duplicate_hash_counts(duplicates, title_counts=None, threshold=NEAR_DUPLICATE_THRESHOLD):
+    """quality_results['duplicate_analysis'] from hash counts, with assess_data_quality()'s reporting rules"""
+    duplicate_stats = {}
+    for stat, (col, hashes, counts) in duplicates.items():
+        row_count = int(counts[counts > 1].sum())
+        if stat in ('complete_duplicates', 'project_id_duplicates') or row_count > 0:
+            duplicate_stats[stat] = row_count
+    total_duplicates = sum(duplicate_stats.values())
+    if title_counts is not None:
+        title_clusters = cluster_distinct_titles(title_counts.index, threshold)
+        records = np.bincount(title_clusters, weights=title_counts.to_numpy())
+        clustered = records[title_clusters] > 1
+        duplicate_stats['project_title_near_duplicates'] = int(title_counts.to_numpy()[clustered].sum())
+        duplicate_stats['project_title_clusters'] = int((records > 1).sum())
+        total_duplicates = duplicate_stats['project_title_near_duplicates']
+    duplicate_stats['total_duplicates'] = total_duplicates
+    return duplicate_stats
+
+def quality_partial(chunk):
+    """Mergeable assessment counts for one chunk of portfolio rows.
+
+    Everything kept is additive or mergeable: missing-value counts, distinct duplicate-key
+    hashes with row counts, title value counts, award counts, moments and quantile
+    sketch, and per date column the min, max and out-of-range count.
+    """
+    partial = {
+        'rows': len(chunk),
+        'chunks': 1,
+        'columns': list(chunk.columns),
+        'missing_values': detect_missing_values(chunk),
+        'duplicates': duplicate_hash_counts(chunk)
+    }
+
+    if 'Project_Title' in chunk.columns:
+        partial['title_counts'] = title_value_counts(chunk)
+
+    if 'Award_Amount' in chunk.columns:
+        awards = pd.to_numeric(chunk['Award_Amount'], errors='coerce').dropna().to_numpy(dtype=np.float64)
+        partial['awards'] = {
+            'negative_count': int((awards < 0).sum()),
+            'zero_count': int((awards == 0).sum()),
+            'sum': float(awards.sum()),
+            'moments': _moments(awards),
+            'sketch': quantile_sketch(awards)
+        }
+
+    expected_min, expected_max = EXPECTED_DATE_RANGE
+    partial['dates'] = {}
+    for col in find_date_columns(chunk):
+        dates = parse_dates(chunk[col])
+        partial['dates'][col] = {
+            'min_date': dates.min(),
+            'max_date': dates.max(),
+            'outside_range_count': int(((dates < expected_min) | (dates > expected_max)).sum())
+        }
+    return partial
+
+def merge_quality_partials(left, right):
+    """Combine two partials as if their rows had been assessed together"""
+    merged = {
+        'rows': left['rows'] + right['rows'],
+        'chunks': left['chunks'] + right['chunks'],
+        'columns': left['columns'] + [col for col in right['columns'] if col not in left['columns']],
+        'missing_values': merge_missing_counts(left['missing_values'], right['missing_values']),
+        'duplicates': merge_duplicate_hash_counts(left['duplicates'], right['duplicates'])
+    }
+
+    title_counts = [side['title_counts'] for side in (left, right) if 'title_counts' in side]
+    if title_counts:
+        merged['title_counts'] = title_counts[0] if len(title_counts) == 1 else merge_title_counts(*title_counts)
+
+    awards = [side['awards'] for side in (left, right) if 'awards' in side]
+    if len(awards) == 2:
+        merged['awards'] = {
+            'negative_count': awards[0]['negative_count'] + awards[1]['negative_count'],
+            'zero_count': awards[0]['zero_count'] + awards[1]['zero_count'],
+            'sum': awards[0]['sum'] + awards[1]['sum'],
+            'moments': _merge_moments(awards[0]['moments'], awards[1]['moments']),
+            'sketch': merge_quantile_sketches(awards[0]['sketch'], awards[1]['sketch'])
+        }
+    elif awards:
+        merged['awards'] = awards[0]
+
+    merged['dates'] = {}
+    for col in {**left['dates'], **right['dates']}:
+        ranges = [side['dates'][col] for side in (left, right) if col in side['dates']]
+        merged['dates'][col] = {
+            'min_date': pd.Series([r['min_date'] for r in ranges], dtype='datetime64[ns]').min(),
+            'max_date': pd.Series([r['max_date'] for r in ranges], dtype='datetime64[ns]').max(),
+            'outside_range_count': sum(r['outside_range_count'] for r in ranges)
+        }
+    return merged
+
+def finalise_quality_partial(partial, threshold=NEAR_DUPLICATE_THRESHOLD):
+    """quality_results in the shape assess_data_quality() returns, from a merged partial.
+
+    Counts are exact. The award median and z-score outlier count come from the quantile
+    sketch (median within QUANTILE_SKETCH_ACCURACY) and are listed under
+    award_analysis['approximate'].
+    """
+    total_records = partial['rows']
+    quality_results = {'missing_values': missing_values_report(partial['missing_values'], total_records)}
+    quality_results['missing_patterns'] = summarise_missing_patterns(quality_results['missing_values'])
+    quality_results['duplicate_analysis'] = summarise_duplicate_hash_counts(
+        partial['duplicates'], partial.get('title_counts'), threshold)
+
+    if 'awards' in partial:
+        awards = partial['awards']
+        count, mean, squared_deviations = awards['moments']
+        std = np.sqrt(squared_deviations / count) if count else np.nan
+        quality_results['award_analysis'] = {
+            'negative_count': awards['negative_count'],
+            'zero_count': awards['zero_count'],
+            'mean_award': awards['sum'] / count if count else np.nan,
+            'median_award': sketch_quantile(awards['sketch'], 0.5),
+            'outliers_count': sketch_count_outside(awards['sketch'], mean - 3 * std, mean + 3 * std) if std > 0 else 0,
+            'approximate': ['median_award', 'outliers_count']
+        }
+
+    quality_results['date_analysis'] = partial['dates']
+    quality_results['overall_score'] = score_quality(quality_results, total_records, len(partial['columns']))
+    quality_results['streaming'] = {'rows': total_records, 'chunks': partial['chunks']}
     return quality_results
 
+@timed('quality.assess_streaming')
+def assess_data_quality_streaming(chunks, threshold=NEAR_DUPLICATE_THRESHOLD):
+    """assess_data_quality() over an iterable of row chunks, e.g. iter_portfolio_chunks(path).
+
+    Only one chunk is held at a time, plus state that grows with distinct keys rather than
+    rows: 16 bytes per distinct Project_ID and whole-row hash, and the distinct titles for
+    near-duplicate clustering. Multi-year exports can be assessed by chaining their chunk
+    iterators.
+    """
+    partial = None
+    for chunk in chunks:
+        chunk_partial = quality_partial(chunk)
+        partial = chunk_partial if partial is None else merge_quality_partials(partial, chunk_partial)
+    if partial is None:
+        raise ValueError("No portfolio rows to assess")
+    return finalise_quality_partial(partial, threshold)
+
+# Incremental recomputation - a new workbook version updates additive aggregates from its changed rows
+STATUS_GROUP_COLUMNS = ['Programme', 'Lead_Organisation']
+
+def build_portfolio_aggregates(df, key='Project_ID'):
+    """Additive aggregates behind the missing-value, duplicate and success tables.
+
+    Holds raw detect_missing_values() counts, duplicate_hash_counts(), a
+    status_count_table() per STATUS_GROUP_COLUMNS entry and, when ``key`` is a unique
+    non-null identifier, a stable hash of each row's other columns by key so the next
+    version can be diffed.
+    """
+    column_hashes, row_hashes = stable_row_hashes(df)
+    aggregates = {
+        'rows': len(df),
+        'missing_values': detect_missing_values(df),
+        'duplicates': duplicate_hash_counts(df, (column_hashes, row_hashes)),
+        'status_counts': {
+            col: status_count_table(df, col)
+            for col in STATUS_GROUP_COLUMNS if col in df.columns and 'Project_Status' in df.columns
+        },
+        'row_hashes': None
+    }
+    if key in df.columns:
+        keys = pd.Index(df[key])
+        if keys.is_unique and not keys.hasnans:
+            content_hashes = _combine_hashes([hashes for col, hashes in column_hashes.items() if col != key], len(df))
+            aggregates['row_hashes'] = pd.Series(content_hashes, index=keys)
+    return aggregates
+
+def diff_portfolio(previous_aggregates, previous_df, df, key='Project_ID'):
+    """Rows of ``df`` that are new or changed since ``previous_df``, matched on ``key``.
+
+    Rows are compared by a stable hash of their non-key columns, so only ``df`` is hashed,
+    and an export that keeps the previous rows in order (appended awards) is aligned
+    without a key lookup. Returns 'incoming'
+    (new and changed rows of ``df``), 'outgoing' (removed rows and the old state of changed
+    rows), the new 'row_hashes' and a 'summary' of added/changed/removed counts - or None
+    when the key is missing or not unique, or the columns changed, and a full rebuild is
+    needed.
+    """
+    previous_hashes = previous_aggregates['row_hashes']
+    if previous_hashes is None or key not in df.columns or list(previous_df.columns) != list(df.columns):
+        return None
+    keys = pd.Index(df[key])
+    if not keys.is_unique or keys.hasnans:
+        return None
+
+    _, row_hashes = stable_row_hashes(df, [col for col in df.columns if col != key])
+    previous_keys = previous_hashes.index
+    if len(keys) >= len(previous_keys) and keys[:len(previous_keys)].equals(previous_keys):
+        positions = np.arange(len(keys))
+        positions[len(previous_keys):] = -1
+    else:
+        positions = previous_keys.get_indexer(keys)
+    matched = positions >= 0
+    changed = matched.copy()
+    changed[matched] = previous_hashes.to_numpy()[positions[matched]] != row_hashes[matched]
+    unchanged = np.zeros(len(previous_df), dtype=bool)
+    unchanged[positions[matched & ~changed]] = True
+
+    return {
+        'incoming': df.iloc[np.flatnonzero(~matched | changed)],
+        'outgoing': previous_df.iloc[np.flatnonzero(~unchanged)],
+        'row_hashes': pd.Series(row_hashes, index=keys),
+        'summary': {
+            'added': int((~matched).sum()),
+            'changed': int(changed.sum()),
+            'removed': int(len(previous_df) - matched.sum())
+        }
+    }
+
+def merge_status_counts(left, right, sign=1):
+    """Add (or subtract) status_count_table() results, keeping ``left``'s group order; empty groups are dropped"""
+    merged = pd.concat([left, sign * right]).fillna(0).groupby(level=0, sort=False).sum().astype(np.int64)
+    return merged[merged.sum(axis=1) > 0]
+
+def update_portfolio_aggregates(aggregates, delta):
+    """Aggregates of the new version: the previous aggregates plus incoming rows minus outgoing rows"""
+    updated = {**aggregates, 'status_counts': dict(aggregates['status_counts'])}
+    for rows, sign in ((delta['incoming'], 1), (delta['outgoing'], -1)):
+        if len(rows) == 0:
+            continue
+        part = build_portfolio_aggregates(rows)
+        updated['rows'] += sign * part['rows']
+        updated['missing_values'] = merge_missing_counts(updated['missing_values'], part['missing_values'], sign)
+        updated['duplicates'] = merge_duplicate_hash_counts(updated['duplicates'], part['duplicates'], sign)
+        for col, table in part['status_counts'].items():
+            current = updated['status_counts'].get(col)
+            updated['status_counts'][col] = table if current is None else merge_status_counts(current, table, sign)
+    updated['row_hashes'] = delta['row_hashes']
+    updated['delta'] = delta['summary']
+    return updated
+
+@dataset_cache(shared=True, max_entries=4)
+def _cached_portfolio_aggregates(dataset_version, _df, _previous=None):
+    if _previous is not None:
+        return update_portfolio_aggregates(*_previous)
+    return build_portfolio_aggregates(_df)
+
+def get_portfolio_aggregates(df, previous=None):
+    """Additive aggregates of ``df``, built once per dataset version and shared read-only.
+
+    ``previous`` - (previous version's aggregates, diff_portfolio() delta) - builds this
+    version's entry from the changed rows alone; carry_forward_aggregates() supplies it.
+    """
+    return _cached_portfolio_aggregates(get_dataset_version(df), df, previous)
+
+def carry_forward_aggregates(previous_df, previous_geo_df, df, geo_df):
+    """Seed the new version's aggregates from the version it replaces plus the changed rows.
+
+    The constituency cube is carried forward only when the geographical lookups are
+    unchanged. Returns the added/changed/removed summary, or None if a full rebuild is
+    needed (it then happens on first use, as before).
+    """
+    previous_aggregates = get_portfolio_aggregates(previous_df)
+    delta = diff_portfolio(previous_aggregates, previous_df, df)
+    if delta is None:
+        return None
+    get_portfolio_aggregates(df, previous=(previous_aggregates, delta))
+
+    if previous_geo_df.equals(geo_df):
+        previous_cube = get_constituency_cube(previous_df, previous_geo_df)
+        if previous_cube is not None:
+            get_constituency_cube(df, geo_df, previous=(previous_cube, delta))
+    return delta['summary']
+
+@timed('chart.missing_values')
 def create_missing_values_chart(quality_results):
     """Create improved missing values chart with better readability"""
     missing_data = quality_results['missing_values']
@@ -845,6 +2263,7 @@ def create_missing_values_chart(quality_results):
     
     return fig
 
+@timed('chart.quality_scorecard')
 def create_quality_scorecard(quality_results):
     """Create quality scorecard visualization"""
     scores = quality_results['overall_score']
@@ -879,44 +2298,156 @@ def create_quality_scorecard(quality_results):
     return fig
 
 
-def create_geographical_distribution_chart(df, geo_df):
-    """Create clean geographical distribution analysis"""
+def find_postcode_column(df):
+    """Return the portfolio's postcode column, or None if it has none"""
+    postcode_cols = [col for col in df.columns if 'postcode' in col.lower() or 'Postcode' in col]
+    return postcode_cols[0] if postcode_cols else None
+
+# Lookup columns carried from the 'Geographical Lookups' sheet onto the portfolio
+GEO_LOOKUP_COLUMNS = ['Parliamentary Constituency', 'English Region', 'Devolved Administration']
+
+def normalise_postcodes(postcodes):
+    """Upper-case and strip postcodes the way the geographical join expects"""
+    return postcodes.astype(str).str.strip().str.upper()
+
+def postcode_outward_codes(postcodes):
+    """Outward code of each normalised postcode, e.g. 'SO16 7AB' -> 'SO16'.
+
+    The inward code is always the last three characters, so this also handles
+    postcodes written without the space.
+    """
+    compact = postcodes.str.replace(r'\s+', '', regex=True)
+    return compact.str[:-3]
+
+@timed('geo.postcode_index')
+def build_postcode_index(geo_df):
+    """Index the geographical lookups by normalised postcode, built once per dataset version.
+
+    Returns a dict holding:
+    - 'postcodes': unique normalised postcodes sorted by outward code, then postcode
+      (first occurrence wins for duplicates)
+    - 'outward': the outward code of each entry of 'postcodes', so sorted too
+    - 'codes': per lookup column, an int32 array aligned with 'postcodes' (-1 = blank)
+    - 'categories': per lookup column, the distinct values the codes point into
+    """
     if geo_df.empty or 'Postcodes' not in geo_df.columns or 'Parliamentary Constituency' not in geo_df.columns:
         return None
 
-    try:
-        # Clean column names
-        geo_df_clean = geo_df.copy()
-        geo_df_clean.columns = geo_df_clean.columns.str.strip()
+    keys = normalise_postcodes(geo_df['Postcodes'])
+    outward = postcode_outward_codes(keys).to_numpy()
+    first_rows = np.flatnonzero(~keys.duplicated().to_numpy())
+    first_rows = first_rows[np.argsort(keys.to_numpy()[first_rows], kind='stable')]
+    first_rows = first_rows[np.argsort(outward[first_rows], kind='stable')]
+    postcodes = pd.Index(keys.to_numpy()[first_rows], name='Postcodes')
+
+    codes, categories = {}, {}
+    for col in GEO_LOOKUP_COLUMNS:
+        if col in geo_df.columns:
+            col_codes, col_categories = pd.factorize(geo_df[col].to_numpy()[first_rows], sort=True)
+            codes[col] = col_codes.astype(np.int32)
+            categories[col] = pd.Index(col_categories, name=col)
+
+    return {
+        'postcodes': postcodes,
+        'outward': outward[first_rows],
+        'codes': codes,
+        'categories': categories
+    }
 
-        # Find postcode column in main dataset
-        postcode_cols = [col for col in df.columns if 'postcode' in col.lower() or 'Postcode' in col]
-        if not postcode_cols:
-            return None
+def outward_code_range(outward_codes, outward_code):
+    """Slice of the sorted ``outward_codes`` holding one outward code ('SO16') or a whole area ('SO').
 
-        postcode_col = postcode_cols[0]
-        df_clean = df.copy()
-        df_clean[postcode_col] = df_clean[postcode_col].astype(str).str.strip().str.upper()
+    An area is its letters followed by a digit, so 'S' never picks up 'SO16'; both are a
+    pair of binary searches.
+    """
+    code = outward_code.strip().upper().replace(' ', '')
+    low, high = (code + '0', code + ':') if code.isalpha() else (code, code)  # ':' sorts after '9'
+    return slice(int(outward_codes.searchsorted(low, side='left')), int(outward_codes.searchsorted(high, side='right')))
+
+def lookup_outward_code(postcode_index, outward_code):
+    """Geographical lookups, with their 'Outward Code', for one outward code ('SO16') or a whole area ('SO')"""
+    positions = outward_code_range(postcode_index['outward'], outward_code)
+    lookup = pd.DataFrame({'Postcodes': postcode_index['postcodes'][positions],
+                           'Outward Code': postcode_index['outward'][positions]})
+    for col, col_codes in postcode_index['codes'].items():
+        lookup[col] = pd.Categorical.from_codes(col_codes[positions], postcode_index['categories'][col])
+    return lookup
+
+@dataset_cache(shared=True, max_entries=4)
+def _cached_postcode_index(dataset_version, _geo_df):
+    return build_postcode_index(_geo_df)
+
+def get_postcode_index(geo_df):
+    """Postcode index for this version of the lookup sheet, shared read-only"""
+    return _cached_postcode_index(get_dataset_version(geo_df), geo_df)
+
+@timed('geo.enrich_portfolio')
+def build_geo_enriched_portfolio(df, geo_df):
+    """Attach geography to the portfolio by looking up the normalised postcode.
+
+    The result keeps every portfolio column (postcode upper-cased and stripped) and adds
+    Parliamentary Constituency plus English Region / Devolved Administration when the
+    lookup sheet has them, as categoricals decoded straight from the postcode index.
+    Lookup columns that clash with portfolio columns get a ``_geo`` suffix so the
+    portfolio's own values are unchanged.
+    """
+    postcode_index = get_postcode_index(geo_df)
+    if postcode_index is None:
+        return None
 
-        # Merge with geographical data
-        merged_df = df_clean.merge(
-            geo_df_clean[['Postcodes', 'Parliamentary Constituency']],
-            left_on=postcode_col,
-            right_on='Postcodes',
-            how='left'
-        )
+    postcode_col = find_postcode_column(df)
+    if postcode_col is None:
+        return None
+
+    # Clean postcodes for matching
+    enriched = df.copy()
+    enriched[postcode_col] = normalise_postcodes(enriched[postcode_col])
+
+    # Resolve each distinct postcode once, then broadcast the positions to every row
+    row_ids, distinct = pd.factorize(enriched[postcode_col])
+    positions = np.append(postcode_index['postcodes'].get_indexer(distinct), -1)[row_ids]
+    matched = positions >= 0
+
+    for col, col_codes in postcode_index['codes'].items():
+        row_codes = np.where(matched, col_codes[positions], -1)
+        target = f'{col}_geo' if col in enriched.columns else col
+        enriched[target] = pd.Categorical.from_codes(row_codes, postcode_index['categories'][col])
+
+    return enriched
+
+@dataset_cache(shared=True, max_entries=4)
+def _cached_geo_enriched_portfolio(dataset_version, _df, _geo_df):
+    return build_geo_enriched_portfolio(_df, _geo_df)
+
+def get_geo_enriched_portfolio(df, geo_df):
+    """Portfolio + geography frame, built once per dataset version and shared read-only.
+
+    Every caller receives the same object, so treat it as immutable: filter or copy it,
+    never assign into it.
+    """
+    return _cached_geo_enriched_portfolio(get_dataset_version(df, geo_df), df, geo_df)
+
+@timed('chart.geographical_distribution')
+def create_geographical_distribution_chart(df, geo_df, filters=None):
+    """Create clean geographical distribution analysis of the projects inside ``filters``"""
+    if geo_df.empty or 'Postcodes' not in geo_df.columns or 'Parliamentary Constituency' not in geo_df.columns:
+        return None
+
+    try:
+        # Shared postcode -> constituency join
+        merged_df = get_geo_enriched_portfolio(df, geo_df)
+        if merged_df is None:
+            return None
 
         # Filter valid constituencies
+        merged_df = filter_rows(merged_df, df, geo_df, filters)
         valid_constituencies = merged_df[merged_df['Parliamentary Constituency'].notna()]
         if len(valid_constituencies) == 0:
             return None
 
-        # Calculate constituency statistics
-        constituency_stats = valid_constituencies.groupby('Parliamentary Constituency').agg({
-            'Project_ID': 'count',
-            'Award_Amount': 'sum'
-        }).reset_index()
-        constituency_stats.columns = ['Constituency', 'Project_Count', 'Total_Funding']
+        # Constituency statistics from the cube, already in project-rank order
+        rankings = get_constituency_rankings(df, geo_df, filters)
+        constituency_stats = rankings['constituency_stats'][['Constituency', 'Project_Count', 'Total_Funding', 'Funding_Rank']]
 
         # Create figure with 2x2 subplots
         fig = make_subplots(
@@ -930,7 +2461,7 @@ def create_geographical_distribution_chart(df, geo_df):
         )
 
         # 1. Top 10 by Projects (including Southampton, Test if ranked 11th)
-        projects_ranked = constituency_stats.sort_values('Project_Count', ascending=False).reset_index(drop=True)
+        projects_ranked = constituency_stats
         
         # Check if Southampton, Test is in top 10
         top_10_projects = projects_ranked.head(10)
@@ -981,7 +2512,7 @@ def create_geographical_distribution_chart(df, geo_df):
         )
 
         # 2. Top 10 by Funding
-        funding_ranked = constituency_stats.sort_values('Total_Funding', ascending=False).reset_index(drop=True)
+        funding_ranked = constituency_stats.sort_values('Funding_Rank').reset_index(drop=True)
         top_10_funding = funding_ranked.head(10)
         
         # Colors: Orange for Southampton, Test; Green for others
@@ -1014,10 +2545,11 @@ def create_geographical_distribution_chart(df, geo_df):
         )
 
         # 3. Regional Distribution
-        region_cols = [col for col in valid_constituencies.columns if 'region' in col.lower() or 'Region' in col]
+        # Regions come from the portfolio's own columns, as before the shared join
+        region_cols = [col for col in df.columns if 'region' in col.lower() or 'Region' in col]
         if region_cols:
             region_col = region_cols[0]
-            region_stats = valid_constituencies.groupby(region_col)['Project_ID'].count()
+            region_stats = valid_constituencies.groupby(region_col, observed=True)['Project_ID'].count()
             
             if len(region_stats) > 0:
                 region_colors = {
@@ -1059,10 +2591,10 @@ def create_geographical_distribution_chart(df, geo_df):
                 )
         else:
             # Check for devolved administration data
-            dev_admin_cols = [col for col in valid_constituencies.columns if 'devolved' in col.lower() or 'administration' in col.lower() or 'Administration' in col]
+            dev_admin_cols = [col for col in df.columns if 'devolved' in col.lower() or 'administration' in col.lower() or 'Administration' in col]
             if dev_admin_cols:
                 dev_col = dev_admin_cols[0]
-                dev_stats = valid_constituencies.groupby(dev_col)['Project_ID'].count()
+                dev_stats = valid_constituencies.groupby(dev_col, observed=True)['Project_ID'].count()
                 
                 fig.add_trace(
                     go.Pie(
@@ -1210,6 +2742,7 @@ def create_geographical_distribution_chart(df, geo_df):
         st.error(f"Error in geographical analysis: {str(e)}")
         return None
 
+@timed('chart.award_distribution')
 def create_award_distribution_chart(df):
     """Create award distribution analysis"""
     if 'Award_Amount' in df.columns:
@@ -1247,7 +2780,7 @@ def create_award_distribution_chart(df):
         
         # Top programmes by value
         if 'Programme' in df.columns:
-            prog_values = df.groupby('Programme')['Award_Amount'].sum().sort_values(ascending=True)
+            prog_values = df.groupby('Programme', observed=True)['Award_Amount'].sum().sort_values(ascending=True)
             fig.add_trace(
                 go.Bar(x=prog_values.values, y=prog_values.index, orientation='h',
                        name='Programme Values'),
@@ -1260,14 +2793,12 @@ def create_award_distribution_chart(df):
     
     return None
 
+@timed('chart.timeline')
 def create_timeline_chart(df):
     """Create project timeline analysis"""
     if 'Start_Date' in df.columns:
-        # Convert to datetime
-        df['Start_Date'] = pd.to_datetime(df['Start_Date'], errors='coerce')
-        
-        # Extract year and count projects
-        yearly_counts = df['Start_Date'].dt.year.value_counts().sort_index()
+        # Count projects per start year
+        yearly_counts = get_date_fields(df)['start_year'].value_counts().sort_index()
         
         fig = go.Figure()
         
@@ -1292,72 +2823,48 @@ def create_timeline_chart(df):
     
     return None
 
+@timed('geo.southampton_analysis')
 def create_southampton_analysis(df, geo_df):
     """Create comprehensive Southampton analysis with rankings and comparisons"""
     try:
-        # Get all constituency data for ranking
-        all_constituency_data = get_constituency_rankings(df, geo_df)
-
         # Method 1: Use SO Postcodes for complete Southampton area (PRIMARY METHOD)
         if not geo_df.empty and 'Postcodes' in geo_df.columns and 'Parliamentary Constituency' in geo_df.columns:
-            # Clean column names
-            geo_df_clean = geo_df.copy()
-            geo_df_clean.columns = geo_df_clean.columns.str.strip()
-
             # Find postcode column in main dataset
-            postcode_cols = [col for col in df.columns if 'postcode' in col.lower() or 'Postcode' in col]
-            if postcode_cols:
-                postcode_col = postcode_cols[0]
-
-                # Clean postcodes for matching
-                df_clean = df.copy()
-                df_clean[postcode_col] = df_clean[postcode_col].astype(str).str.strip().str.upper()
-
-                # Perform the join
-                merged_df = df_clean.merge(
-                    geo_df_clean[['Postcodes', 'Parliamentary Constituency']],
-                    left_on=postcode_col,
-                    right_on='Postcodes',
-                    how='left'
-                )
+            postcode_col = find_postcode_column(df)
+            if postcode_col:
+                # Shared postcode -> constituency join (postcodes already normalised) and its bitmaps
+                merged_df = get_geo_enriched_portfolio(df, geo_df)
+                index = get_bitmap_index(df, geo_df)
 
                 # PRIMARY METHOD: Focus on Southampton, Test constituency as requested
-                southampton_test = merged_df[merged_df['Parliamentary Constituency'] == 'Southampton, Test']
+                southampton_test = bitmap_rows(merged_df, index, bitmap(index, 'Parliamentary Constituency', ['Southampton, Test']))
+                test_method = 'Parliamentary Constituency'
+                if len(southampton_test) == 0:
+                    # No postcode joined exactly: take the SO outward codes the lookup places in Southampton, Test
+                    so_lookup = lookup_outward_code(get_postcode_index(geo_df), 'SO')
+                    test_outward = so_lookup.loc[so_lookup['Parliamentary Constituency'] == 'Southampton, Test', 'Outward Code'].unique()
+                    southampton_test = bitmap_rows(merged_df, index, outward_code_bitmap(index, test_outward))
+                    test_method = f'SO Outward Codes ({", ".join(test_outward)})'
                 southampton_projects = southampton_test  # Focus specifically on Southampton, Test
                 
                 # Secondary analysis: Also get Itchen for comparison
-                southampton_itchen = merged_df[merged_df['Parliamentary Constituency'] == 'Southampton, Itchen']
+                southampton_itchen = bitmap_rows(merged_df, index, bitmap(index, 'Parliamentary Constituency', ['Southampton, Itchen']))
                 
                 # Also get SO postcodes for reference
-                so_projects = df_clean[df_clean[postcode_col].astype(str).str.startswith('SO', na=False)]
+                so_projects = bitmap_rows(merged_df, index, outward_code_bitmap(index, ['SO']))
                 
-                print(f"Southampton analysis - FOCUSED ON SOUTHAMPTON, TEST:")
-                print(f"- PRIMARY: Southampton, Test constituency: {len(southampton_test)} projects")
-                print(f"- REFERENCE: Southampton, Itchen constituency: {len(southampton_itchen)} projects")
-                print(f"- REFERENCE: All SO Postcodes: {len(so_projects)} projects")
-                print(f"- ANALYSIS FOCUS: Southampton, Test only")
-                
-                # Force refresh by clearing any cached data
-                st.cache_data.clear()  # Clear Streamlit cache
-                st.session_state.clear()  # Clear session state
+                debug_log.debug("Southampton analysis: Test %d projects, Itchen %d (reference), SO postcodes %d (reference)",
+                                len(southampton_test), len(southampton_itchen), len(so_projects))
 
-                match_method = f'Parliamentary Constituency - Southampton, Test ({len(southampton_test)} projects - Updated {pd.Timestamp.now().strftime("%Y%m%d_%H%M%S")})'
+                match_method = f'{test_method} - Southampton, Test ({len(southampton_test)} projects - Updated {pd.Timestamp.now().strftime("%Y%m%d_%H%M%S")})'
             else:
-                # Enhanced fallback: Try multiple organization column patterns
-                org_cols = [col for col in df.columns if 'organisation' in col.lower() or 'Organisation' in col or 'Lead' in col or 'Contract' in col]
-                southampton_matches = []
-
-                for col in org_cols:
-                    if col in df.columns:
-                        # Try case-insensitive matching
-                        matches = df[df[col].astype(str).str.contains('southampton', case=False, na=False)]
-                        southampton_matches.extend(matches.index.tolist())
-
-                if southampton_matches:
-                    southampton_projects = df.loc[list(set(southampton_matches))]  # Remove duplicates
-                    match_method = f'Enhanced Organisation Search ({len(southampton_matches)} matches found)'
-                    print(f"Southampton analysis: Found {len(southampton_matches)} matches across {len(org_cols)} organization columns")
-                    print(f"Columns searched: {org_cols}")
+                # Enhanced fallback: organisation-name token index (each matching row once)
+                southampton_projects = match_organisations(df, get_bitmap_index(df, geo_df), 'southampton')
+
+                if len(southampton_projects) > 0:
+                    match_method = f'Enhanced Organisation Search ({len(southampton_projects)} matches found)'
+                    debug_log.debug("Southampton analysis: %d organisation matches across columns %s",
+                                    len(southampton_projects), organisation_columns(df))
                 else:
                     southampton_projects = df.sample(n=min(240, len(df)))
                     match_method = 'Sample Data'
@@ -1366,44 +2873,29 @@ def create_southampton_analysis(df, geo_df):
             postcode_cols = [col for col in df.columns if 'postcode' in col.lower() or 'Postcode' in col]
             
             if postcode_cols:
-                # Try SO postcode method first
-                postcode_col = postcode_cols[0]
-                df_clean = df.copy()
-                so_projects = df_clean[df_clean[postcode_col].astype(str).str.startswith('SO', na=False)]
+                # Try SO postcode method first (outward codes of the SO area, from the bitmap index)
+                index = get_bitmap_index(df)
+                so_projects = bitmap_rows(df, index, outward_code_bitmap(index, ['SO']))
                 
                 if len(so_projects) > 0:
                     southampton_projects = so_projects
                     match_method = f'SO Postcodes - Complete Southampton Area ({len(so_projects)} projects)'
-                    print(f"Southampton analysis: Using SO postcode method - {len(so_projects)} projects found")
+                    debug_log.debug("Southampton analysis: SO postcode method found %d projects", len(so_projects))
                 else:
                     # Fallback to organization search
-                    org_cols = [col for col in df.columns if 'organisation' in col.lower() or 'Organisation' in col or 'Lead' in col or 'Contract' in col]
-                    southampton_matches = []
+                    southampton_projects = match_organisations(df, index, 'southampton')
 
-                    for col in org_cols:
-                        if col in df.columns:
-                            matches = df[df[col].astype(str).str.contains('southampton', case=False, na=False)]
-                            southampton_matches.extend(matches.index.tolist())
-
-                    if southampton_matches:
-                        southampton_projects = df.loc[list(set(southampton_matches))]
-                        match_method = f'Enhanced Organisation Search ({len(southampton_matches)} matches found)'
+                    if len(southampton_projects) > 0:
+                        match_method = f'Enhanced Organisation Search ({len(southampton_projects)} matches found)'
                     else:
                         southampton_projects = df.sample(n=min(280, len(df)))
                         match_method = 'Sample Data'
             else:
                 # No postcode column, use organization matching
-                org_cols = [col for col in df.columns if 'organisation' in col.lower() or 'Organisation' in col or 'Lead' in col or 'Contract' in col]
-                southampton_matches = []
-
-                for col in org_cols:
-                    if col in df.columns:
-                        matches = df[df[col].astype(str).str.contains('southampton', case=False, na=False)]
-                        southampton_matches.extend(matches.index.tolist())
+                southampton_projects = match_organisations(df, get_bitmap_index(df), 'southampton')
 
-                if southampton_matches:
-                    southampton_projects = df.loc[list(set(southampton_matches))]
-                    match_method = f'Enhanced Organisation Search ({len(southampton_matches)} matches found)'
+                if len(southampton_projects) > 0:
+                    match_method = f'Enhanced Organisation Search ({len(southampton_projects)} matches found)'
                 else:
                     southampton_projects = df.sample(n=min(280, len(df)))
                     match_method = 'Sample Data'
@@ -1412,166 +2904,359 @@ def create_southampton_analysis(df, geo_df):
             southampton_projects = df.sample(n=min(280, len(df)))
             match_method = 'Sample Data'
 
-        # Key metrics
-        total_projects = len(southampton_projects)
-        total_value = southampton_projects['Award_Amount'].sum() if 'Award_Amount' in southampton_projects.columns else 0
-        mean_award = southampton_projects['Award_Amount'].mean() if 'Award_Amount' in southampton_projects.columns else 0
-        # Calculate median award specifically for Southampton, Test projects
-        median_award = southampton_projects['Award_Amount'].median() if 'Award_Amount' in southampton_projects.columns else 0
-
-        # Get Southampton's ranking based on SO postcode totals (280 projects)
-        southampton_ranking = None
-        if all_constituency_data is not None and total_projects > 0:
-            constituency_stats = all_constituency_data['constituency_stats'].copy()
-            
-            # Use the SAME calculation method as the chart to ensure consistency
-            # Add Southampton, Test as entry for accurate ranking (matching chart logic)
-            southampton_test_row = pd.DataFrame({
-                'Constituency': ['Southampton, Test'],
-                'Project_Count': [total_projects],
-                'Total_Funding': [total_value]
-            })
-            
-            # Remove individual Southampton constituencies and add combined entry (SAME AS CHART)
-            non_southampton_stats = constituency_stats[~constituency_stats['Constituency'].str.contains('Southampton', na=False)]
-            all_stats_with_combined = pd.concat([southampton_test_row, non_southampton_stats], ignore_index=True)
-            
-            # Calculate rankings using SAME method as chart
-            projects_ranked = all_stats_with_combined.sort_values('Project_Count', ascending=False).reset_index(drop=True)
-            funding_ranked = all_stats_with_combined.sort_values('Total_Funding', ascending=False).reset_index(drop=True)
-            
-            # Use SAME indexing method as chart (line 1116)
-            southampton_projects_rank = projects_ranked[projects_ranked['Constituency'].str.contains('Southampton, Test', na=False)].index[0] + 1
-            southampton_funding_rank = funding_ranked[funding_ranked['Constituency'].str.contains('Southampton, Test', na=False)].index[0] + 1
-            
-            # DEBUG: Print Southampton analysis ranking
-            print(f"=== SOUTHAMPTON ANALYSIS DEBUG ===")
-            print(f"Analysis: Southampton, Test funding rank = #{southampton_funding_rank}")
-            print(f"Analysis: Southampton, Test projects rank = #{southampton_projects_rank}")
-            print(f"Analysis: Total constituencies = {len(all_stats_with_combined)}")
-            
-            # Print top 10 from analysis for comparison
-            print("=== ANALYSIS TOP 10 FUNDING ===")
-            for i, row in funding_ranked.head(10).iterrows():
-                rank = i + 1
-                constituency = row['Constituency']
-                funding = row['Total_Funding']
-                if 'Southampton' in constituency:
-                    print(f"*** ANALYSIS RANK #{rank}: {constituency} - £{funding/1e6:.1f}M ***")
-                else:
-                    print(f"ANALYSIS RANK #{rank}: {constituency} - £{funding/1e6:.1f}M")
-            print("=== END ANALYSIS DEBUG ===")
-            
-            southampton_ranking = {
-                'projects_rank': southampton_projects_rank,
-                'funding_rank': southampton_funding_rank,
-                'total_constituencies': len(all_stats_with_combined)
-            }
-
-        # Timeline analysis
-        date_cols = [col for col in southampton_projects.columns if 'date' in col.lower() or 'Date' in col]
-        if date_cols:
-            southampton_projects['Start_Date'] = pd.to_datetime(southampton_projects[date_cols[0]], errors='coerce')
-            yearly_trend = southampton_projects['Start_Date'].dt.year.value_counts().sort_index()
-        else:
-            yearly_trend = pd.Series(dtype=int)
-
-        # Programme mix
-        prog_cols = [col for col in southampton_projects.columns if 'programme' in col.lower() or 'Programme' in col or 'type' in col.lower()]
-        if prog_cols:
-            programme_mix = southampton_projects[prog_cols[0]].value_counts()
-        else:
-            programme_mix = pd.Series(dtype=int)
-
-        # Status distribution
-        status_cols = [col for col in southampton_projects.columns if 'status' in col.lower() or 'Status' in col]
-        if status_cols:
-            status_dist = southampton_projects[status_cols[0]].value_counts()
-        else:
-            status_dist = pd.Series(dtype=int)
-
-        return {
-            'total_projects': total_projects,
-            'total_value': total_value,
-            'mean_award': mean_award,
-            'median_award': median_award,
-            'yearly_trend': yearly_trend,
-            'programme_mix': programme_mix,
-            'status_dist': status_dist,
-            'data': southampton_projects,
-            'constituency_match_method': match_method,
-            'ranking': southampton_ranking,
-            'so_projects_ref': so_projects if 'so_projects' in locals() else [],
-            'all_constituency_data': all_constituency_data
-        }
+        so_projects_ref = so_projects if 'so_projects' in locals() else []
+        return summarise_southampton_projects(df, geo_df, southampton_projects, match_method, so_projects_ref)
 
     except Exception as e:
         st.error(f"Error in Southampton analysis: {str(e)}")
         st.error(f"Available columns: {list(df.columns)}")
         return None
 
-def get_constituency_rankings(df, geo_df):
-    """Get comprehensive constituency rankings for comparison"""
-    try:
-        if geo_df.empty or 'Postcodes' not in geo_df.columns or 'Parliamentary Constituency' not in geo_df.columns:
-            return None
+def summarise_southampton_projects(df, geo_df, southampton_projects, match_method, so_projects_ref, filters=None):
+    """Metrics, rankings, timeline and mixes of the Southampton projects (within ``filters``)"""
+    # Get all constituency data for ranking
+    all_constituency_data = get_constituency_rankings(df, geo_df, filters)
+
+    # Key metrics
+    total_projects = len(southampton_projects)
+    total_value = southampton_projects['Award_Amount'].sum() if 'Award_Amount' in southampton_projects.columns else 0
+    has_awards = 'Award_Amount' in southampton_projects.columns and total_projects > 0
+    mean_award = southampton_projects['Award_Amount'].mean() if has_awards else 0
+    # Calculate median award specifically for Southampton, Test projects
+    median_award = southampton_projects['Award_Amount'].median() if has_awards else 0
+
+    # Get Southampton's ranking based on SO postcode totals (280 projects)
+    southampton_ranking = None
+    if all_constituency_data is not None and total_projects > 0:
+        cube = get_constituency_cube(df, geo_df)
+        projects_ranking = cube_ranking(cube, 'projects', **active_filters(filters))
+        funding_ranking = cube_ranking(cube, 'funding', **active_filters(filters))
+
+        # Southampton, Test stands in for every Southampton seat with this analysis's totals
+        # (the same combined entry as the chart), so those seats are left out of the comparison
+        constituencies = cube['axes']['constituency']
+        southampton_seats = np.flatnonzero(constituencies.str.contains('Southampton', na=False))
+        southampton_projects_rank = rank_value(projects_ranking, total_projects, exclude=southampton_seats)
+        southampton_funding_rank = rank_value(funding_ranking, total_value, exclude=southampton_seats)
+        total_constituencies = len(projects_ranking['order']) - int((projects_ranking['position'][southampton_seats] > 0).sum()) + 1
+
+        if debug_log.isEnabledFor(logging.DEBUG):
+            top_funding = ', '.join(f"#{i + 1} {constituencies[code]} £{funding_ranking['values'][code]/1e6:.1f}M"
+                                    for i, code in enumerate(funding_ranking['order'][:10]))
+            debug_log.debug("Southampton, Test ranks: funding #%d, projects #%d of %d constituencies; top funding: %s",
+                            southampton_funding_rank, southampton_projects_rank, total_constituencies, top_funding)
+        
+        southampton_ranking = {
+            'projects_rank': southampton_projects_rank,
+            'funding_rank': southampton_funding_rank,
+            'total_constituencies': total_constituencies
+        }
 
-        # Clean column names
-        geo_df_clean = geo_df.copy()
-        geo_df_clean.columns = geo_df_clean.columns.str.strip()
+    # Timeline analysis
+    date_cols = find_date_columns(southampton_projects)
+    if date_cols:
+        yearly_trend = get_date_fields(df, southampton_projects)['start_year'].value_counts().sort_index()
+    else:
+        yearly_trend = pd.Series(dtype=int)
+
+    # Programme mix
+    prog_cols = [col for col in southampton_projects.columns if 'programme' in col.lower() or 'Programme' in col or 'type' in col.lower()]
+    if prog_cols:
+        # Categorical columns also count absent categories - keep only those present here
+        programme_mix = southampton_projects[prog_cols[0]].value_counts().loc[lambda counts: counts > 0]
+    else:
+        programme_mix = pd.Series(dtype=int)
+
+    # Status distribution
+    status_cols = [col for col in southampton_projects.columns if 'status' in col.lower() or 'Status' in col]
+    if status_cols:
+        status_dist = southampton_projects[status_cols[0]].value_counts().loc[lambda counts: counts > 0]
+    else:
+        status_dist = pd.Series(dtype=int)
+
+    return {
+        'constituency': 'Southampton, Test',
+        'total_projects': total_projects,
+        'total_value': total_value,
+        'mean_award': mean_award,
+        'median_award': median_award,
+        'yearly_trend': yearly_trend,
+        'programme_mix': programme_mix,
+        'status_dist': status_dist,
+        'data': southampton_projects,
+        'constituency_match_method': match_method,
+        'ranking': southampton_ranking,
+        'so_projects_ref': so_projects_ref,
+        'all_constituency_data': all_constituency_data
+    }
 
-        # Find postcode column in main dataset
-        postcode_cols = [col for col in df.columns if 'postcode' in col.lower() or 'Postcode' in col]
-        if not postcode_cols:
-            return None
+@dataset_cache
+def _cached_southampton_analysis(dataset_version, _df, _geo_df):
+    return create_southampton_analysis(_df, _geo_df)
 
-        postcode_col = postcode_cols[0]
-
-        # Clean postcodes for matching
-        df_clean = df.copy()
-        df_clean[postcode_col] = df_clean[postcode_col].astype(str).str.strip().str.upper()
-
-        # Get available columns from geographical dataframe
-        available_geo_cols = ['Postcodes', 'Parliamentary Constituency']
-        if 'English Region' in geo_df_clean.columns:
-            available_geo_cols.append('English Region')
-        if 'Devolved Administration' in geo_df_clean.columns:
-            available_geo_cols.append('Devolved Administration')
-
-        # Perform the join with available columns only
-        merged_df = df_clean.merge(
-            geo_df_clean[available_geo_cols],
-            left_on=postcode_col,
-            right_on='Postcodes',
-            how='left'
-        )
+def filter_southampton_analysis(analysis, df, geo_df, filters):
+    """The Southampton analysis re-summarised over its projects inside ``filters``.
 
-        # Filter out missing constituency data
-        valid_constituencies = merged_df[merged_df['Parliamentary Constituency'].notna()]
+    The projects are located once on the full portfolio; a filter only masks those rows and
+    reads the rankings from the constituency cube's slice.
+    """
+    so_projects_ref = analysis['so_projects_ref']
+    if isinstance(so_projects_ref, pd.DataFrame):
+        so_projects_ref = filter_rows(so_projects_ref, df, geo_df, filters)
+    return summarise_southampton_projects(df, geo_df, filter_rows(analysis['data'], df, geo_df, filters),
+                                          analysis['constituency_match_method'], so_projects_ref, filters)
+
+@dataset_cache(max_entries=16)
+def _cached_filtered_southampton_analysis(dataset_version, filters_key, _df, _geo_df, _filters):
+    analysis = get_southampton_analysis(_df, _geo_df)
+    return None if analysis is None else filter_southampton_analysis(analysis, _df, _geo_df, _filters)
+
+def get_southampton_analysis(df, geo_df, filters=None):
+    """Southampton analysis, computed once per dataset version (and filter) and shared across pages"""
+    if active_filters(filters):
+        return _cached_filtered_southampton_analysis(get_dataset_version(df, geo_df), filter_key(filters),
+                                                     df, geo_df, filters)
+    return _cached_southampton_analysis(get_dataset_version(df, geo_df), df, geo_df)
+
+# Constituency aggregate cube - counts and funding by constituency x programme x status x start year
+CUBE_DIMENSIONS = {
+    'constituency': 'Parliamentary Constituency',
+    'programme': 'Programme',
+    'status': 'Project_Status',
+    'start_year': 'start_year'
+}
+CUBE_MEASURES = ['rows', 'projects', 'funding', 'awards']
+REGION_COLUMNS = ['English Region', 'Devolved Administration']
+
+def _cube_axis(values):
+    """Codes into the axis labels for one cube dimension - missing values take an extra last slot"""
+    if values is None:
+        return 0, pd.Index([])
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        codes, labels = values.cat.codes.to_numpy(), values.cat.categories
+    else:
+        codes, labels = pd.factorize(values, sort=True)
+    return np.where(codes < 0, len(labels), codes), pd.Index(labels)
+
+def portfolio_regions(frame):
+    """Region of each row as cube-axis codes and labels.
+
+    The English Region, or the Devolved Administration (Scotland, Wales, Northern Ireland)
+    where there is none. The lookup's ``_geo`` columns of the geo-enriched portfolio win
+    over the portfolio's own. Returns (None, empty labels) when neither column exists.
+    """
+    codes, labels = None, pd.Index([])
+    for col in REGION_COLUMNS:
+        values = frame[f'{col}_geo'] if f'{col}_geo' in frame.columns else frame.get(col)
+        if values is None:
+            continue
+        col_codes, col_labels = _cube_axis(values)
+        combined = labels.append(col_labels[~col_labels.isin(labels)])
+        col_codes = np.append(combined.get_indexer(col_labels), len(combined))[col_codes]
+        codes = col_codes if codes is None else np.where(codes < len(labels), codes, col_codes)
+        labels = combined
+    return codes, labels
+
+def _new_cube(axes, measures, regions):
+    return {'axes': axes, **measures, 'regions': regions, 'rankings': {}}
+
+def build_constituency_cube(enriched, date_fields):
+    """Dense count and funding arrays over constituency x programme x status x start year.
+
+    ``enriched`` is the geo-enriched portfolio and ``date_fields`` its build_date_fields()
+    frame. Each dimension's labels are in 'axes'; every axis has one slot more than its
+    labels, holding rows where the value is missing. Measures are 'rows', 'projects'
+    (non-null Project_IDs), 'funding' (summed Award_Amount) and 'awards' (non-null
+    Award_Amounts), all additive, so slices are sums over axes and cubes of row sets merge
+    with merge_constituency_cubes(). 'regions' maps constituencies to portfolio_regions().
+    """
+    columns = {dim: date_fields.get(col) if dim == 'start_year' else enriched.get(col)
+               for dim, col in CUBE_DIMENSIONS.items()}
+    codes, axes = {}, {}
+    for dim, values in columns.items():
+        codes[dim], axes[dim] = _cube_axis(values)
+    if not axes['start_year'].empty:
+        axes['start_year'] = axes['start_year'].astype(int)
+
+    shape = tuple(len(labels) + 1 for labels in axes.values())
+    cells = np.ravel_multi_index(tuple(np.broadcast_to(codes[dim], len(enriched)) for dim in axes), shape)
+    cell_count = int(np.prod(shape))
+
+    def total(weights=None):
+        return np.bincount(cells, weights=weights, minlength=cell_count).reshape(shape)
+
+    no_values = pd.Series(np.nan, index=enriched.index)
+    project_ids = enriched.get('Project_ID', no_values)
+    awards = pd.to_numeric(enriched.get('Award_Amount', no_values), errors='coerce')
+    measures = {
+        'rows': total().astype(np.int32),
+        'projects': total(project_ids.notna().to_numpy()).astype(np.int32),
+        'funding': total(awards.fillna(0).to_numpy(dtype=float)),
+        'awards': total(awards.notna().to_numpy()).astype(np.int32)
+    }
 
-        if len(valid_constituencies) == 0:
+    # Each constituency's region, read off any of its rows
+    region_codes, region_labels = portfolio_regions(enriched)
+    constituencies = axes['constituency']
+    if region_codes is None:
+        regions = pd.Series(dtype=object)
+    else:
+        region_of = np.full(len(constituencies) + 1, len(region_labels))
+        region_of[np.broadcast_to(codes['constituency'], len(enriched))] = region_codes
+        has_region = region_of[:len(constituencies)] < len(region_labels)
+        regions = pd.Series(region_labels[region_of[:len(constituencies)][has_region]],
+                            index=constituencies[has_region], dtype=object)
+    return _new_cube(axes, measures, regions)
+
+def _align_cube(cube, axes):
+    """``cube``'s measures laid out on ``axes`` (a superset of its own labels), zero elsewhere"""
+    positions = [
+        np.append(target.get_indexer(cube['axes'][dim]), len(target))
+        for dim, target in axes.items()
+    ]
+    shape = tuple(len(labels) + 1 for labels in axes.values())
+    aligned = {}
+    for measure in CUBE_MEASURES:
+        values = np.zeros(shape, dtype=cube[measure].dtype)
+        values[np.ix_(*positions)] = cube[measure]
+        aligned[measure] = values
+    return aligned
+
+def merge_constituency_cubes(left, right, sign=1):
+    """Add (or subtract) constituency cubes; labels new to ``right`` are appended to ``left``'s axes"""
+    axes = {
+        dim: labels.append(right['axes'][dim][~right['axes'][dim].isin(labels)])
+        for dim, labels in left['axes'].items()
+    }
+    left_measures, right_measures = _align_cube(left, axes), _align_cube(right, axes)
+    return _new_cube(axes, {
+        measure: left_measures[measure] + sign * right_measures[measure] for measure in CUBE_MEASURES
+    }, left['regions'].combine_first(right['regions']))
+
+def update_constituency_cube(cube, delta, geo_df):
+    """Constituency cube of the new version from the incoming and outgoing rows alone"""
+    for rows, sign in ((delta['incoming'], 1), (delta['outgoing'], -1)):
+        if len(rows):
+            part = build_constituency_cube(build_geo_enriched_portfolio(rows, geo_df), build_date_fields(rows))
+            cube = merge_constituency_cubes(cube, part, sign)
+    return cube
+
+@dataset_cache(shared=True, max_entries=4)
+def _cached_constituency_cube(dataset_version, _df, _geo_df, _previous=None):
+    if _previous is not None:
+        return update_constituency_cube(*_previous, _geo_df)
+    enriched = get_geo_enriched_portfolio(_df, _geo_df)
+    return None if enriched is None else build_constituency_cube(enriched, get_date_fields(_df))
+
+def get_constituency_cube(df, geo_df, previous=None):
+    """Constituency cube, built once per dataset version (or carried forward from the last one).
+
+    Shared read-only; cube_ranking() memoises its rankings inside it.
+    """
+    return _cached_constituency_cube(get_dataset_version(df, geo_df), df, geo_df, previous)
+
+def _axis_selection(labels, selected):
+    """Axis positions for a filter - None keeps every slot, a collection keeps matching labels"""
+    if selected is None:
+        return np.arange(len(labels) + 1)
+    return np.flatnonzero(labels.isin(list(selected)))
+
+def cube_slice(cube, programmes=None, statuses=None, years=None, regions=None):
+    """Per-constituency totals (arrays over the constituency axis) for a filter slice.
+
+    ``programmes``, ``statuses`` and ``regions`` are collections of labels to keep and
+    ``years`` an inclusive (first, last) start-year range; None keeps everything, including
+    rows with the value missing. Constituencies outside ``regions`` total zero. The last
+    slot holds rows without a constituency.
+    """
+    axes = cube['axes']
+    if years is not None:
+        first, last = years
+        years = axes['start_year'][(axes['start_year'] >= first) & (axes['start_year'] <= last)]
+    selection = (
+        _axis_selection(axes['programme'], programmes),
+        _axis_selection(axes['status'], statuses),
+        _axis_selection(axes['start_year'], years)
+    )
+    if all(len(positions) == cube['rows'].shape[axis + 1] for axis, positions in enumerate(selection)):
+        totals = {measure: cube[measure].sum(axis=(1, 2, 3)) for measure in CUBE_MEASURES}
+    else:
+        index = np.ix_(np.arange(cube['rows'].shape[0]), *selection)
+        totals = {measure: cube[measure][index].sum(axis=(1, 2, 3)) for measure in CUBE_MEASURES}
+    if regions is not None:
+        in_regions = cube['regions'].index[cube['regions'].isin(list(regions))]
+        outside = np.append(~axes['constituency'].isin(in_regions), True)
+        for values in totals.values():
+            values[outside] = 0
+    return totals
+
+def cube_ranking(cube, measure, programmes=None, statuses=None, years=None, regions=None):
+    """Dense rank arrays of the constituencies by ``measure`` within a filter slice.
+
+    Computed once per (measure, slice) and memoised in the cube, so every later lookup is
+    an array index. Returns 'values' (per constituency code), 'order' (codes of the ranked
+    constituencies, best first - ties broken alphabetically), 'position' (1-based place in
+    'order', 0 for constituencies with no rows in the slice), 'rank' (competition rank:
+    ties share the better rank) and 'sorted_values' (ranked values, ascending) for
+    rank_value().
+    """
+    key = (measure,) + filter_key(dict(programmes=programmes, statuses=statuses, years=years, regions=regions))
+    ranking = cube['rankings'].get(key)
+    if ranking is not None:
+        return ranking
+
+    totals = cube_slice(cube, programmes, statuses, years, regions)
+    labels = cube['axes']['constituency']
+    values, present = totals[measure][:len(labels)], totals['rows'][:len(labels)] > 0
+    ranked = np.flatnonzero(present)
+    order = ranked[np.lexsort((ranked, -values[ranked]))]  # The labels are sorted, so codes break ties by name
+    sorted_values = np.sort(values[ranked])
+
+    position = np.zeros(len(labels), dtype=np.int64)
+    position[order] = np.arange(1, len(order) + 1)
+    rank = np.where(present, len(order) - np.searchsorted(sorted_values, values, side='right') + 1, 0)
+    ranking = {'values': values, 'order': order, 'position': position, 'rank': rank,
+               'sorted_values': sorted_values}
+    cube['rankings'][key] = ranking
+    return ranking
+
+def rank_value(ranking, value, exclude=()):
+    """Competition rank a ``value`` would take among the ranked constituencies.
+
+    Constituency codes in ``exclude`` are left out of the comparison - pass the seats a
+    combined entry stands in for. One binary search plus a look at the excluded seats.
+    """
+    ahead = len(ranking['sorted_values']) - np.searchsorted(ranking['sorted_values'], value, side='right')
+    exclude = np.asarray(exclude, dtype=np.int64)
+    ahead -= int(((ranking['position'][exclude] > 0) & (ranking['values'][exclude] > value)).sum())
+    return int(ahead) + 1
+
+@timed('ranking.constituencies')
+def get_constituency_rankings(df, geo_df, filters=None):
+    """Get comprehensive constituency rankings for comparison, within the sidebar ``filters``"""
+    try:
+        if geo_df.empty or 'Postcodes' not in geo_df.columns or 'Parliamentary Constituency' not in geo_df.columns:
             return None
 
-        # Calculate constituency statistics
-        constituency_stats = valid_constituencies.groupby('Parliamentary Constituency').agg({
-            'Project_ID': 'count',
-            'Award_Amount': 'sum'
-        }).reset_index()
-
-        constituency_stats.columns = ['Constituency', 'Project_Count', 'Total_Funding']
-        constituency_stats = constituency_stats.sort_values('Project_Count', ascending=False)
-
-        # Calculate rankings
-        constituency_stats['Project_Rank'] = range(1, len(constituency_stats) + 1)
-        funding_sorted = constituency_stats.sort_values('Total_Funding', ascending=False)
-        funding_sorted['Funding_Rank'] = range(1, len(funding_sorted) + 1)
-
-        # Merge rankings back
-        constituency_stats = constituency_stats.merge(
-            funding_sorted[['Constituency', 'Funding_Rank']],
-            on='Constituency',
-            how='left'
-        )
+        # Shared postcode -> constituency cube, with its rank arrays
+        cube = get_constituency_cube(df, geo_df)
+        if cube is None:
+            return None
+        projects = cube_ranking(cube, 'projects', **active_filters(filters))
+        funding = cube_ranking(cube, 'funding', **active_filters(filters))
+        if len(projects['order']) == 0:
+            return None
+
+        # Constituencies in project-rank order, with both ranks read from the arrays
+        order = projects['order']
+        constituency_stats = pd.DataFrame({
+            'Constituency': cube['axes']['constituency'][order].astype(str),
+            'Project_Count': projects['values'][order].astype(np.int64),
+            'Total_Funding': funding['values'][order],
+            'Project_Rank': projects['position'][order],
+            'Funding_Rank': funding['position'][order]
+        })
+        funding_sorted = constituency_stats.iloc[np.argsort(constituency_stats['Funding_Rank'].to_numpy())]
 
         return {
             'constituency_stats': constituency_stats,
@@ -1584,16 +3269,485 @@ def get_constituency_rankings(df, geo_df):
         st.error(f"Error in constituency rankings: {str(e)}")
         return None
 
-def calculate_success_metrics(df, southampton_data):
-    """Calculate comprehensive success metrics from available data"""
+# Bitmap index - packed row bitmaps over category codes, for any column and set of values
+BITMAP_LIMIT = 64
+
+def postcode_outward_column(postcodes):
+    """Outward code of each row ('SO16 7AB' -> 'SO16') as cube-axis codes and sorted labels.
+
+    Derived once per distinct postcode and broadcast back to the rows; missing postcodes
+    take the missing slot.
+    """
+    row_ids, distinct = pd.factorize(postcodes)
+    outward = postcode_outward_codes(normalise_postcodes(pd.Series(distinct, dtype=object)))
+    outward_codes, labels = _cube_axis(outward.where(outward != ''))
+    return np.append(outward_codes, len(labels))[row_ids], labels
+
+def build_bitmap_index(df, geo_df=None):
+    """Bitmap index over ``df``, materialised lazily.
+
+    Any portfolio column can be indexed. So can the derived 'start_year' and
+    'postcode_outward' and, when ``geo_df`` is a usable postcode lookup, 'Parliamentary
+    Constituency' and 'region' (portfolio_regions()) from the geo-enriched portfolio.
+    A column's codes are derived on first use and kept for the life of the dataset version,
+    so predicates never rescan strings. Bitmaps are gathered from the codes; only the most
+    recent BITMAP_LIMIT selections are kept (see bitmap()).
+    """
+    sources = {col: (lambda col=col: _cube_axis(df[col])) for col in df.columns}
+
+    def start_years():
+        codes, labels = _cube_axis(get_date_fields(df).get('start_year'))
+        return codes, labels.astype(int)
+    sources['start_year'] = start_years
+
+    postcode_col = find_postcode_column(df)
+    if postcode_col:
+        sources['postcode_outward'] = lambda: postcode_outward_column(df[postcode_col])
+
+    has_lookup = geo_df is not None and not geo_df.empty and 'Postcodes' in geo_df.columns and postcode_col
+    if has_lookup and 'Parliamentary Constituency' in geo_df.columns:
+        sources['Parliamentary Constituency'] = \
+            lambda: _cube_axis(get_geo_enriched_portfolio(df, geo_df)['Parliamentary Constituency'])
+    if any(col in (geo_df.columns if has_lookup else df.columns) for col in REGION_COLUMNS):
+        sources['region'] = lambda: portfolio_regions(get_geo_enriched_portfolio(df, geo_df) if has_lookup else df)
+    return {'rows': len(df), 'sources': sources, 'columns': {}, 'bitmaps': {}}
+
+@dataset_cache(shared=True, max_entries=8)
+def _cached_bitmap_index(dataset_version, _df, _geo_df):
+    return build_bitmap_index(_df, _geo_df)
+
+def get_bitmap_index(df, geo_df=None):
+    """Bitmap index of this dataset version, shared read-only (bitmaps are memoised into it)"""
+    frames = (df,) if geo_df is None else (df, geo_df)
+    return _cached_bitmap_index(get_dataset_version(*frames), df, geo_df)
+
+def bitmap_column(index, column):
+    """(codes, labels) of an indexed column, or None if the index cannot derive it"""
+    if column not in index['columns']:
+        source = index['sources'].get(column)
+        if source is None:
+            return None
+        index['columns'][column] = source()
+    return index['columns'][column]
+
+def code_bitmap(index, codes, keep):
+    """Packed bitmap of the rows whose code is flagged in ``keep`` (one slot per label, then missing)"""
+    return np.packbits(keep[np.broadcast_to(codes, index['rows'])], bitorder='little')
+
+def bitmap(index, column, values):
+    """Packed bitmap of the rows whose ``column`` is any of ``values``.
+
+    Combine bitmaps with ``&`` and ``|``; labels the column does not have select nothing.
+    Any number of values costs one gather over the column's codes. The last BITMAP_LIMIT
+    selections are memoised, least recently used evicted first, and handed out read-only.
+    """
+    codes, labels = bitmap_column(index, column)
+    selected = labels.get_indexer(pd.Index(list(values)))
+    selected = tuple(np.unique(selected[selected >= 0]).tolist())
+    if not selected:
+        return np.zeros((index['rows'] + 7) // 8, dtype=np.uint8)
+
+    bitmaps = index['bitmaps']
+    key = (column, selected)
+    bits = bitmaps.pop(key, None)
+    if bits is None:
+        keep = np.zeros(len(labels) + 1, dtype=bool)
+        keep[list(selected)] = True
+        bits = code_bitmap(index, codes, keep)
+        bits.flags.writeable = False
+        if len(bitmaps) >= BITMAP_LIMIT:
+            bitmaps.pop(next(iter(bitmaps)))
+    bitmaps[key] = bits  # Re-inserted on every use, so the oldest entry is the least recently used
+    return bits
+
+def outward_code_bitmap(index, outward_codes):
+    """Packed bitmap of the rows whose postcode is in any of ``outward_codes``, each an
+    outward code ('SO16') or a whole postcode area ('SO')"""
+    labels = bitmap_column(index, 'postcode_outward')[1]
+    return bitmap(index, 'postcode_outward',
+                  [label for code in outward_codes for label in labels[outward_code_range(labels, code)]])
+
+def bitmap_mask(index, bits):
+    """Boolean row mask of a bitmap"""
+    return np.unpackbits(bits, count=index['rows'], bitorder='little').view(bool)
+
+_BYTE_POPCOUNT = np.array([bin(byte).count('1') for byte in range(256)], dtype=np.uint8)
+
+def bitmap_count(bits):
+    """Number of rows a bitmap selects, counted on the packed bytes"""
+    return int(_BYTE_POPCOUNT[bits].sum(dtype=np.int64))
+
+def bitmap_rows(frame, index, bits):
+    """Rows of ``frame`` (the indexed frame, or its geo-enriched copy) a bitmap selects"""
+    return frame.iloc[np.flatnonzero(bitmap_mask(index, bits))]
+
+# Programme taxonomy - keyword categories matched against each distinct programme name once
+PROGRAMME_TAXONOMY = {
+    'Research': ['Research for Patient Benefit', 'Health Technology Assessment', 'Public Health Research',
+                 'Health Services Research', 'Policy Research', 'Research', 'Clinical Research',
+                 'Biomedical Research'],
+    'Training': ['Training', 'Fellowship', 'Career Development', 'Doctoral Training', 'Academic Training',
+                 'Professional Development']
+}
+
+def compile_keyword_matcher(taxonomy):
+    """Aho-Corasick automaton over every keyword of a {category: [keywords]} taxonomy.
+
+    One pass over a text finds every keyword it contains, case-insensitively - the same
+    categories as a ``str.contains(..., case=False)`` per category, without a regex per
+    category. Returns the 'goto' transitions, 'fail' links and per-state 'output' categories.
+    """
+    goto, fail, output = [{}], [0], [set()]
+    for category, keywords in taxonomy.items():
+        for keyword in keywords:
+            state = 0
+            for char in keyword.lower():
+                if char not in goto[state]:
+                    goto.append({})
+                    fail.append(0)
+                    output.append(set())
+                    goto[state][char] = len(goto) - 1
+                state = goto[state][char]
+            output[state].add(category)
+
+    # Breadth-first failure links; a state also reports the keywords ending at its fallback
+    queue = deque(goto[0].values())
+    while queue:
+        state = queue.popleft()
+        for char, child in goto[state].items():
+            queue.append(child)
+            fallback = fail[state]
+            while fallback and char not in goto[fallback]:
+                fallback = fail[fallback]
+            fail[child] = goto[fallback].get(char, 0)
+            output[child] |= output[fail[child]]
+    return {'goto': goto, 'fail': fail, 'output': [frozenset(categories) for categories in output]}
+
+def match_keywords(matcher, text):
+    """Categories whose keywords occur anywhere in ``text`` (case-insensitive)"""
+    goto, fail, output = matcher['goto'], matcher['fail'], matcher['output']
+    state, found = 0, set()
+    for char in str(text).lower():
+        while state and char not in goto[state]:
+            state = fail[state]
+        state = goto[state].get(char, 0)
+        found |= output[state]
+    return found
+
+@functools.lru_cache(maxsize=8)
+def _compiled_taxonomy(taxonomy_key):
+    return compile_keyword_matcher(dict(taxonomy_key))
+
+def programme_categories(index, taxonomy=None):
+    """Programme labels in each taxonomy category (default PROGRAMME_TAXONOMY).
+
+    Every distinct programme is matched once per dataset version and taxonomy; rows are
+    then selected by their programme's bitmap, never by matching text per row. A programme
+    can fall in several categories or none.
+    """
+    taxonomy = PROGRAMME_TAXONOMY if taxonomy is None else taxonomy
+    key = tuple((category, tuple(keywords)) for category, keywords in taxonomy.items())
+    classified = index.setdefault('programme_categories', {})
+    if key not in classified:
+        matcher = _compiled_taxonomy(key)
+        labels = bitmap_column(index, 'Programme')[1]
+        matches = [match_keywords(matcher, label) for label in labels]
+        classified[key] = {
+            category: labels[np.array([category in found for found in matches], dtype=bool)]
+            for category in taxonomy
+        }
+    return classified[key]
+
+def programme_category_rows(df, geo_df, category, filters=None, taxonomy=None):
+    """Rows of ``df`` (inside the sidebar ``filters``) whose programme is in a taxonomy category"""
+    index = get_bitmap_index(df, geo_df)
+    bits = bitmap(index, 'Programme', programme_categories(index, taxonomy)[category])
+    in_filters = filter_bitmap(index, filters)
+    return bitmap_rows(df, index, bits if in_filters is None else bits & in_filters)
+
+# Organisation names - distinct names of the organisation columns, searchable through a token index
+ORGANISATION_QUERY_LIMIT = 32
+
+def organisation_columns(df):
+    """Organisation-like columns searched when the portfolio cannot be placed by postcode"""
+    return [col for col in df.columns if 'organisation' in col.lower() or 'Lead' in col or 'Contract' in col]
+
+def normalise_organisation_names(names):
+    """Lower-case names with punctuation and spacing folded to single spaces ('Univ. of  Southampton' -> 'univ of southampton')"""
+    return (pd.Series(names, dtype=object).astype(str).str.lower()
+            .str.replace(r'[^0-9a-z]+', ' ', regex=True).str.strip())
+
+def build_organisation_index(index, columns):
+    """Token inverted index over the distinct names of ``columns`` in a bitmap index.
+
+    Every distinct name gets an id, its column's 'offsets' entry plus its label code, and
+    is normalised and tokenised once. The sorted token 'vocabulary' points through 'starts'
+    into 'name_ids', the ids of the names holding each token, so a keyword query only
+    touches the names it matches.
+    """
+    offsets, tokens, name_ids, n_names = {}, [], [], 0
+    for column in columns:
+        labels = bitmap_column(index, column)[1]
+        offsets[column] = n_names
+        words = normalise_organisation_names(labels).str.split().explode().dropna()
+        tokens.append(words.to_numpy(dtype=object))
+        name_ids.append(words.index.to_numpy(dtype=np.int64) + n_names)
+        n_names += len(labels)
+
+    postings = pd.DataFrame({
+        'token': np.concatenate(tokens) if tokens else np.array([], dtype=object),
+        'name_id': np.concatenate(name_ids) if name_ids else np.array([], dtype=np.int64)
+    }).drop_duplicates().sort_values(['token', 'name_id'])
+    token_values = postings['token'].to_numpy()
+    starts = np.flatnonzero(np.r_[len(token_values) > 0, token_values[1:] != token_values[:-1]])
+    return {
+        'offsets': offsets,
+        'vocabulary': token_values[starts].tolist(),
+        'starts': np.append(starts, len(postings)),
+        'name_ids': postings['name_id'].to_numpy()
+    }
+
+def organisation_names(organisations, keyword):
+    """Ids of the names holding every token of ``keyword``, whole or as a token prefix"""
+    vocabulary, starts, matched = organisations['vocabulary'], organisations['starts'], None
+    for token in normalise_organisation_names([keyword]).iloc[0].split():
+        # Normalised tokens are [0-9a-z], so '{' sorts after every token starting with this one
+        first, last = bisect.bisect_left(vocabulary, token), bisect.bisect_left(vocabulary, token + '{')
+        names = np.unique(organisations['name_ids'][starts[first]:starts[last]])
+        matched = names if matched is None else np.intersect1d(matched, names, assume_unique=True)
+    return np.array([], dtype=np.int64) if matched is None else matched
+
+def organisation_bitmap(index, keyword, columns):
+    """Packed bitmap of the rows naming ``keyword`` in any of ``columns``.
+
+    The matching names of each column become a keep array over its label codes, gathered
+    once. Only the query's bitmap is memoised (the last ORGANISATION_QUERY_LIMIT queries);
+    per-name bitmaps are never built.
+    """
+    key = tuple(columns)
+    organisations = index.setdefault('organisations', {})
+    if key not in organisations:
+        organisations[key] = build_organisation_index(index, columns)
+    queries = index.setdefault('organisation_queries', {})
+    bits = queries.pop((key, keyword), None)
+    if bits is None:
+        names = organisation_names(organisations[key], keyword)
+        bits = np.zeros((index['rows'] + 7) // 8, dtype=np.uint8)
+        for column, offset in organisations[key]['offsets'].items():
+            codes, labels = bitmap_column(index, column)
+            name_codes = names[(names >= offset) & (names < offset + len(labels))] - offset
+            if len(name_codes):
+                keep = np.zeros(len(labels) + 1, dtype=bool)
+                keep[name_codes] = True
+                bits |= code_bitmap(index, codes, keep)
+        bits.flags.writeable = False
+        if len(queries) >= ORGANISATION_QUERY_LIMIT:
+            queries.pop(next(iter(queries)))
+    queries[(key, keyword)] = bits
+    return bits
+
+def match_organisations(df, index, keyword, columns=None):
+    """Rows of ``df`` naming an institution or place in any organisation column.
+
+    Works for any target: 'southampton', 'university college london', 'oxford univ'. Every
+    token of ``keyword`` must start a word of the same name, case and punctuation aside.
+    """
+    columns = organisation_columns(df) if columns is None else columns
+    return bitmap_rows(df, index, organisation_bitmap(index, keyword, columns))
+
+# Portfolio filters - sidebar slices served from the cube and from the bitmap index
+FILTER_COLUMNS = {'programmes': 'Programme', 'statuses': 'Project_Status', 'years': 'start_year', 'regions': 'region'}
+FILTER_DIMENSIONS = list(FILTER_COLUMNS)
+FILTER_MASK_LIMIT = 32
+
+def active_filters(filters):
+    """The restricting entries of a filters dict - dimensions left as None are dropped"""
+    return {dim: selected for dim, selected in (filters or {}).items() if selected is not None}
+
+def filter_key(filters):
+    """Hashable, order-independent key of a filters dict"""
+    filters = filters or {}
+    key = []
+    for dim in FILTER_DIMENSIONS:
+        selected = filters.get(dim)
+        if selected is None:
+            key.append(None)
+        elif dim == 'years':
+            key.append(tuple(int(year) for year in selected))
+        else:
+            key.append(tuple(sorted(map(str, selected))))
+    return tuple(key)
+
+def filter_labels(index, dim):
+    """Labels a filter dimension can take, or an empty Index if the portfolio cannot filter on it"""
+    column = bitmap_column(index, FILTER_COLUMNS[dim])
+    return pd.Index([]) if column is None else column[1]
+
+def filter_bitmap(index, filters):
+    """Bitmap of the rows inside ``filters`` - the AND of one OR-ed bitmap per restricted dimension.
+
+    Rows with the value missing only pass when the dimension is unrestricted. Returns None
+    when nothing is filtered.
+    """
+    bits = None
+    for dim, selected in active_filters(filters).items():
+        labels = filter_labels(index, dim)
+        if labels.empty:
+            continue
+        if dim == 'years':
+            selected = labels[(labels >= selected[0]) & (labels <= selected[1])]
+        dim_bits = bitmap(index, FILTER_COLUMNS[dim], selected)
+        bits = dim_bits if bits is None else bits & dim_bits
+    return bits
+
+def filter_mask(index, filters):
+    """Boolean row mask for ``filters`` from the bitmap index, memoised per filter combination"""
+    masks = index.setdefault('filter_masks', {})
+    key = filter_key(filters)
+    mask = masks.get(key)
+    if mask is not None:
+        return mask
+
+    bits = filter_bitmap(index, filters)
+    mask = np.ones(index['rows'], dtype=bool) if bits is None else bitmap_mask(index, bits)
+    if len(masks) >= FILTER_MASK_LIMIT:
+        masks.pop(next(iter(masks)))
+    masks[key] = mask
+    return mask
+
+@dataset_cache(shared=True, max_entries=8)
+def _cached_filtered_portfolio(dataset_version, filters_key, _df, _geo_df, _filters):
+    return _df[filter_mask(get_bitmap_index(_df, _geo_df), _filters)]
+
+def get_filtered_portfolio(df, geo_df, filters=None):
+    """The rows of ``df`` inside ``filters`` - ``df`` itself when nothing is filtered.
+
+    Filtered frames get their own dataset version (from their index), so every cache
+    downstream keys them apart from the full portfolio.
+    """
+    if not active_filters(filters):
+        return df
+    return _cached_filtered_portfolio(get_dataset_version(df, geo_df), filter_key(filters), df, geo_df, filters)
+
+def filter_rows(frame, df, geo_df, filters=None):
+    """Rows of ``frame`` inside ``filters``, where ``frame`` is ``df`` or any frame filtered from it
+    (or from its geo-enriched copy)"""
+    if not active_filters(filters):
+        return frame
+    mask = filter_mask(get_bitmap_index(df, geo_df), filters)
+    if len(frame) == len(df) and frame.index.equals(df.index):
+        return frame[mask]
+    return frame[mask[df.index.get_indexer(frame.index)]]
+
+def portfolio_kpis(df, geo_df, filters=None):
+    """Headline counts of the filtered portfolio: 'projects', 'total_value', 'avg_award', 'active'.
+
+    Read from the constituency cube (a sum over a few thousand cells) when there is one,
+    otherwise from the filtered rows.
+    """
+    filters = active_filters(filters)
+    cube = get_constituency_cube(df, geo_df) if 'Parliamentary Constituency' in geo_df.columns else None
+    if cube is not None:
+        totals = {measure: values.sum() for measure, values in cube_slice(cube, **filters).items()}
+        statuses = filters.get('statuses')
+        active_filter = {**filters, 'statuses': ['Active'] if statuses is None or 'Active' in statuses else []}
+        active = int(cube_slice(cube, **active_filter)['rows'].sum())
+        return {
+            'projects': int(totals['rows']),
+            'total_value': float(totals['funding']),
+            'avg_award': totals['funding'] / totals['awards'] if totals['awards'] else np.nan,
+            'active': active
+        }
+
+    view = get_filtered_portfolio(df, geo_df, filters)
+    has_awards = 'Award_Amount' in view.columns
+    active = 0
+    if 'Project_Status' in df.columns:
+        index = get_bitmap_index(df, geo_df)
+        active_bits = bitmap(index, 'Project_Status', ['Active'])
+        in_filters = filter_bitmap(index, filters)
+        active = bitmap_count(active_bits if in_filters is None else active_bits & in_filters)
+    return {
+        'projects': len(view),
+        'total_value': view['Award_Amount'].sum() if has_awards else 0,
+        'avg_award': view['Award_Amount'].mean() if has_awards else 0,
+        'active': active
+    }
+
+def render_portfolio_filters(df, geo_df):
+    """Sidebar filter controls; returns the filters dict (None = dimension not restricted)"""
+    index = get_bitmap_index(df, geo_df)
+    labels = {dim: filter_labels(index, dim) for dim in FILTER_DIMENSIONS}
+    st.sidebar.markdown("#### 🔎 Filters")
+
+    filters = {dim: None for dim in FILTER_DIMENSIONS}
+    for dim, label, placeholder in (('programmes', "Programme", "All programmes"),
+                                    ('statuses', "Status", "All statuses"),
+                                    ('regions', "Region", "All regions")):
+        if len(labels[dim]):
+            chosen = st.sidebar.multiselect(label, labels[dim].astype(str).tolist(), key=f'filter_{dim}',
+                                            placeholder=placeholder)
+            filters[dim] = chosen or None
+
+    years = labels['years']
+    if len(years) > 1:
+        full_range = (int(years.min()), int(years.max()))
+        chosen = st.sidebar.slider("Start year", *full_range, value=full_range, key='filter_years')
+        filters['years'] = None if tuple(chosen) == full_range else tuple(chosen)
+
+    if active_filters(filters):
+        shown = bitmap_count(filter_bitmap(index, filters))
+        st.sidebar.caption(f"Showing {shown:,} of {len(df):,} projects. Data quality pages always cover the whole workbook.")
+    return filters
+
+def status_count_table(df, group_col):
+    """Project counts per group (rows, first-appearance order) and status (columns)"""
+    status_counts = (
+        df.groupby([group_col, 'Project_Status'], observed=True, sort=False)
+        .size()
+        .unstack(fill_value=0)
+    )
+    # unstack sorts the groups - restore the order of df[group_col].unique()
+    group_order = pd.Index(df[group_col].dropna().unique())
+    return status_counts.reindex(group_order[group_order.isin(status_counts.index)])
+
+def count_status_by_group(df, group_col, status_counts=None):
+    """Completed, active and total project counts per group in a single grouped pass.
+
+    Matches the per-group ``value_counts().get('Completed', ...get('Complete', 0))`` rule: a
+    group's completed count is its 'Completed' count, falling back to 'Complete' when it has
+    none. Groups keep their first-appearance order and missing group values are dropped.
+    A precomputed status_count_table() (e.g. from the incremental aggregates) can be passed
+    as ``status_counts``; its row order is used as-is.
+    """
+    if status_counts is None:
+        status_counts = status_count_table(df, group_col)
+    no_projects = pd.Series(0, index=status_counts.index)
+    completed = status_counts.get('Completed', no_projects)
+    completed = completed.where(completed > 0, status_counts.get('Complete', no_projects))
+    active = status_counts.get('Active', no_projects)
+
+    counts = pd.DataFrame({'completed': completed, 'active': active}, index=status_counts.index)
+    counts['total'] = counts['completed'] + counts['active']
+    counts['success_rate'] = counts['completed'] / counts['total'].where(counts['total'] > 0) * 100
+    return counts
+
+@timed('metrics.success')
+def calculate_success_metrics(df, southampton_data, status_counts=None):
+    """Calculate comprehensive success metrics from available data.
+
+    ``status_counts`` optionally supplies {group column: status_count_table()} for the
+    programme and organisation tables, e.g. the incrementally maintained aggregates.
+    """
+    status_counts = status_counts or {}
     try:
         metrics = {}
         
         # 1. Project Completion Success Rate
         if 'Project_Status' in df.columns:
-            status_counts = df['Project_Status'].value_counts()
-            completed_count = status_counts.get('Completed', status_counts.get('Complete', 0))
-            active_count = status_counts.get('Active', 0)
+            national_status = df['Project_Status'].value_counts()
+            completed_count = national_status.get('Completed', national_status.get('Complete', 0))
+            active_count = national_status.get('Active', 0)
             total_trackable = completed_count + active_count
             
             if total_trackable > 0:
@@ -1617,29 +3771,27 @@ def calculate_success_metrics(df, southampton_data):
         
         # 2. Programme Success Rates by Type
         if 'Programme' in df.columns and 'Project_Status' in df.columns:
+            programme_counts = count_status_by_group(df, 'Programme', status_counts.get('Programme'))
+            programme_counts = programme_counts[programme_counts['total'] > 0]
+            
             programme_success = {}
-            for programme in df['Programme'].unique():
-                if pd.notna(programme):
-                    prog_data = df[df['Programme'] == programme]
-                    prog_status = prog_data['Project_Status'].value_counts()
-                    prog_completed = prog_status.get('Completed', prog_status.get('Complete', 0))
-                    prog_active = prog_status.get('Active', 0)
-                    prog_total = prog_completed + prog_active
-                    
-                    if prog_total > 0:
-                        success_rate = (prog_completed / prog_total) * 100
-                        programme_success[programme] = {
-                            'success_rate': success_rate,
-                            'completed': prog_completed,
-                            'active': prog_active,
-                            'total': prog_total
-                        }
+            for counts in programme_counts.itertuples():
+                programme_success[counts.Index] = {
+                    'success_rate': counts.success_rate,
+                    'completed': counts.completed,
+                    'active': counts.active,
+                    'total': counts.total
+                }
             
             metrics['programme_success'] = programme_success
         
+        # Completed projects, selected once from the bitmap index for sections 3 and 4
+        if 'Project_Status' in df.columns:
+            index = get_bitmap_index(df)
+            completed_projects = bitmap_rows(df, index, bitmap(index, 'Project_Status', ['Completed', 'Complete']))
+
         # 3. Funding Efficiency (Average award per completed project)
         if 'Award_Amount' in df.columns and 'Project_Status' in df.columns:
-            completed_projects = df[df['Project_Status'].isin(['Completed', 'Complete'])]
             if len(completed_projects) > 0:
                 avg_completed_award = completed_projects['Award_Amount'].mean()
                 metrics['avg_completed_award'] = avg_completed_award
@@ -1652,25 +3804,21 @@ def calculate_success_metrics(df, southampton_data):
         
         # 4. Time-to-Completion Analysis (if we have both start and end dates)
         if 'Start_Date' in df.columns and 'End_Date' in df.columns and 'Project_Status' in df.columns:
-            completed_projects = df[df['Project_Status'].isin(['Completed', 'Complete'])]
             if len(completed_projects) > 0:
-                completed_projects['Start_Date'] = pd.to_datetime(completed_projects['Start_Date'], errors='coerce')
-                completed_projects['End_Date'] = pd.to_datetime(completed_projects['End_Date'], errors='coerce')
-                
-                # Calculate duration for completed projects
-                duration_data = completed_projects.dropna(subset=['Start_Date', 'End_Date'])
-                if len(duration_data) > 0:
-                    duration_data['Duration_Years'] = (duration_data['End_Date'] - duration_data['Start_Date']).dt.days / 365.25
-                    avg_duration = duration_data['Duration_Years'].mean()
+                # Duration of completed projects with both dates
+                durations = get_date_fields(df, completed_projects)['duration_years'].dropna()
+                if len(durations) > 0:
+                    avg_duration = durations.mean()
                     metrics['avg_project_duration'] = avg_duration
         
         # 5. Recent Performance Trends
         if 'Start_Date' in df.columns and 'Project_Status' in df.columns:
-            df['Start_Date'] = pd.to_datetime(df['Start_Date'], errors='coerce')
             current_year = pd.Timestamp.now().year
             
             # Last 3 years performance
-            recent_projects = df[df['Start_Date'].dt.year >= (current_year - 3)]
+            index = get_bitmap_index(df)
+            start_years = filter_labels(index, 'years')
+            recent_projects = bitmap_rows(df, index, bitmap(index, 'start_year', start_years[start_years >= current_year - 3]))
             if len(recent_projects) > 0:
                 recent_status = recent_projects['Project_Status'].value_counts()
                 recent_completed = recent_status.get('Completed', recent_status.get('Complete', 0))
@@ -1683,22 +3831,16 @@ def calculate_success_metrics(df, southampton_data):
         
         # 6. Institution Success Rates
         if 'Lead_Organisation' in df.columns and 'Project_Status' in df.columns:
+            org_counts = count_status_by_group(df, 'Lead_Organisation', status_counts.get('Lead_Organisation'))
+            org_counts = org_counts[org_counts['total'] >= 10]  # Only include orgs with significant projects
+            
             org_success = {}
-            for org in df['Lead_Organisation'].unique():
-                if pd.notna(org):
-                    org_data = df[df['Lead_Organisation'] == org]
-                    org_status = org_data['Project_Status'].value_counts()
-                    org_completed = org_status.get('Completed', org_status.get('Complete', 0))
-                    org_active = org_status.get('Active', 0)
-                    org_total = org_completed + org_active
-                    
-                    if org_total > 0 and org_total >= 10:  # Only include orgs with significant projects
-                        success_rate = (org_completed / org_total) * 100
-                        org_success[org] = {
-                            'success_rate': success_rate,
-                            'completed': org_completed,
-                            'total': org_total
-                        }
+            for counts in org_counts.itertuples():
+                org_success[counts.Index] = {
+                    'success_rate': counts.success_rate,
+                    'completed': counts.completed,
+                    'total': counts.total
+                }
             
             metrics['organisation_success'] = org_success
         
@@ -1708,6 +3850,24 @@ def calculate_success_metrics(df, southampton_data):
         st.error(f"Error calculating success metrics: {str(e)}")
         return None
 
+@dataset_cache(max_entries=16)
+def _cached_success_metrics(dataset_version, _df, _southampton_data, _status_counts=None):
+    metrics = calculate_success_metrics(_df, _southampton_data, _status_counts)
+    if metrics is not None:
+        metrics['metrics_version'] = dataset_version
+    return metrics
+
+def get_success_metrics(df, geo_df, southampton_data, filters=None):
+    """Success metrics for the Southampton page, computed once per dataset version (and filter).
+
+    ``southampton_data`` must be the get_southampton_analysis(df, geo_df, filters) result,
+    since the cache is keyed on the version of the filtered ``df`` and ``geo_df`` alone.
+    The full portfolio reuses the incremental status counts; a filtered one counts its rows.
+    """
+    view = get_filtered_portfolio(df, geo_df, filters)
+    status_counts = get_portfolio_aggregates(df)['status_counts'] if view is df else None
+    return _cached_success_metrics(get_dataset_version(view, geo_df), view, southampton_data, status_counts)
+
 def display_success_analysis(metrics, southampton_data):
     """Display comprehensive success analysis with enhanced UI"""
     try:
@@ -1765,7 +3925,7 @@ def display_success_analysis(metrics, southampton_data):
                     margin-bottom: 10px;
                 ">
                     <h2 style="margin: 0; font-size: 2rem;">{soton_rate:.1f}%</h2>
-                    <p style="margin: 5px 0 0 0;">Southampton, Test Rate</p>
+                    <p style="margin: 5px 0 0 0;">{southampton_data.get('constituency', 'Southampton, Test')} Rate</p>
                     <small style="opacity: 0.8;">{metrics['southampton_completed']} completed</small>
                 </div>
                 """, unsafe_allow_html=True)
@@ -1827,6 +3987,20 @@ def display_success_analysis(metrics, southampton_data):
     except Exception as e:
         st.error(f"Error displaying success analysis: {str(e)}")
 
+def get_programme_average_awards(southampton_data):
+    """Average award per programme for an area, from a batch profile or its project rows"""
+    if 'programme_avg_award' in southampton_data:
+        return southampton_data['programme_avg_award']
+
+    area_projects = southampton_data['data']
+    if 'Programme' not in area_projects.columns or 'Award_Amount' not in area_projects.columns:
+        return {}
+    return {
+        programme: programme_awards.mean()
+        for programme, programme_awards in area_projects.groupby('Programme', observed=True)['Award_Amount']
+    }
+
+@timed('metrics.mp_strategy')
 def generate_mp_strategy(metrics, southampton_data):
     """Generate comprehensive strategic recommendations for MP decision-making"""
     try:
@@ -1843,12 +4017,12 @@ def generate_mp_strategy(metrics, southampton_data):
         if 'programme_success' in metrics and southampton_data:
             # Calculate value per success for each programme
             programme_roi = {}
+            programme_avg_awards = get_programme_average_awards(southampton_data)
             for prog, success_data in metrics['programme_success'].items():
                 if prog in southampton_data.get('programme_mix', {}).index:
-                    # Get Southampton projects for this programme
-                    prog_projects = southampton_data['data'][southampton_data['data']['Programme'] == prog] if 'Programme' in southampton_data['data'].columns else pd.DataFrame()
-                    if len(prog_projects) > 0 and 'Award_Amount' in prog_projects.columns:
-                        avg_award = prog_projects['Award_Amount'].mean()
+                    # Average Southampton award for this programme
+                    if prog in programme_avg_awards:
+                        avg_award = programme_avg_awards[prog]
                         success_rate = success_data['success_rate']
                         # Calculate expected value per project
                         expected_value = (avg_award * success_rate / 100)
@@ -1930,10 +4104,10 @@ def generate_mp_strategy(metrics, southampton_data):
                 # Identify programmes with highest awards
                 if 'programme_success' in metrics and southampton_data and 'programme_mix' in southampton_data:
                     high_value_programmes = []
+                    programme_avg_awards = get_programme_average_awards(southampton_data)
                     for prog in southampton_data['programme_mix'].index:
-                        prog_projects = southampton_data['data'][southampton_data['data']['Programme'] == prog] if 'Programme' in southampton_data['data'].columns else pd.DataFrame()
-                        if len(prog_projects) > 0 and 'Award_Amount' in prog_projects.columns:
-                            avg_award = prog_projects['Award_Amount'].mean()
+                        if prog in programme_avg_awards:
+                            avg_award = programme_avg_awards[prog]
                             if avg_award > national_avg * 1.2:  # 20% above national average
                                 high_value_programmes.append({
                                     'programme': prog,
@@ -2053,6 +4227,191 @@ def generate_mp_strategy(metrics, southampton_data):
         st.error(f"Error generating MP strategy: {str(e)}")
         return None
 
+def _split_counts_by_constituency(valid_constituencies, col):
+    """Per-constituency value counts of a column (largest first), from one grouped count"""
+    counts = valid_constituencies.groupby(['Parliamentary Constituency', col], observed=True, sort=False).size()
+    counts = counts.sort_values(ascending=False, kind='stable')
+    return {
+        constituency: constituency_counts.droplevel(0).rename('count')
+        for constituency, constituency_counts in counts.groupby(level=0, observed=True, sort=False)
+    }
+
+@timed('ranking.constituency_profiles')
+def build_constituency_profiles(df, geo_df):
+    """Southampton-analysis-style profiles for every constituency from one pass over the enriched frame.
+
+    Each profile carries the same headline keys as create_southampton_analysis
+    (totals, mean/median award, yearly trend, programme mix, status distribution and
+    national ranking) plus 'programme_avg_award', so generate_mp_strategy can run without
+    the constituency's project rows.
+
+    Ranks are read from the constituency cube's rank arrays, the same totals and tie rule
+    as the Southampton page. That page ranks Southampton, Test as the combined Southampton
+    entry, leaving every other seat named Southampton out of the field, so its rank and
+    constituency count there can be better and smaller than in its profile here.
+    """
+    enriched = get_geo_enriched_portfolio(df, geo_df)
+    if enriched is None:
+        return {}
+
+    valid_constituencies = enriched[enriched['Parliamentary Constituency'].notna()]
+    if len(valid_constituencies) == 0:
+        return {}
+
+    by_constituency = valid_constituencies.groupby('Parliamentary Constituency', observed=True, sort=False)
+    summary = pd.DataFrame({'total_projects': by_constituency.size()})
+    if 'Award_Amount' in valid_constituencies.columns:
+        awards = by_constituency['Award_Amount']
+        summary['total_value'] = awards.sum()
+        summary['mean_award'] = awards.mean()
+        summary['median_award'] = awards.median()
+    else:
+        summary['total_value'] = summary['mean_award'] = summary['median_award'] = 0
+
+    # Competition ranks from the cube: tied constituencies share the better rank
+    cube = get_constituency_cube(df, geo_df)
+    codes = cube['axes']['constituency'].get_indexer(summary.index)
+    summary['projects_rank'] = cube_ranking(cube, 'projects')['rank'][codes]
+    summary['funding_rank'] = cube_ranking(cube, 'funding')['rank'][codes]
+
+    # Same column detection as create_southampton_analysis
+    columns = valid_constituencies.columns
+    date_cols = find_date_columns(valid_constituencies)
+    prog_cols = [col for col in columns if 'programme' in col.lower() or 'Programme' in col or 'type' in col.lower()]
+    status_cols = [col for col in columns if 'status' in col.lower() or 'Status' in col]
+
+    yearly_trends = {}
+    if date_cols:
+        start_years = get_date_fields(df, valid_constituencies)['start_year']
+        year_counts = start_years.groupby(valid_constituencies['Parliamentary Constituency'], observed=True).value_counts()
+        yearly_trends = {
+            constituency: counts.droplevel(0).sort_index()
+            for constituency, counts in year_counts.groupby(level=0, observed=True)
+        }
+    programme_mixes = _split_counts_by_constituency(valid_constituencies, prog_cols[0]) if prog_cols else {}
+    status_dists = _split_counts_by_constituency(valid_constituencies, status_cols[0]) if status_cols else {}
+
+    programme_avg_awards = {}
+    if 'Programme' in columns and 'Award_Amount' in columns:
+        programme_means = valid_constituencies.groupby(['Parliamentary Constituency', 'Programme'], observed=True)['Award_Amount'].mean()
+        for (constituency, programme), avg_award in programme_means.items():
+            programme_avg_awards.setdefault(constituency, {})[programme] = avg_award
+
+    total_constituencies = len(cube_ranking(cube, 'projects')['order'])
+    profiles = {}
+    for row in summary.itertuples():
+        constituency = row.Index
+        profiles[constituency] = {
+            'constituency': constituency,
+            'total_projects': row.total_projects,
+            'total_value': row.total_value,
+            'mean_award': row.mean_award,
+            'median_award': row.median_award,
+            'yearly_trend': yearly_trends.get(constituency, pd.Series(dtype=int)),
+            'programme_mix': programme_mixes.get(constituency, pd.Series(dtype=int)),
+            'status_dist': status_dists.get(constituency, pd.Series(dtype=int)),
+            'programme_avg_award': programme_avg_awards.get(constituency, {}),
+            'constituency_match_method': f'Parliamentary Constituency - {constituency} ({row.total_projects} projects)',
+            'ranking': {
+                'projects_rank': row.projects_rank,
+                'funding_rank': row.funding_rank,
+                'total_constituencies': total_constituencies
+            }
+        }
+
+    return profiles
+
+def overlay_constituency_metrics(national_metrics, profile):
+    """National success metrics with the constituency completion-rate keys filled from a profile"""
+    metrics = {key: value for key, value in national_metrics.items() if not key.startswith('southampton_')}
+    status_dist = profile['status_dist']
+    area_completed = status_dist.get('Completed', status_dist.get('Complete', 0))
+    area_active = status_dist.get('Active', 0)
+    area_total = area_completed + area_active
+
+    if 'national_completion_rate' in metrics and area_total > 0:
+        metrics['southampton_completion_rate'] = (area_completed / area_total) * 100
+        metrics['southampton_completed'] = area_completed
+        metrics['southampton_active'] = area_active
+
+    return metrics
+
+@timed('metrics.all_constituency_strategies')
+def build_all_constituency_strategies(df, geo_df):
+    """Profiles, success metrics and MP strategies for every constituency in one batch.
+
+    National metrics are computed once; each constituency only adds its completion-rate
+    overlay and runs generate_mp_strategy on its profile.
+    """
+    profiles = build_constituency_profiles(df, geo_df)
+    national_metrics = calculate_success_metrics(df, None, get_portfolio_aggregates(df)['status_counts']) or {}
+
+    metrics, strategies = {}, {}
+    for constituency, profile in profiles.items():
+        metrics[constituency] = overlay_constituency_metrics(national_metrics, profile)
+        strategies[constituency] = generate_mp_strategy(metrics[constituency], profile)
+
+    return {
+        'profiles': profiles,
+        'metrics': metrics,
+        'strategies': strategies
+    }
+
+@dataset_cache(persist='disk')
+def _cached_constituency_strategies(dataset_version, _df, _geo_df):
+    return build_all_constituency_strategies(_df, _geo_df)
+
+@dataset_cache(shared=True, max_entries=4)
+def _shared_constituency_strategies(dataset_version, _df, _geo_df):
+    # The disk cache unpickles the whole batch on every hit; this unpickles it once per version
+    return _cached_constituency_strategies(dataset_version, _df, _geo_df)
+
+def constituency_strategy_names(df, geo_df):
+    """Constituencies with a profile in the strategy batch, alphabetically.
+
+    Read from the constituency cube (those with rows), the same set build_constituency_profiles
+    covers, so listing them does not build the batch.
+    """
+    cube = get_constituency_cube(df, geo_df)
+    if cube is None:
+        return []
+    labels = cube['axes']['constituency']
+    return labels[np.flatnonzero(cube_ranking(cube, 'projects')['position'] > 0)].tolist()
+
+def get_constituency_strategy(df, geo_df, constituency):
+    """Look up one constituency's profile, metrics and strategy from the persisted batch.
+
+    The batch is built once per dataset version and persisted to disk, then shared in memory,
+    so this is a dictionary lookup after the first call. The profile carries its 'mp_strategy',
+    so the Strategy tabs reuse it through get_mp_strategy(). Returns None for unknown constituencies.
+    """
+    batch = _shared_constituency_strategies(get_dataset_version(df, geo_df), df, geo_df)
+    if constituency not in batch['profiles']:
+        return None
+    return {
+        'profile': {**batch['profiles'][constituency], 'mp_strategy': batch['strategies'][constituency]},
+        'metrics': batch['metrics'][constituency],
+        'strategy': batch['strategies'][constituency]
+    }
+
+@dataset_cache
+def _cached_mp_strategy(metrics_version, constituency, _metrics, _southampton_data):
+    return generate_mp_strategy(_metrics, _southampton_data)
+
+def get_mp_strategy(metrics, southampton_data):
+    """generate_mp_strategy memoized per (metrics version, constituency).
+
+    Profiles from get_constituency_strategy() carry their batch-built 'mp_strategy'.
+    Metrics without a version (not produced by get_success_metrics) are computed directly.
+    """
+    if 'mp_strategy' in southampton_data:
+        return southampton_data['mp_strategy']
+    metrics_version = metrics.get('metrics_version')
+    if metrics_version is None:
+        return generate_mp_strategy(metrics, southampton_data)
+    constituency = southampton_data.get('constituency', 'Southampton, Test')
+    return _cached_mp_strategy(metrics_version, constituency, metrics, southampton_data)
+
 def display_mp_strategy(strategy, metrics):
     """Display comprehensive MP strategic recommendations"""
     if not strategy:
@@ -2187,8 +4546,8 @@ def display_strategic_priorities(success_metrics, southampton_data):
             st.warning("⚠️ Strategic analysis requires success metrics data")
             return
             
-        # Generate strategy
-        strategy = generate_mp_strategy(success_metrics, southampton_data)
+        # Generate strategy (shared with the other Strategy tabs)
+        strategy = get_mp_strategy(success_metrics, southampton_data)
         if not strategy:
             return
             
@@ -2281,7 +4640,7 @@ def display_investment_opportunities(success_metrics, southampton_data):
             st.warning("⚠️ Investment analysis requires success metrics data")
             return
             
-        strategy = generate_mp_strategy(success_metrics, southampton_data)
+        strategy = get_mp_strategy(success_metrics, southampton_data)
         if not strategy:
             return
             
@@ -2459,6 +4818,30 @@ def display_parliamentary_actions(success_metrics, southampton_data):
     except Exception as e:
         st.error(f"Error displaying parliamentary actions: {str(e)}")
 
+def lazy_tabs(labels, key):
+    """st.tabs where only the selected tab's body needs to run.
+
+    With tab state tracking (``on_change="rerun"``) each tab exposes ``.open``; guard the
+    body with tab_is_open() so unselected tabs skip their computation and figure building.
+    Streamlit versions without tab state fall back to plain, eagerly rendered tabs.
+    """
+    try:
+        return st.tabs(labels, key=key, on_change="rerun")
+    except TypeError:
+        return st.tabs(labels)
+
+def tab_is_open(tab):
+    """True for the selected tab; tabs without state tracking always render"""
+    return getattr(tab, 'open', None) is not False
+
+@dataset_cache
+def _cached_figure(dataset_version, figure_name, _build, _frames):
+    return _build(*_frames)
+
+def get_cached_figure(figure_name, build, *frames):
+    """Build a Plotly figure from one or more frames once per dataset version"""
+    return _cached_figure(get_dataset_version(*frames), figure_name, build, frames)
+
 def main():
     """Main Streamlit application"""
     
@@ -2485,11 +4868,34 @@ def main():
         ["Executive Summary", "Data Analysis & Insights", "Southampton Analysis"],
         label_visibility="collapsed"
     )
+
+    refresh_requested = st.sidebar.button(
+        "🔄 Refresh Data",
+        help="Reload the portfolio workbook. Cached analysis is only rebuilt if the data has changed.",
+        use_container_width=True
+    )
     
+    page_started = time.perf_counter()
+
     # Load data
-    with st.spinner("Loading NIHR dataset and performing analysis..."):
+    with st.spinner("Loading NIHR dataset and performing analysis..."), timing_span('page.load_and_assess') as load_span:
         df, geo_df = load_data()
-        quality_results = assess_data_quality(df)
+        load_span.note(rows=len(df))
+        if refresh_requested:
+            df, geo_df, data_changed = refresh_data(df, geo_df)
+            delta = get_portfolio_aggregates(df).get('delta') if data_changed else None
+            if delta:
+                st.sidebar.success(f"✅ New data loaded - {delta['added']:,} new, {delta['changed']:,} changed and "
+                                   f"{delta['removed']:,} removed projects applied incrementally")
+            elif data_changed:
+                st.sidebar.success("✅ New data loaded - analysis refreshed")
+            else:
+                st.sidebar.info("ℹ️ Data unchanged - using cached analysis")
+        quality_results = get_quality_assessment(df)
+
+    # Sidebar filters slice the summary and Southampton pages; quality covers the whole workbook
+    filters = render_portfolio_filters(df, geo_df)
+    view_df = get_filtered_portfolio(df, geo_df, filters)
     
     # Executive Summary
     if section == "Executive Summary":
@@ -2513,9 +4919,10 @@ def main():
         </div>
         """, unsafe_allow_html=True)
 
-        # Calculate common variables for use across metrics
-        total_value = df['Award_Amount'].sum() if 'Award_Amount' in df.columns else 0
-        avg_award = df['Award_Amount'].mean() if 'Award_Amount' in df.columns else 0
+        # Calculate common variables for use across metrics (constituency cube under the filters)
+        kpis = portfolio_kpis(df, geo_df, filters)
+        total_value = kpis['total_value']
+        avg_award = kpis['avg_award']
 
         # Enhanced Core Metrics Section
         st.markdown("""
@@ -2546,7 +4953,7 @@ def main():
                 margin-bottom: 15px;
                 box-shadow: 0 6px 20px rgba(0,0,0,0.15);
             ">
-                <h1 style="margin: 0; font-size: 2.5rem; font-weight: bold;">{len(df):,}</h1>
+                <h1 style="margin: 0; font-size: 2.5rem; font-weight: bold;">{kpis['projects']:,}</h1>
                 <h3 style="margin: 10px 0 5px 0;">Total Projects</h3>
                 <p style="margin: 0; opacity: 0.8;">NIHR Portfolio</p>
             </div>
@@ -2587,8 +4994,8 @@ def main():
             """, unsafe_allow_html=True)
         
         with col4:
-            active_projects = len(df[df['Project_Status'] == 'Active']) if 'Project_Status' in df.columns else 0
-            total_projects = len(df)
+            active_projects = kpis['active']
+            total_projects = kpis['projects']
             active_percentage = (active_projects / total_projects * 100) if total_projects > 0 else 0
             
             st.markdown(f"""
@@ -2625,22 +5032,10 @@ def main():
         # ROI Analysis Cards
         col1, col2, col3 = st.columns(3)
         
-        # ROI Analysis by Programme Type
+        # ROI Analysis by Programme Type (PROGRAMME_TAXONOMY categories, selected from the bitmap index)
         if 'Programme' in df.columns and 'Award_Amount' in df.columns:
-            # Calculate Research vs Training ROI
-            research_programmes = ['Research for Patient Benefit', 'Health Technology Assessment', 
-                                 'Public Health Research', 'Health Services Research', 'Policy Research',
-                                 'Research', 'Clinical Research', 'Biomedical Research']
-            training_programmes = ['Training', 'Fellowship', 'Career Development', 'Doctoral Training',
-                                 'Academic Training', 'Professional Development']
-            
-            # Research ROI
-            research_mask = df['Programme'].str.contains('|'.join(research_programmes), case=False, na=False)
-            research_projects = df[research_mask]
-            
-            # Training ROI  
-            training_mask = df['Programme'].str.contains('|'.join(training_programmes), case=False, na=False)
-            training_projects = df[training_mask]
+            research_projects = programme_category_rows(df, geo_df, 'Research', filters)
+            training_projects = programme_category_rows(df, geo_df, 'Training', filters)
             
             with col1:
                 if len(research_projects) > 0:
@@ -2717,7 +5112,7 @@ def main():
         """, unsafe_allow_html=True)
 
         # Get Southampton data for enhanced display
-        southampton_data = create_southampton_analysis(df, geo_df)
+        southampton_data = get_southampton_analysis(df, geo_df, filters)
         
         # Enhanced Southampton Performance Cards
         col1, col2, col3, col4 = st.columns(4)
@@ -2834,8 +5229,8 @@ def main():
         
         with col4:
             # Calculate Portfolio Diversity
-            if 'Programme' in df.columns and southampton_data:
-                national_programmes = df['Programme'].nunique()
+            if 'Programme' in view_df.columns and southampton_data:
+                national_programmes = view_df['Programme'].nunique()
                 
                 if len(southampton_data['data']) > 0:
                     soton_programmes = southampton_data['data']['Programme'].nunique() if 'Programme' in southampton_data['data'].columns else 0
@@ -2952,7 +5347,7 @@ def main():
         
         with col3:
             # Portfolio diversity metric instead of growth trend
-            programme_count = df['Programme'].nunique() if 'Programme' in df.columns else 0
+            programme_count = view_df['Programme'].nunique() if 'Programme' in view_df.columns else 0
             total_possible_programmes = 50  # Approximate number of NIHR programmes
             diversity_pct = (programme_count / total_possible_programmes * 100) if total_possible_programmes > 0 else 0
             
@@ -3043,853 +5438,425 @@ def main():
         """, unsafe_allow_html=True)
         
         # Enhanced tabbed interface for better navigation
-        tab1, tab2 = st.tabs([
+        # Only the selected tab's content is built on each rerun
+        tab1, tab2 = lazy_tabs([
             "📊 Data Quality Assessment", 
             "🔧 Issues & Solutions"
-        ])
+        ], key="data_analysis_tabs")
         
         with tab1:
-            # Enhanced tab header with modern design
-            st.markdown("""
-            <div style="
-                background: linear-gradient(135deg, #4CAF50 0%, #45a049 100%);
-                color: white;
-                padding: 25px;
-                border-radius: 15px;
-                margin: 20px 0;
-                text-align: center;
-                box-shadow: 0 8px 32px rgba(76, 175, 80, 0.2);
-                position: relative;
-                overflow: hidden;
-            ">
-                <div style="
-                    position: absolute;
-                    top: -20px;
-                    right: -20px;
-                    width: 80px;
-                    height: 80px;
-                    background: rgba(255,255,255,0.1);
-                    border-radius: 50%;
-                "></div>
-                <div style="display: flex; align-items: center; justify-content: center; margin-bottom: 10px;">
-                    <div style="
-                        width: 50px;
-                        height: 50px;
-                        background: rgba(255,255,255,0.2);
-                        border-radius: 50%;
-                        display: flex;
-                        align-items: center;
-                        justify-content: center;
-                        font-size: 1.5rem;
-                        margin-right: 15px;
-                    ">📊</div>
-                    <h2 style="margin: 0; font-size: 2rem; font-weight: 700;">Data Quality Assessment</h2>
-                </div>
-                <p style="margin: 0; opacity: 0.95; font-size: 1.1rem;">
-                    Comprehensive evaluation of dataset completeness, consistency, and reliability
-                </p>
-                <div style="
-                    margin-top: 15px;
-                    padding: 6px 16px;
-                    background: rgba(255,255,255,0.2);
-                    border-radius: 20px;
-                    display: inline-block;
-                    font-size: 0.85rem;
-                    font-weight: 500;
-                ">
-                    Foundation Analysis
-                </div>
-            </div>
-            """, unsafe_allow_html=True)
-            
-            # Enhanced Quality Overview with modern cards
-            st.markdown("""
-            <div style="
-                background: rgba(255,255,255,0.05);
-                padding: 20px;
-                border-radius: 12px;
-                margin: 20px 0;
-                border: 1px solid rgba(76, 175, 80, 0.2);
-            ">
-                <h3 style="margin: 0 0 20px 0; color: #4CAF50; font-weight: 600;">🎯 Quality Metrics Dashboard</h3>
-            </div>
-            """, unsafe_allow_html=True)
-            
-            col1, col2, col3, col4 = st.columns(4)
-            scores = quality_results['overall_score']
-            
-            with col1:
-                completeness_color = "#4CAF50" if scores['completeness'] >= 90 else "#FF9800" if scores['completeness'] >= 70 else "#FF5722"
-                completeness_status = "Excellent" if scores['completeness'] >= 90 else "Good" if scores['completeness'] >= 70 else "Needs Work"
-                st.markdown(f"""
+            if tab_is_open(tab1):
+                # Enhanced tab header with modern design
+                st.markdown("""
                 <div style="
-                    background: linear-gradient(135deg, {completeness_color} 0%, {completeness_color}E6 100%);
+                    background: linear-gradient(135deg, #4CAF50 0%, #45a049 100%);
                     color: white;
                     padding: 25px;
                     border-radius: 15px;
+                    margin: 20px 0;
                     text-align: center;
-                    margin-bottom: 20px;
-                    box-shadow: 0 8px 32px rgba(0,0,0,0.15);
+                    box-shadow: 0 8px 32px rgba(76, 175, 80, 0.2);
                     position: relative;
                     overflow: hidden;
-                    transition: transform 0.3s ease;
                 ">
                     <div style="
                         position: absolute;
-                        top: -10px;
-                        right: -10px;
-                        width: 40px;
-                        height: 40px;
+                        top: -20px;
+                        right: -20px;
+                        width: 80px;
+                        height: 80px;
                         background: rgba(255,255,255,0.1);
                         border-radius: 50%;
                     "></div>
-                    <div style="
-                        display: flex;
-                        align-items: center;
-                        justify-content: center;
-                        margin-bottom: 10px;
-                    ">
+                    <div style="display: flex; align-items: center; justify-content: center; margin-bottom: 10px;">
                         <div style="
-                            width: 45px;
-                            height: 45px;
+                            width: 50px;
+                            height: 50px;
                             background: rgba(255,255,255,0.2);
                             border-radius: 50%;
                             display: flex;
                             align-items: center;
                             justify-content: center;
-                            font-size: 1.2rem;
-                            margin-right: 12px;
-                        ">📈</div>
-                        <h2 style="margin: 0; font-size: 2.2rem; font-weight: 800;">{scores['completeness']:.1f}%</h2>
+                            font-size: 1.5rem;
+                            margin-right: 15px;
+                        ">📊</div>
+                        <h2 style="margin: 0; font-size: 2rem; font-weight: 700;">Data Quality Assessment</h2>
                     </div>
-                    <h4 style="margin: 8px 0 5px 0; font-size: 1.1rem; font-weight: 600;">Completeness</h4>
-                    <p style="margin: 0; opacity: 0.9; font-size: 0.9rem;">Data coverage</p>
+                    <p style="margin: 0; opacity: 0.95; font-size: 1.1rem;">
+                        Comprehensive evaluation of dataset completeness, consistency, and reliability
+                    </p>
                     <div style="
-                        margin-top: 10px;
-                        padding: 4px 10px;
+                        margin-top: 15px;
+                        padding: 6px 16px;
                         background: rgba(255,255,255,0.2);
-                        border-radius: 10px;
+                        border-radius: 20px;
                         display: inline-block;
-                        font-size: 0.75rem;
+                        font-size: 0.85rem;
                         font-weight: 500;
                     ">
-                        {completeness_status}
+                        Foundation Analysis
                     </div>
                 </div>
                 """, unsafe_allow_html=True)
-                
-            with col2:
-                consistency_color = "#4CAF50" if scores['consistency'] >= 90 else "#FF9800" if scores['consistency'] >= 70 else "#FF5722"
-                st.markdown(f"""
-                <div style="
-                    background: linear-gradient(135deg, {consistency_color} 0%, {consistency_color}CC 100%);
-                    color: white;
-                    padding: 20px;
-                    border-radius: 10px;
-                    text-align: center;
-                    margin-bottom: 15px;
-                ">
-                    <h2 style="margin: 0; font-size: 2rem;">{scores['consistency']:.1f}%</h2>
-                    <h4 style="margin: 10px 0 5px 0;">Consistency</h4>
-                    <p style="margin: 0; opacity: 0.8; font-size: 0.9rem;">Data integrity</p>
-                </div>
-                """, unsafe_allow_html=True)
-                
-            with col3:
-                overall_color = "#4CAF50" if scores['overall'] >= 90 else "#FF9800" if scores['overall'] >= 70 else "#FF5722"
-                st.markdown(f"""
-                <div style="
-                    background: linear-gradient(135deg, {overall_color} 0%, {overall_color}CC 100%);
-                    color: white;
-                    padding: 20px;
-                    border-radius: 10px;
-                    text-align: center;
-                    margin-bottom: 15px;
-                ">
-                    <h2 style="margin: 0; font-size: 2rem;">{scores['overall']:.1f}%</h2>
-                    <h4 style="margin: 10px 0 5px 0;">Overall Score</h4>
-                    <p style="margin: 0; opacity: 0.8; font-size: 0.9rem;">Quality rating</p>
-                </div>
-                """, unsafe_allow_html=True)
-                
-            with col4:
-                grade_colors = {"A": "#4CAF50", "B": "#FF9800", "C": "#FF5722", "D": "#9E9E9E", "F": "#F44336"}
-                grade_color = grade_colors.get(scores['grade'], "#9E9E9E")
-                
-                st.markdown(f"""
+
+                timing = quality_results.get('assessment_timing')
+                if timing:
+                    st.caption(
+                        f"⏱️ Assessment computed in {timing['compute_seconds']:.2f}s at "
+                        f"{timing['computed_at']:%H:%M:%S} (dataset version {timing['dataset_version'][:8]}) - "
+                        "reused from cache on later reruns"
+                    )
+                dtype_report = df.attrs.get('dtype_report')
+                if dtype_report:
+                    st.caption(
+                        f"🗜️ Portfolio held in memory as {dtype_report['after_bytes'] / 1e6:,.1f} MB "
+                        f"(was {dtype_report['before_bytes'] / 1e6:,.1f} MB - {dtype_report['saved_percentage']:.0f}% saved "
+                        f"by categorical, integer and date dtypes)"
+                    )
+            
+                # Enhanced Quality Overview with modern cards
+                st.markdown("""
                 <div style="
-                    background: linear-gradient(135deg, {grade_color} 0%, {grade_color}CC 100%);
-                    color: white;
+                    background: rgba(255,255,255,0.05);
                     padding: 20px;
-                    border-radius: 10px;
-                    text-align: center;
-                    margin-bottom: 15px;
+                    border-radius: 12px;
+                    margin: 20px 0;
+                    border: 1px solid rgba(76, 175, 80, 0.2);
                 ">
-                    <h2 style="margin: 0; font-size: 2rem;">{scores['grade']}</h2>
-                    <h4 style="margin: 10px 0 5px 0;">Quality Grade</h4>
-                    <p style="margin: 0; opacity: 0.8; font-size: 0.9rem;">Letter grade</p>
+                    <h3 style="margin: 0 0 20px 0; color: #4CAF50; font-weight: 600;">🎯 Quality Metrics Dashboard</h3>
                 </div>
                 """, unsafe_allow_html=True)
-        
-            # Award analysis metrics (focused on quality, not issues)
-            if 'award_analysis' in quality_results:
-                award_stats = quality_results['award_analysis']
-                st.markdown("### 💰 Award Value Distribution")
-                col1, col2, col3 = st.columns(3)
-                
+            
+                col1, col2, col3, col4 = st.columns(4)
+                scores = quality_results['overall_score']
+            
                 with col1:
+                    completeness_color = "#4CAF50" if scores['completeness'] >= 90 else "#FF9800" if scores['completeness'] >= 70 else "#FF5722"
+                    completeness_status = "Excellent" if scores['completeness'] >= 90 else "Good" if scores['completeness'] >= 70 else "Needs Work"
                     st.markdown(f"""
                     <div style="
-                        background: linear-gradient(135deg, #4CAF50 0%, #45a049 100%);
+                        background: linear-gradient(135deg, {completeness_color} 0%, {completeness_color}E6 100%);
+                        color: white;
+                        padding: 25px;
+                        border-radius: 15px;
+                        text-align: center;
+                        margin-bottom: 20px;
+                        box-shadow: 0 8px 32px rgba(0,0,0,0.15);
+                        position: relative;
+                        overflow: hidden;
+                        transition: transform 0.3s ease;
+                    ">
+                        <div style="
+                            position: absolute;
+                            top: -10px;
+                            right: -10px;
+                            width: 40px;
+                            height: 40px;
+                            background: rgba(255,255,255,0.1);
+                            border-radius: 50%;
+                        "></div>
+                        <div style="
+                            display: flex;
+                            align-items: center;
+                            justify-content: center;
+                            margin-bottom: 10px;
+                        ">
+                            <div style="
+                                width: 45px;
+                                height: 45px;
+                                background: rgba(255,255,255,0.2);
+                                border-radius: 50%;
+                                display: flex;
+                                align-items: center;
+                                justify-content: center;
+                                font-size: 1.2rem;
+                                margin-right: 12px;
+                            ">📈</div>
+                            <h2 style="margin: 0; font-size: 2.2rem; font-weight: 800;">{scores['completeness']:.1f}%</h2>
+                        </div>
+                        <h4 style="margin: 8px 0 5px 0; font-size: 1.1rem; font-weight: 600;">Completeness</h4>
+                        <p style="margin: 0; opacity: 0.9; font-size: 0.9rem;">Data coverage</p>
+                        <div style="
+                            margin-top: 10px;
+                            padding: 4px 10px;
+                            background: rgba(255,255,255,0.2);
+                            border-radius: 10px;
+                            display: inline-block;
+                            font-size: 0.75rem;
+                            font-weight: 500;
+                        ">
+                            {completeness_status}
+                        </div>
+                    </div>
+                    """, unsafe_allow_html=True)
+                
+                with col2:
+                    consistency_color = "#4CAF50" if scores['consistency'] >= 90 else "#FF9800" if scores['consistency'] >= 70 else "#FF5722"
+                    st.markdown(f"""
+                    <div style="
+                        background: linear-gradient(135deg, {consistency_color} 0%, {consistency_color}CC 100%);
                         color: white;
                         padding: 20px;
                         border-radius: 10px;
                         text-align: center;
                         margin-bottom: 15px;
                     ">
-                        <h2 style="margin: 0; font-size: 1.2rem;">£{award_stats['mean_award']:,.0f}</h2>
-                        <h4 style="margin: 10px 0 5px 0;">Mean Award</h4>
-                        <p style="margin: 0; opacity: 0.8; font-size: 0.9rem;">Average funding</p>
+                        <h2 style="margin: 0; font-size: 2rem;">{scores['consistency']:.1f}%</h2>
+                        <h4 style="margin: 10px 0 5px 0;">Consistency</h4>
+                        <p style="margin: 0; opacity: 0.8; font-size: 0.9rem;">Data integrity</p>
                     </div>
                     """, unsafe_allow_html=True)
-                    
-                with col2:
+                
+                with col3:
+                    overall_color = "#4CAF50" if scores['overall'] >= 90 else "#FF9800" if scores['overall'] >= 70 else "#FF5722"
                     st.markdown(f"""
                     <div style="
-                        background: linear-gradient(135deg, #2196F3 0%, #1976D2 100%);
+                        background: linear-gradient(135deg, {overall_color} 0%, {overall_color}CC 100%);
                         color: white;
                         padding: 20px;
                         border-radius: 10px;
                         text-align: center;
                         margin-bottom: 15px;
                     ">
-                        <h2 style="margin: 0; font-size: 1.2rem;">£{award_stats.get('median_award', 0):,.0f}</h2>
-                        <h4 style="margin: 10px 0 5px 0;">Median Award</h4>
-                        <p style="margin: 0; opacity: 0.8; font-size: 0.9rem;">Typical funding</p>
+                        <h2 style="margin: 0; font-size: 2rem;">{scores['overall']:.1f}%</h2>
+                        <h4 style="margin: 10px 0 5px 0;">Overall Score</h4>
+                        <p style="margin: 0; opacity: 0.8; font-size: 0.9rem;">Quality rating</p>
                     </div>
                     """, unsafe_allow_html=True)
-                    
-                with col3:
+                
+                with col4:
+                    grade_colors = {"A": "#4CAF50", "B": "#FF9800", "C": "#FF5722", "D": "#9E9E9E", "F": "#F44336"}
+                    grade_color = grade_colors.get(scores['grade'], "#9E9E9E")
+                
                     st.markdown(f"""
                     <div style="
-                        background: linear-gradient(135deg, #FF9800 0%, #F57C00 100%);
+                        background: linear-gradient(135deg, {grade_color} 0%, {grade_color}CC 100%);
                         color: white;
                         padding: 20px;
                         border-radius: 10px;
                         text-align: center;
                         margin-bottom: 15px;
                     ">
-                        <h2 style="margin: 0; font-size: 1.2rem;">{award_stats['outliers_count']:,}</h2>
-                        <h4 style="margin: 10px 0 5px 0;">Outliers</h4>
-                        <p style="margin: 0; opacity: 0.8; font-size: 0.9rem;">Statistical anomalies</p>
+                        <h2 style="margin: 0; font-size: 2rem;">{scores['grade']}</h2>
+                        <h4 style="margin: 10px 0 5px 0;">Quality Grade</h4>
+                        <p style="margin: 0; opacity: 0.8; font-size: 0.9rem;">Letter grade</p>
                     </div>
                     """, unsafe_allow_html=True)
-                    
         
-            # Enhanced Duplicate Analysis with premium cards
-            if 'duplicate_analysis' in quality_results:
-                st.markdown("### 🔍 Duplicate Analysis")
-                dup_stats = quality_results['duplicate_analysis']
-                total_dups = dup_stats.get('total_duplicates', 0)
-                dup_percentage = (total_dups / len(df) * 100) if len(df) > 0 else 0
+                # Award analysis metrics (focused on quality, not issues)
+                if 'award_analysis' in quality_results:
+                    award_stats = quality_results['award_analysis']
+                    st.markdown("### 💰 Award Value Distribution")
+                    col1, col2, col3 = st.columns(3)
                 
-                # Main duplicate metrics card
-                severity_color = "#FF5722" if dup_percentage > 15 else "#FF9800" if dup_percentage > 10 else "#4CAF50"
-                st.markdown(f"""
-                <div style="
-                    background: linear-gradient(135deg, {severity_color} 0%, {severity_color}CC 100%);
-                    color: white;
-                    padding: 25px;
-                    border-radius: 15px;
-                    margin-bottom: 20px;
-                    box-shadow: 0 8px 32px rgba(0,0,0,0.1);
-                ">
-                    <div style="display: flex; align-items: center; justify-content: space-between;">
-                        <div>
-                            <h1 style="margin: 0; font-size: 3rem; font-weight: bold;">{total_dups:,}</h1>
-                            <h3 style="margin: 10px 0 5px 0; font-size: 1.4rem;">Duplicate Project Titles</h3>
-                            <p style="margin: 0; opacity: 0.9; font-size: 1.1rem;">{dup_percentage:.1f}% of total dataset</p>
+                    with col1:
+                        st.markdown(f"""
+                        <div style="
+                            background: linear-gradient(135deg, #4CAF50 0%, #45a049 100%);
+                            color: white;
+                            padding: 20px;
+                            border-radius: 10px;
+                            text-align: center;
+                            margin-bottom: 15px;
+                        ">
+                            <h2 style="margin: 0; font-size: 1.2rem;">£{award_stats['mean_award']:,.0f}</h2>
+                            <h4 style="margin: 10px 0 5px 0;">Mean Award</h4>
+                            <p style="margin: 0; opacity: 0.8; font-size: 0.9rem;">Average funding</p>
                         </div>
-                        <div style="font-size: 4rem; opacity: 0.3;">🔍</div>
-                    </div>
-                </div>
-                """, unsafe_allow_html=True)
-                
-                
-                # Action recommendations
-                st.markdown("""
-                <div style="
-                    background: linear-gradient(135deg, #607D8B 0%, #455A64 100%);
-                    color: white;
-                    padding: 20px;
-                    border-radius: 12px;
-                    margin: 15px 0;
-                ">
-                    <h4 style="margin: 0 0 10px 0;">🎯 Recommended Actions</h4>
-                    <ul style="margin: 0; padding-left: 20px;">
-                        <li>Manual review of duplicate project titles for data cleaning</li>
-                        <li>Implement unique constraint validation in data entry systems</li>
-                        <li>Consider automated deduplication workflows</li>
-                    </ul>
-                </div>
-                """, unsafe_allow_html=True)
-            
-            # Missing values analysis (specific to Data Quality tab)
-            st.markdown("### 📉 Data Completeness Analysis")
-            
-            # Add view toggle
-            view_option = st.radio(
-                "Choose visualization style:",
-                ["📊 Horizontal Bar Chart", "📋 Detailed Table View"],
-                horizontal=True
-            )
-            
-            if view_option == "📊 Horizontal Bar Chart":
-                missing_chart = create_missing_values_chart(quality_results)
-                st.plotly_chart(missing_chart, use_container_width=True)
-            else:
-                # Create detailed table view
-                missing_data = quality_results['missing_values']
-                sorted_data = sorted(missing_data.items(), key=lambda x: x[1]['count'], reverse=True)
-                
-                # Create DataFrame for table display
-                table_data = []
-                for col, data in sorted_data:
-                    completeness = 100 - data['percentage']
-                    status = "✅ Complete" if data['count'] == 0 else f"⚠️ {data['count']} missing"
-                    severity = ("🟢 Excellent" if completeness == 100 
-                               else "🟡 Good" if completeness > 99 
-                               else "🟠 Fair" if completeness > 95 
-                               else "🔴 Poor")
-                    
-                    table_data.append({
-                        "Column Name": col,
-                        "Missing Count": data['count'],
-                        "Missing %": f"{data['percentage']:.1f}%",
-                        "Completeness": f"{completeness:.1f}%",
-                        "Status": status,
-                        "Quality": severity
-                    })
-                
-                # Display the table (inside the else block)
-                df_table = pd.DataFrame(table_data)
-                
-                st.markdown("#### Data Completeness Summary Table")
-                st.dataframe(
-                    df_table,
-                    use_container_width=True,
-                    hide_index=True,
-                    column_config={
-                        "Column Name": st.column_config.TextColumn("Column Name", width="medium"),
-                        "Missing Count": st.column_config.NumberColumn("Missing Count", format="%d"),
-                        "Missing %": st.column_config.TextColumn("Missing %", width="small"),
-                        "Completeness": st.column_config.TextColumn("Completeness %", width="small"),
-                        "Status": st.column_config.TextColumn("Status", width="medium"),
-                        "Quality": st.column_config.TextColumn("Quality Rating", width="small")
-                    }
-                )
-            
-            # Award distribution analysis (specific to Data Quality tab)
-            st.markdown("### 📈 Award Distribution Analysis")
-            award_chart = create_award_distribution_chart(df)
-            if award_chart:
-                st.plotly_chart(award_chart, use_container_width=True)
-    
-        with tab2:
-            # Enhanced tab header with modern design
-            st.markdown("""
-            <div style="
-                background: linear-gradient(135deg, #FF9800 0%, #F57C00 100%);
-                color: white;
-                padding: 25px;
-                border-radius: 15px;
-                margin: 20px 0;
-                text-align: center;
-                box-shadow: 0 8px 32px rgba(255, 152, 0, 0.2);
-                position: relative;
-                overflow: hidden;
-            ">
-                <div style="
-                    position: absolute;
-                    top: -20px;
-                    right: -20px;
-                    width: 80px;
-                    height: 80px;
-                    background: rgba(255,255,255,0.1);
-                    border-radius: 50%;
-                "></div>
-                <div style="display: flex; align-items: center; justify-content: center; margin-bottom: 10px;">
-                    <div style="
-                        width: 50px;
-                        height: 50px;
-                        background: rgba(255,255,255,0.2);
-                        border-radius: 50%;
-                        display: flex;
-                        align-items: center;
-                        justify-content: center;
-                        font-size: 1.5rem;
-                        margin-right: 15px;
-                    ">🔧</div>
-                    <h2 style="margin: 0; font-size: 2rem; font-weight: 700;">Issues & Solutions</h2>
-                </div>
-                <p style="margin: 0; opacity: 0.95; font-size: 1.1rem;">
-                    Identification and resolution of data quality challenges
-                </p>
-                <div style="
-                    margin-top: 15px;
-                    padding: 6px 16px;
-                    background: rgba(255,255,255,0.2);
-                    border-radius: 20px;
-                    display: inline-block;
-                    font-size: 0.85rem;
-                    font-weight: 500;
-                ">
-                    Problem Resolution
-                </div>
-            </div>
-            """, unsafe_allow_html=True)
-        
-            # Enhanced Issues Overview with modern cards
-            st.markdown("""
-            <div style="
-                background: rgba(255,255,255,0.05);
-                padding: 20px;
-                border-radius: 12px;
-                margin: 20px 0;
-                border: 1px solid rgba(255, 152, 0, 0.2);
-            ">
-                <h3 style="margin: 0 0 20px 0; color: #FF9800; font-weight: 600;">🚨 Critical Issues Dashboard</h3>
-            </div>
-            """, unsafe_allow_html=True)
-            col1, col2, col3, col4 = st.columns(4)
-            
-            # Enhanced issue metrics with modern gradient cards
-            with col1:
-                st.markdown("""
-                <div style="
-                    background: linear-gradient(135deg, #FF5722 0%, #E53935E6 100%);
-                    color: white;
-                    padding: 25px;
-                    border-radius: 15px;
-                    text-align: center;
-                    margin-bottom: 20px;
-                    box-shadow: 0 8px 32px rgba(0,0,0,0.15);
-                    position: relative;
-                    overflow: hidden;
-                ">
-                    <div style="
-                        position: absolute;
-                        top: -10px;
-                        right: -10px;
-                        width: 40px;
-                        height: 40px;
-                        background: rgba(255,255,255,0.1);
-                        border-radius: 50%;
-                    "></div>
-                    <div style="
-                        display: flex;
-                        align-items: center;
-                        justify-content: center;
-                        margin-bottom: 10px;
-                    ">
-                        <div style="
-                            width: 45px;
-                            height: 45px;
-                            background: rgba(255,255,255,0.2);
-                            border-radius: 50%;
-                            display: flex;
-                            align-items: center;
-                            justify-content: center;
-                            font-size: 1.2rem;
-                            margin-right: 12px;
-                        ">🔍</div>
-                        <h2 style="margin: 0; font-size: 1.8rem; font-weight: 800;">Enhanced</h2>
-                    </div>
-                    <h4 style="margin: 8px 0 5px 0; font-size: 1.1rem; font-weight: 600;">Missing Values</h4>
-                    <p style="margin: 0; opacity: 0.9; font-size: 0.9rem;">+15% accuracy</p>
-                    <div style="
-                        margin-top: 10px;
-                        padding: 4px 10px;
-                        background: rgba(255,255,255,0.2);
-                        border-radius: 10px;
-                        display: inline-block;
-                        font-size: 0.75rem;
-                        font-weight: 500;
-                    ">
-                        Detection Improved
-                    </div>
-                </div>
-                """, unsafe_allow_html=True)
-                
-            with col2:
-                # Focus on data validation issues unique to this tab
-                st.markdown("""
-                <div style="
-                    background: linear-gradient(135deg, #FF9800 0%, #F57C00 100%);
-                    color: white;
-                    padding: 25px;
-                    border-radius: 15px;
-                    margin-bottom: 20px;
-                    box-shadow: 0 8px 32px rgba(255, 152, 0, 0.2);
-                    position: relative;
-                    overflow: hidden;
-                ">
-                    <div style="
-                        position: absolute;
-                        top: -10px;
-                        right: -10px;
-                        width: 40px;
-                        height: 40px;
-                        background: rgba(255,255,255,0.1);
-                        border-radius: 50%;
-                    "></div>
-                    <div style="display: flex; align-items: center; margin-bottom: 15px;">
-                        <div style="
-                            width: 45px;
-                            height: 45px;
-                            background: rgba(255,255,255,0.2);
-                            border-radius: 50%;
-                            display: flex;
-                            align-items: center;
-                            justify-content: center;
-                            font-size: 1.2rem;
-                            margin-right: 12px;
-                        ">✅</div>
-                        <h2 style="margin: 0; font-size: 1.4rem; font-weight: 800;">NIHR Business Rules</h2>
-                    </div>
-                    <div style="margin-left: 57px;">
-                        <h4 style="margin: 8px 0 5px 0; font-size: 1rem; font-weight: 600;">Validation Issues Addressed:</h4>
-                        <p style="margin: 5px 0; font-size: 0.85rem; opacity: 0.9;">• Programme-specific funding thresholds</p>
-                        <p style="margin: 5px 0; font-size: 0.85rem; opacity: 0.9;">• Training vs Research award categorization</p>
-                        <p style="margin: 5px 0; font-size: 0.85rem; opacity: 0.9;">• Institution eligibility validation</p>
-                        <p style="margin: 5px 0; font-size: 0.85rem; opacity: 0.9;">• Award duration consistency checks</p>
-                        <p style="margin: 5px 0; font-size: 0.85rem; opacity: 0.9;">• Zero-value training programme logic</p>
-                    </div>
-                    <div style="
-                        margin-top: 15px;
-                        padding: 8px 16px;
-                        background: rgba(255,255,255,0.2);
-                        border-radius: 20px;
-                        display: inline-block;
-                        font-size: 0.75rem;
-                        font-weight: 500;
-                    ">
-                        ✅ NIHR Standards Applied
-                    </div>
-                </div>
-                """, unsafe_allow_html=True)
-                    
-            with col3:
-                if 'duplicate_analysis' in quality_results:
-                    total_dups = quality_results['duplicate_analysis'].get('total_duplicates', 0)
-                    st.markdown(f"""
-                    <div style="
-                        background: linear-gradient(135deg, #9C27B0 0%, #7B1FA2 100%);
-                        color: white;
-                        padding: 20px;
-                        border-radius: 10px;
-                        text-align: center;
-                        margin-bottom: 15px;
-                    ">
-                        <h2 style="margin: 0; font-size: 1.5rem;">{total_dups:,}</h2>
-                        <h4 style="margin: 10px 0 5px 0;">Duplicates</h4>
-                        <p style="margin: 0; opacity: 0.8; font-size: 0.9rem;">{(total_dups/len(df)*100):.1f}% of data</p>
-                    </div>
-                    """, unsafe_allow_html=True)
-                    
-            with col4:
-                st.markdown("""
-                <div style="
-                    background: linear-gradient(135deg, #4CAF50 0%, #45a049 100%);
-                    color: white;
-                    padding: 20px;
-                    border-radius: 10px;
-                    text-align: center;
-                    margin-bottom: 15px;
-                ">
-                    <h2 style="margin: 0; font-size: 1.5rem;">95%+</h2>
-                    <h4 style="margin: 10px 0 5px 0;">Geo Mapping</h4>
-                    <p style="margin: 0; opacity: 0.8; font-size: 0.9rem;">Success rate</p>
-                </div>
-                """, unsafe_allow_html=True)
-            
-            # Zero Awards Analysis (unique to Issues & Solutions)
-            if 'award_analysis' in quality_results:
-                zero_count = quality_results['award_analysis']['zero_count']
-                st.markdown("### 🎯 Zero Awards Investigation")
-                st.markdown(f"""
-                <div style="
-                    background: linear-gradient(135deg, #FF5722 0%, #E53935 100%);
-                    color: white;
-                    padding: 20px;
-                    border-radius: 12px;
-                    margin: 15px 0;
-                ">
-                    <h3 style="margin: 0;">Critical Issue: {zero_count:,} Zero Award Records</h3>
-                    <p style="margin: 10px 0 0 0; opacity: 0.9;">
-                        86.6% of zero awards are Training programmes - suggests data entry pattern rather than data quality issue
-                    </p>
-                </div>
-                """, unsafe_allow_html=True)
-            
-            # Enhanced Solutions Overview
-            st.markdown("### ✅ Solutions Implemented")
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                st.metric("Pattern Matching", "26+", "Missing value types")
-            with col2:
-                st.metric("Outlier Detection", "Multi-method", "Z-score + IQR")
-            
-            # Missing Value Patterns - Detailed View (specific to Issues & Solutions tab)
-            st.markdown("### 🔍 Enhanced Missing Value Detection - 26 Patterns")
-            
-            # Group patterns by category for detailed display
-            pattern_categories = {
-                'Standard Null': ['', ' ', 'null', 'NULL'],
-                'N/A Variations': ['n/a', 'na', 'N/A', 'NA'],
-                'Not Available': ['not available', 'Not Available', 'NOT AVAILABLE'],
-                'Not Known': ['not known', 'Not Known', 'NOT KNOWN'],
-                'To Be Confirmed': ['tbc', 'TBC', 'To be confirmed'],
-                'Unknown': ['unknown', 'Unknown', 'UNKNOWN'],
-                'None Variations': ['none', 'None', 'NONE'],
-                'Symbols': ['.', '-', '?']
-            }
-            
-            # Enhanced pattern display with premium cards
-            colors = [
-                "#4CAF50", "#2196F3", "#FF9800", "#9C27B0", 
-                "#FF5722", "#607D8B", "#795548"
-            ]
-            
-            # Reorganize categories for better display
-            display_categories = {
-                'Standard & Null': pattern_categories['Standard Null'],
-                'N/A Variations': pattern_categories['N/A Variations'],
-                'Not Available': pattern_categories['Not Available'],
-                'Not Known': pattern_categories['Not Known'],
-                'To Be Confirmed': pattern_categories['To Be Confirmed'],
-                'Unknown': pattern_categories['Unknown'],
-                'None & Symbols': pattern_categories['None Variations'] + pattern_categories['Symbols']
-            }
-            
-            for i, (category, patterns) in enumerate(display_categories.items()):
-                color = colors[i % len(colors)]
-                
-                # Create expandable sections for each category
-                with st.expander(f"🏷️ {category} ({len(patterns)} patterns)", expanded=True):
-                    st.markdown(f"""
-                <div style="
-                    background: linear-gradient(135deg, {color} 0%, {color}CC 100%);
-                    color: white;
-                    padding: 20px;
-                    border-radius: 12px;
-                    margin: 10px 0;
-                ">
-                    <div style="display: grid; grid-template-columns: repeat(auto-fit, minmax(120px, 1fr)); gap: 8px;">
-                    """, unsafe_allow_html=True)
+                        """, unsafe_allow_html=True)
                     
-                    for pattern in patterns:
-                        display_pattern = "'empty string'" if pattern == '' else f"'{pattern}'"
+                    with col2:
                         st.markdown(f"""
                         <div style="
-                            background: rgba(255,255,255,0.2);
-                            padding: 6px 10px;
-                            border-radius: 6px;
+                            background: linear-gradient(135deg, #2196F3 0%, #1976D2 100%);
+                            color: white;
+                            padding: 20px;
+                            border-radius: 10px;
                             text-align: center;
-                            font-family: monospace;
-                            font-size: 0.85rem;
-                            border: 1px solid rgba(255,255,255,0.3);
-                            word-break: break-all;
+                            margin-bottom: 15px;
                         ">
-                            {display_pattern}
+                            <h2 style="margin: 0; font-size: 1.2rem;">£{award_stats.get('median_award', 0):,.0f}</h2>
+                            <h4 style="margin: 10px 0 5px 0;">Median Award</h4>
+                            <p style="margin: 0; opacity: 0.8; font-size: 0.9rem;">Typical funding</p>
                         </div>
                         """, unsafe_allow_html=True)
                     
-                    st.markdown("</div></div>", unsafe_allow_html=True)
-            
-            # Summary statistics card (within tab2)
-            total_patterns = sum(len(patterns) for patterns in display_categories.values())
-            st.markdown(f"""
-            <div style="
-                background: linear-gradient(135deg, #37474F 0%, #263238 100%);
-                color: white;
-                padding: 20px;
-                border-radius: 12px;
-                margin: 20px 0;
-                text-align: center;
-            ">
-                <h3 style="margin: 0 0 15px 0;">📊 Pattern Detection Summary</h3>
-                <div style="display: flex; justify-content: space-around; flex-wrap: wrap;">
-                    <div style="margin: 5px;">
-                        <h2 style="margin: 0; color: #4CAF50;">{total_patterns}</h2>
-                        <p style="margin: 0; opacity: 0.8; font-size: 0.9rem;">Total Patterns</p>
-                    </div>
-                    <div style="margin: 5px;">
-                        <h2 style="margin: 0; color: #2196F3;">{len(display_categories)}</h2>
-                        <p style="margin: 0; opacity: 0.8; font-size: 0.9rem;">Categories</p>
-                    </div>
-                    <div style="margin: 5px;">
-                        <h2 style="margin: 0; color: #FF9800;">+15%</h2>
-                        <p style="margin: 0; opacity: 0.8; font-size: 0.9rem;">Accuracy Gain</p>
-                    </div>
-                </div>
-            </div>
-            """, unsafe_allow_html=True)
-            
-            # Enhanced Process Improvements with Descriptive Tiles
-            st.markdown("### 🔄 Process Improvements & Solutions Implemented")
-            
-            # Enhanced Process Improvements with modern descriptive tiles
-            st.markdown("""
-            <div style="
-                background: rgba(255,255,255,0.05);
-                padding: 20px;
-                border-radius: 12px;
-                margin: 20px 0;
-                border: 1px solid rgba(255, 152, 0, 0.2);
-            ">
-                <h3 style="margin: 0 0 20px 0; color: #FF9800; font-weight: 600;">🚀 Implementation Results & Process Enhancements</h3>
-            </div>
-            """, unsafe_allow_html=True)
-            
-            # Create enhanced process improvement tiles in a 2x2 grid
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                # Detection Accuracy Enhancement
-                st.markdown("""
-                <div style="
-                    background: linear-gradient(135deg, #4CAF50 0%, #45a049 100%);
-                    color: white;
-                    padding: 30px;
-                    border-radius: 15px;
-                    margin-bottom: 20px;
-                    box-shadow: 0 8px 32px rgba(76, 175, 80, 0.2);
-                    position: relative;
-                    overflow: hidden;
-                    transition: transform 0.3s ease;
-                ">
-                    <div style="
-                        position: absolute;
-                        top: -20px;
-                        right: -20px;
-                        width: 80px;
-                        height: 80px;
-                        background: rgba(255,255,255,0.1);
-                        border-radius: 50%;
-                    "></div>
-                    <div style="display: flex; align-items: center; margin-bottom: 15px;">
+                    with col3:
+                        st.markdown(f"""
                         <div style="
-                            width: 50px;
-                            height: 50px;
-                            background: rgba(255,255,255,0.2);
-                            border-radius: 50%;
-                            display: flex;
-                            align-items: center;
-                            justify-content: center;
-                            font-size: 1.5rem;
-                            margin-right: 15px;
-                        ">🎯</div>
-                        <div>
-                            <h2 style="margin: 0; font-size: 2.5rem; font-weight: 800;">+15%</h2>
-                            <h4 style="margin: 5px 0; font-size: 1.2rem; font-weight: 600;">Detection Accuracy</h4>
+                            background: linear-gradient(135deg, #FF9800 0%, #F57C00 100%);
+                            color: white;
+                            padding: 20px;
+                            border-radius: 10px;
+                            text-align: center;
+                            margin-bottom: 15px;
+                        ">
+                            <h2 style="margin: 0; font-size: 1.2rem;">{award_stats['outliers_count']:,}</h2>
+                            <h4 style="margin: 10px 0 5px 0;">Outliers</h4>
+                            <p style="margin: 0; opacity: 0.8; font-size: 0.9rem;">Statistical anomalies</p>
                         </div>
-                    </div>
-                    <div style="margin-left: 65px;">
-                        <p style="margin: 8px 0; font-size: 1rem; opacity: 0.95;"><strong>🔍 Enhanced Pattern Matching:</strong></p>
-                        <p style="margin: 5px 0; font-size: 0.9rem; opacity: 0.9;">• Expanded from 15 to 26+ missing value patterns</p>
-                        <p style="margin: 5px 0; font-size: 0.9rem; opacity: 0.9;">• Added "Not Known" and case variations</p>
-                        <p style="margin: 5px 0; font-size: 0.9rem; opacity: 0.9;">• Improved null detection algorithms</p>
-                        <p style="margin: 5px 0; font-size: 0.9rem; opacity: 0.9;">• Multi-language pattern recognition</p>
-                    </div>
-                    <div style="
-                        margin-top: 15px;
-                        padding: 8px 16px;
-                        background: rgba(255,255,255,0.2);
-                        border-radius: 20px;
-                        display: inline-block;
-                        font-size: 0.85rem;
-                        font-weight: 500;
-                    ">
-                        ✅ Implemented & Validated
-                    </div>
-                </div>
-                """, unsafe_allow_html=True)
+                        """, unsafe_allow_html=True)
+                    
+        
+                # Enhanced Duplicate Analysis with premium cards
+                if 'duplicate_analysis' in quality_results:
+                    st.markdown("### 🔍 Duplicate Analysis")
+                    dup_stats = quality_results['duplicate_analysis']
+                    total_dups = dup_stats.get('total_duplicates', 0)
+                    dup_percentage = (total_dups / len(df) * 100) if len(df) > 0 else 0
                 
-                # Data Coverage Enhancement
-                st.markdown("""
-                <div style="
-                    background: linear-gradient(135deg, #2196F3 0%, #1976D2 100%);
-                    color: white;
-                    padding: 30px;
-                    border-radius: 15px;
-                    margin-bottom: 20px;
-                    box-shadow: 0 8px 32px rgba(33, 150, 243, 0.2);
-                    position: relative;
-                    overflow: hidden;
-                    transition: transform 0.3s ease;
-                ">
+                    # Main duplicate metrics card
+                    severity_color = "#FF5722" if dup_percentage > 15 else "#FF9800" if dup_percentage > 10 else "#4CAF50"
+                    st.markdown(f"""
                     <div style="
-                        position: absolute;
-                        top: -20px;
-                        right: -20px;
-                        width: 80px;
-                        height: 80px;
-                        background: rgba(255,255,255,0.1);
-                        border-radius: 50%;
-                    "></div>
-                    <div style="display: flex; align-items: center; margin-bottom: 15px;">
-                        <div style="
-                            width: 50px;
-                            height: 50px;
-                            background: rgba(255,255,255,0.2);
-                            border-radius: 50%;
-                            display: flex;
-                            align-items: center;
-                            justify-content: center;
-                            font-size: 1.5rem;
-                            margin-right: 15px;
-                        ">🗺️</div>
-                        <div>
-                            <h2 style="margin: 0; font-size: 2.5rem; font-weight: 800;">95%+</h2>
-                            <h4 style="margin: 5px 0; font-size: 1.2rem; font-weight: 600;">Data Coverage</h4>
+                        background: linear-gradient(135deg, {severity_color} 0%, {severity_color}CC 100%);
+                        color: white;
+                        padding: 25px;
+                        border-radius: 15px;
+                        margin-bottom: 20px;
+                        box-shadow: 0 8px 32px rgba(0,0,0,0.1);
+                    ">
+                        <div style="display: flex; align-items: center; justify-content: space-between;">
+                            <div>
+                                <h1 style="margin: 0; font-size: 3rem; font-weight: bold;">{total_dups:,}</h1>
+                                <h3 style="margin: 10px 0 5px 0; font-size: 1.4rem;">Duplicate Project Titles</h3>
+                                <p style="margin: 0; opacity: 0.9; font-size: 1.1rem;">{dup_percentage:.1f}% of total dataset</p>
+                            </div>
+                            <div style="font-size: 4rem; opacity: 0.3;">🔍</div>
                         </div>
                     </div>
-                    <div style="margin-left: 65px;">
-                        <p style="margin: 8px 0; font-size: 1rem; opacity: 0.95;"><strong>🌍 Geographical Mapping:</strong></p>
-                        <p style="margin: 5px 0; font-size: 0.9rem; opacity: 0.9;">• Multi-level postcode validation system</p>
-                        <p style="margin: 5px 0; font-size: 0.9rem; opacity: 0.9;">• Constituency boundary integration</p>
-                        <p style="margin: 5px 0; font-size: 0.9rem; opacity: 0.9;">• Regional distribution analysis</p>
-                        <p style="margin: 5px 0; font-size: 0.9rem; opacity: 0.9;">• Cross-reference validation checks</p>
-                    </div>
+                    """, unsafe_allow_html=True)
+                
+                    # Drill-down into the actual duplicate groups behind the counts
+                    duplicate_index = get_duplicate_index(df)
+                    with st.expander("🔎 Explore duplicate groups"):
+                        key_labels = {
+                            stat: entry['column'] or 'Complete rows'
+                            for stat, entry in duplicate_index.items() if entry['group_count'] > 0
+                        }
+                        if not key_labels:
+                            st.caption("No duplicate groups found")
+                        else:
+                            duplicate_key = st.selectbox("Duplicate key", list(key_labels), format_func=key_labels.get,
+                                                         key="duplicate_key")
+                            entry = duplicate_index[duplicate_key]
+                            group_table = duplicate_group_table(df, entry).head(200)
+                            st.caption(f"{entry['group_count']:,} groups covering {entry['row_count']:,} records "
+                                       f"(largest {len(group_table):,} shown)")
+                            st.dataframe(group_table, use_container_width=True, hide_index=True)
+
+                            group_options = {
+                                f"#{row.Group} · {row.Value[:60]} ({row.Rows:,} records)": row.Group
+                                for row in group_table.itertuples()
+                            }
+                            group_choice = st.selectbox("Show records of group", list(group_options), key="duplicate_group")
+                            st.dataframe(duplicate_group_rows(df, entry, group_options[group_choice]), use_container_width=True)
+
+                    # Near-identical titles (case, punctuation, spelling) clustered with MinHash/LSH
+                    if 'Project_Title' in df.columns:
+                        with st.expander("🧬 Review near-duplicate title clusters"):
+                            similarity = st.slider("Title similarity threshold", 0.5, 1.0, NEAR_DUPLICATE_THRESHOLD, 0.05,
+                                                   key="near_duplicate_threshold",
+                                                   help="Jaccard similarity of 3-character shingles after normalising case and punctuation")
+                            title_clusters = get_title_clusters(df, threshold=similarity)
+                            cluster_table = title_cluster_table(title_clusters)
+                            st.caption(f"{title_clusters['row_count']:,} records share a title with at least one other record; "
+                                       f"{len(cluster_table):,} clusters hold differently written titles (largest 200 shown)")
+                            st.dataframe(cluster_table.head(200), use_container_width=True, hide_index=True)
+
+                    # Action recommendations
+                    st.markdown("""
                     <div style="
-                        margin-top: 15px;
-                        padding: 8px 16px;
-                        background: rgba(255,255,255,0.2);
-                        border-radius: 20px;
-                        display: inline-block;
-                        font-size: 0.85rem;
-                        font-weight: 500;
+                        background: linear-gradient(135deg, #607D8B 0%, #455A64 100%);
+                        color: white;
+                        padding: 20px;
+                        border-radius: 12px;
+                        margin: 15px 0;
                     ">
-                        ✅ High Accuracy Achieved
+                        <h4 style="margin: 0 0 10px 0;">🎯 Recommended Actions</h4>
+                        <ul style="margin: 0; padding-left: 20px;">
+                            <li>Manual review of duplicate project titles for data cleaning</li>
+                            <li>Implement unique constraint validation in data entry systems</li>
+                            <li>Consider automated deduplication workflows</li>
+                        </ul>
                     </div>
-                </div>
-                """, unsafe_allow_html=True)
+                    """, unsafe_allow_html=True)
+            
+                # Missing values analysis (specific to Data Quality tab)
+                st.markdown("### 📉 Data Completeness Analysis")
+            
+                # Add view toggle
+                view_option = st.radio(
+                    "Choose visualization style:",
+                    ["📊 Horizontal Bar Chart", "📋 Detailed Table View"],
+                    horizontal=True
+                )
+            
+                if view_option == "📊 Horizontal Bar Chart":
+                    missing_chart = create_missing_values_chart(quality_results)
+                    st.plotly_chart(missing_chart, use_container_width=True)
+                else:
+                    # Create detailed table view
+                    missing_data = quality_results['missing_values']
+                    sorted_data = sorted(missing_data.items(), key=lambda x: x[1]['count'], reverse=True)
+                
+                    # Create DataFrame for table display
+                    table_data = []
+                    for col, data in sorted_data:
+                        completeness = 100 - data['percentage']
+                        status = "✅ Complete" if data['count'] == 0 else f"⚠️ {data['count']} missing"
+                        severity = ("🟢 Excellent" if completeness == 100 
+                                   else "🟡 Good" if completeness > 99 
+                                   else "🟠 Fair" if completeness > 95 
+                                   else "🔴 Poor")
+                    
+                        table_data.append({
+                            "Column Name": col,
+                            "Missing Count": data['count'],
+                            "Missing %": f"{data['percentage']:.1f}%",
+                            "Completeness": f"{completeness:.1f}%",
+                            "Status": status,
+                            "Quality": severity
+                        })
+                
+                    # Display the table (inside the else block)
+                    df_table = pd.DataFrame(table_data)
+                
+                    st.markdown("#### Data Completeness Summary Table")
+                    st.dataframe(
+                        df_table,
+                        use_container_width=True,
+                        hide_index=True,
+                        column_config={
+                            "Column Name": st.column_config.TextColumn("Column Name", width="medium"),
+                            "Missing Count": st.column_config.NumberColumn("Missing Count", format="%d"),
+                            "Missing %": st.column_config.TextColumn("Missing %", width="small"),
+                            "Completeness": st.column_config.TextColumn("Completeness %", width="small"),
+                            "Status": st.column_config.TextColumn("Status", width="medium"),
+                            "Quality": st.column_config.TextColumn("Quality Rating", width="small")
+                        }
+                    )
             
-            with col2:
-                # Processing Speed Enhancement
+                # Award distribution analysis (specific to Data Quality tab)
+                st.markdown("### 📈 Award Distribution Analysis")
+                award_chart = get_cached_figure('award_distribution', create_award_distribution_chart, df)
+                if award_chart:
+                    st.plotly_chart(award_chart, use_container_width=True)
+    
+        with tab2:
+            if tab_is_open(tab2):
+                # Enhanced tab header with modern design
                 st.markdown("""
                 <div style="
                     background: linear-gradient(135deg, #FF9800 0%, #F57C00 100%);
                     color: white;
-                    padding: 30px;
+                    padding: 25px;
                     border-radius: 15px;
-                    margin-bottom: 20px;
+                    margin: 20px 0;
+                    text-align: center;
                     box-shadow: 0 8px 32px rgba(255, 152, 0, 0.2);
                     position: relative;
                     overflow: hidden;
-                    transition: transform 0.3s ease;
                 ">
                     <div style="
                         position: absolute;
@@ -3900,7 +5867,7 @@ def main():
                         background: rgba(255,255,255,0.1);
                         border-radius: 50%;
                     "></div>
-                    <div style="display: flex; align-items: center; margin-bottom: 15px;">
+                    <div style="display: flex; align-items: center; justify-content: center; margin-bottom: 10px;">
                         <div style="
                             width: 50px;
                             height: 50px;
@@ -3911,93 +5878,573 @@ def main():
                             justify-content: center;
                             font-size: 1.5rem;
                             margin-right: 15px;
-                        ">⚡</div>
-                        <div>
-                            <h2 style="margin: 0; font-size: 2.5rem; font-weight: 800;">+40%</h2>
-                            <h4 style="margin: 5px 0; font-size: 1.2rem; font-weight: 600;">Processing Speed</h4>
-                        </div>
-                    </div>
-                    <div style="margin-left: 65px;">
-                        <p style="margin: 8px 0; font-size: 1rem; opacity: 0.95;"><strong>🤖 Automated Validation:</strong></p>
-                        <p style="margin: 5px 0; font-size: 0.9rem; opacity: 0.9;">• Vectorized operations for bulk processing</p>
-                        <p style="margin: 5px 0; font-size: 0.9rem; opacity: 0.9;">• Parallel duplicate detection algorithms</p>
-                        <p style="margin: 5px 0; font-size: 0.9rem; opacity: 0.9;">• Optimized statistical calculations</p>
-                        <p style="margin: 5px 0; font-size: 0.9rem; opacity: 0.9;">• Cached validation results</p>
+                        ">🔧</div>
+                        <h2 style="margin: 0; font-size: 2rem; font-weight: 700;">Issues & Solutions</h2>
                     </div>
+                    <p style="margin: 0; opacity: 0.95; font-size: 1.1rem;">
+                        Identification and resolution of data quality challenges
+                    </p>
                     <div style="
                         margin-top: 15px;
-                        padding: 8px 16px;
+                        padding: 6px 16px;
                         background: rgba(255,255,255,0.2);
                         border-radius: 20px;
                         display: inline-block;
                         font-size: 0.85rem;
                         font-weight: 500;
                     ">
-                        ⚡ Performance Optimized
+                        Problem Resolution
                     </div>
                 </div>
                 """, unsafe_allow_html=True)
-                
-                # Quality Grade Enhancement
+        
+                # Enhanced Issues Overview with modern cards
                 st.markdown("""
                 <div style="
-                    background: linear-gradient(135deg, #9C27B0 0%, #7B1FA2 100%);
-                    color: white;
-                    padding: 30px;
-                    border-radius: 15px;
-                    margin-bottom: 20px;
-                    box-shadow: 0 8px 32px rgba(156, 39, 176, 0.2);
-                    position: relative;
-                    overflow: hidden;
-                    transition: transform 0.3s ease;
+                    background: rgba(255,255,255,0.05);
+                    padding: 20px;
+                    border-radius: 12px;
+                    margin: 20px 0;
+                    border: 1px solid rgba(255, 152, 0, 0.2);
                 ">
+                    <h3 style="margin: 0 0 20px 0; color: #FF9800; font-weight: 600;">🚨 Critical Issues Dashboard</h3>
+                </div>
+                """, unsafe_allow_html=True)
+                col1, col2, col3, col4 = st.columns(4)
+            
+                # Enhanced issue metrics with modern gradient cards
+                with col1:
+                    st.markdown("""
                     <div style="
-                        position: absolute;
-                        top: -20px;
-                        right: -20px;
-                        width: 80px;
-                        height: 80px;
-                        background: rgba(255,255,255,0.1);
-                        border-radius: 50%;
-                    "></div>
-                    <div style="display: flex; align-items: center; margin-bottom: 15px;">
+                        background: linear-gradient(135deg, #FF5722 0%, #E53935E6 100%);
+                        color: white;
+                        padding: 25px;
+                        border-radius: 15px;
+                        text-align: center;
+                        margin-bottom: 20px;
+                        box-shadow: 0 8px 32px rgba(0,0,0,0.15);
+                        position: relative;
+                        overflow: hidden;
+                    ">
                         <div style="
-                            width: 50px;
-                            height: 50px;
-                            background: rgba(255,255,255,0.2);
+                            position: absolute;
+                            top: -10px;
+                            right: -10px;
+                            width: 40px;
+                            height: 40px;
+                            background: rgba(255,255,255,0.1);
                             border-radius: 50%;
+                        "></div>
+                        <div style="
                             display: flex;
                             align-items: center;
                             justify-content: center;
-                            font-size: 1.5rem;
-                            margin-right: 15px;
-                        ">🎓</div>
-                        <div>
-                            <h2 style="margin: 0; font-size: 2.5rem; font-weight: 800;">Grade B</h2>
-                            <h4 style="margin: 5px 0; font-size: 1.2rem; font-weight: 600;">Quality Score: 81%</h4>
+                            margin-bottom: 10px;
+                        ">
+                            <div style="
+                                width: 45px;
+                                height: 45px;
+                                background: rgba(255,255,255,0.2);
+                                border-radius: 50%;
+                                display: flex;
+                                align-items: center;
+                                justify-content: center;
+                                font-size: 1.2rem;
+                                margin-right: 12px;
+                            ">🔍</div>
+                            <h2 style="margin: 0; font-size: 1.8rem; font-weight: 800;">Enhanced</h2>
+                        </div>
+                        <h4 style="margin: 8px 0 5px 0; font-size: 1.1rem; font-weight: 600;">Missing Values</h4>
+                        <p style="margin: 0; opacity: 0.9; font-size: 0.9rem;">+15% accuracy</p>
+                        <div style="
+                            margin-top: 10px;
+                            padding: 4px 10px;
+                            background: rgba(255,255,255,0.2);
+                            border-radius: 10px;
+                            display: inline-block;
+                            font-size: 0.75rem;
+                            font-weight: 500;
+                        ">
+                            Detection Improved
+                        </div>
+                    </div>
+                    """, unsafe_allow_html=True)
+                
+                with col2:
+                    # Focus on data validation issues unique to this tab
+                    st.markdown("""
+                    <div style="
+                        background: linear-gradient(135deg, #FF9800 0%, #F57C00 100%);
+                        color: white;
+                        padding: 25px;
+                        border-radius: 15px;
+                        margin-bottom: 20px;
+                        box-shadow: 0 8px 32px rgba(255, 152, 0, 0.2);
+                        position: relative;
+                        overflow: hidden;
+                    ">
+                        <div style="
+                            position: absolute;
+                            top: -10px;
+                            right: -10px;
+                            width: 40px;
+                            height: 40px;
+                            background: rgba(255,255,255,0.1);
+                            border-radius: 50%;
+                        "></div>
+                        <div style="display: flex; align-items: center; margin-bottom: 15px;">
+                            <div style="
+                                width: 45px;
+                                height: 45px;
+                                background: rgba(255,255,255,0.2);
+                                border-radius: 50%;
+                                display: flex;
+                                align-items: center;
+                                justify-content: center;
+                                font-size: 1.2rem;
+                                margin-right: 12px;
+                            ">✅</div>
+                            <h2 style="margin: 0; font-size: 1.4rem; font-weight: 800;">NIHR Business Rules</h2>
+                        </div>
+                        <div style="margin-left: 57px;">
+                            <h4 style="margin: 8px 0 5px 0; font-size: 1rem; font-weight: 600;">Validation Issues Addressed:</h4>
+                            <p style="margin: 5px 0; font-size: 0.85rem; opacity: 0.9;">• Programme-specific funding thresholds</p>
+                            <p style="margin: 5px 0; font-size: 0.85rem; opacity: 0.9;">• Training vs Research award categorization</p>
+                            <p style="margin: 5px 0; font-size: 0.85rem; opacity: 0.9;">• Institution eligibility validation</p>
+                            <p style="margin: 5px 0; font-size: 0.85rem; opacity: 0.9;">• Award duration consistency checks</p>
+                            <p style="margin: 5px 0; font-size: 0.85rem; opacity: 0.9;">• Zero-value training programme logic</p>
+                        </div>
+                        <div style="
+                            margin-top: 15px;
+                            padding: 8px 16px;
+                            background: rgba(255,255,255,0.2);
+                            border-radius: 20px;
+                            display: inline-block;
+                            font-size: 0.75rem;
+                            font-weight: 500;
+                        ">
+                            ✅ NIHR Standards Applied
+                        </div>
+                    </div>
+                    """, unsafe_allow_html=True)
+                    
+                with col3:
+                    if 'duplicate_analysis' in quality_results:
+                        total_dups = quality_results['duplicate_analysis'].get('total_duplicates', 0)
+                        st.markdown(f"""
+                        <div style="
+                            background: linear-gradient(135deg, #9C27B0 0%, #7B1FA2 100%);
+                            color: white;
+                            padding: 20px;
+                            border-radius: 10px;
+                            text-align: center;
+                            margin-bottom: 15px;
+                        ">
+                            <h2 style="margin: 0; font-size: 1.5rem;">{total_dups:,}</h2>
+                            <h4 style="margin: 10px 0 5px 0;">Duplicates</h4>
+                            <p style="margin: 0; opacity: 0.8; font-size: 0.9rem;">{(total_dups/len(df)*100):.1f}% of data</p>
                         </div>
+                        """, unsafe_allow_html=True)
+                    
+                with col4:
+                    st.markdown("""
+                    <div style="
+                        background: linear-gradient(135deg, #4CAF50 0%, #45a049 100%);
+                        color: white;
+                        padding: 20px;
+                        border-radius: 10px;
+                        text-align: center;
+                        margin-bottom: 15px;
+                    ">
+                        <h2 style="margin: 0; font-size: 1.5rem;">95%+</h2>
+                        <h4 style="margin: 10px 0 5px 0;">Geo Mapping</h4>
+                        <p style="margin: 0; opacity: 0.8; font-size: 0.9rem;">Success rate</p>
                     </div>
-                    <div style="margin-left: 65px;">
-                        <p style="margin: 8px 0; font-size: 1rem; opacity: 0.95;"><strong>📊 Comprehensive Assessment:</strong></p>
-                        <p style="margin: 5px 0; font-size: 0.9rem; opacity: 0.9;">• Multi-dimensional quality scoring</p>
-                        <p style="margin: 5px 0; font-size: 0.9rem; opacity: 0.9;">• Automated grading system (A-F scale)</p>
-                        <p style="margin: 5px 0; font-size: 0.9rem; opacity: 0.9;">• Completeness & consistency metrics</p>
-                        <p style="margin: 5px 0; font-size: 0.9rem; opacity: 0.9;">• Parliamentary-ready validation</p>
+                    """, unsafe_allow_html=True)
+            
+                # Zero Awards Analysis (unique to Issues & Solutions)
+                if 'award_analysis' in quality_results:
+                    zero_count = quality_results['award_analysis']['zero_count']
+                    st.markdown("### 🎯 Zero Awards Investigation")
+                    st.markdown(f"""
+                    <div style="
+                        background: linear-gradient(135deg, #FF5722 0%, #E53935 100%);
+                        color: white;
+                        padding: 20px;
+                        border-radius: 12px;
+                        margin: 15px 0;
+                    ">
+                        <h3 style="margin: 0;">Critical Issue: {zero_count:,} Zero Award Records</h3>
+                        <p style="margin: 10px 0 0 0; opacity: 0.9;">
+                            86.6% of zero awards are Training programmes - suggests data entry pattern rather than data quality issue
+                        </p>
                     </div>
+                    """, unsafe_allow_html=True)
+            
+                # Enhanced Solutions Overview
+                st.markdown("### ✅ Solutions Implemented")
+                col1, col2 = st.columns(2)
+            
+                with col1:
+                    st.metric("Pattern Matching", "26+", "Missing value types")
+                with col2:
+                    st.metric("Outlier Detection", "Multi-method", "Z-score + IQR")
+            
+                # Missing Value Patterns - Detailed View (specific to Issues & Solutions tab)
+                st.markdown("### 🔍 Enhanced Missing Value Detection - 26 Patterns")
+            
+                # Group patterns by category, with the rows the quality assessment matched to each
+                pattern_categories = MISSING_PATTERN_CATEGORIES
+                pattern_counts = quality_results['missing_patterns']['by_pattern']
+            
+                # Enhanced pattern display with premium cards
+                colors = [
+                    "#4CAF50", "#2196F3", "#FF9800", "#9C27B0", 
+                    "#FF5722", "#607D8B", "#795548"
+                ]
+            
+                # Reorganize categories for better display
+                display_categories = {
+                    'Standard & Null': pattern_categories['Standard Null'],
+                    'N/A Variations': pattern_categories['N/A Variations'],
+                    'Not Available': pattern_categories['Not Available'],
+                    'Not Known': pattern_categories['Not Known'],
+                    'To Be Confirmed': pattern_categories['To Be Confirmed'],
+                    'Unknown': pattern_categories['Unknown'],
+                    'None & Symbols': pattern_categories['None Variations'] + pattern_categories['Symbols']
+                }
+            
+                for i, (category, patterns) in enumerate(display_categories.items()):
+                    color = colors[i % len(colors)]
+                
+                    # Create expandable sections for each category
+                    category_rows = sum(pattern_counts.get(pattern, 0) for pattern in patterns)
+                    with st.expander(f"🏷️ {category} ({len(patterns)} patterns, {category_rows:,} values found)", expanded=True):
+                        st.markdown(f"""
                     <div style="
-                        margin-top: 15px;
-                        padding: 8px 16px;
-                        background: rgba(255,255,255,0.2);
-                        border-radius: 20px;
-                        display: inline-block;
-                        font-size: 0.85rem;
-                        font-weight: 500;
+                        background: linear-gradient(135deg, {color} 0%, {color}CC 100%);
+                        color: white;
+                        padding: 20px;
+                        border-radius: 12px;
+                        margin: 10px 0;
                     ">
-                        🎯 Quality Assured
+                        <div style="display: grid; grid-template-columns: repeat(auto-fit, minmax(120px, 1fr)); gap: 8px;">
+                        """, unsafe_allow_html=True)
+                    
+                        for pattern in patterns:
+                            display_pattern = "'empty string'" if pattern == '' else f"'{pattern}'"
+                            display_pattern += f" · {pattern_counts.get(pattern, 0):,}"
+                            st.markdown(f"""
+                            <div style="
+                                background: rgba(255,255,255,0.2);
+                                padding: 6px 10px;
+                                border-radius: 6px;
+                                text-align: center;
+                                font-family: monospace;
+                                font-size: 0.85rem;
+                                border: 1px solid rgba(255,255,255,0.3);
+                                word-break: break-all;
+                            ">
+                                {display_pattern}
+                            </div>
+                            """, unsafe_allow_html=True)
+                    
+                        st.markdown("</div></div>", unsafe_allow_html=True)
+            
+                # Summary statistics card (within tab2)
+                total_patterns = sum(len(patterns) for patterns in display_categories.values())
+                st.markdown(f"""
+                <div style="
+                    background: linear-gradient(135deg, #37474F 0%, #263238 100%);
+                    color: white;
+                    padding: 20px;
+                    border-radius: 12px;
+                    margin: 20px 0;
+                    text-align: center;
+                ">
+                    <h3 style="margin: 0 0 15px 0;">📊 Pattern Detection Summary</h3>
+                    <div style="display: flex; justify-content: space-around; flex-wrap: wrap;">
+                        <div style="margin: 5px;">
+                            <h2 style="margin: 0; color: #4CAF50;">{total_patterns}</h2>
+                            <p style="margin: 0; opacity: 0.8; font-size: 0.9rem;">Total Patterns</p>
+                        </div>
+                        <div style="margin: 5px;">
+                            <h2 style="margin: 0; color: #2196F3;">{len(display_categories)}</h2>
+                            <p style="margin: 0; opacity: 0.8; font-size: 0.9rem;">Categories</p>
+                        </div>
+                        <div style="margin: 5px;">
+                            <h2 style="margin: 0; color: #E91E63;">{quality_results['missing_patterns']['total']:,}</h2>
+                            <p style="margin: 0; opacity: 0.8; font-size: 0.9rem;">Placeholder Values Found</p>
+                        </div>
+                        <div style="margin: 5px;">
+                            <h2 style="margin: 0; color: #FF9800;">+15%</h2>
+                            <p style="margin: 0; opacity: 0.8; font-size: 0.9rem;">Accuracy Gain</p>
+                        </div>
                     </div>
                 </div>
                 """, unsafe_allow_html=True)
             
+                # Enhanced Process Improvements with Descriptive Tiles
+                st.markdown("### 🔄 Process Improvements & Solutions Implemented")
+            
+                # Enhanced Process Improvements with modern descriptive tiles
+                st.markdown("""
+                <div style="
+                    background: rgba(255,255,255,0.05);
+                    padding: 20px;
+                    border-radius: 12px;
+                    margin: 20px 0;
+                    border: 1px solid rgba(255, 152, 0, 0.2);
+                ">
+                    <h3 style="margin: 0 0 20px 0; color: #FF9800; font-weight: 600;">🚀 Implementation Results & Process Enhancements</h3>
+                </div>
+                """, unsafe_allow_html=True)
+            
+                # Create enhanced process improvement tiles in a 2x2 grid
+                col1, col2 = st.columns(2)
+            
+                with col1:
+                    # Detection Accuracy Enhancement
+                    st.markdown("""
+                    <div style="
+                        background: linear-gradient(135deg, #4CAF50 0%, #45a049 100%);
+                        color: white;
+                        padding: 30px;
+                        border-radius: 15px;
+                        margin-bottom: 20px;
+                        box-shadow: 0 8px 32px rgba(76, 175, 80, 0.2);
+                        position: relative;
+                        overflow: hidden;
+                        transition: transform 0.3s ease;
+                    ">
+                        <div style="
+                            position: absolute;
+                            top: -20px;
+                            right: -20px;
+                            width: 80px;
+                            height: 80px;
+                            background: rgba(255,255,255,0.1);
+                            border-radius: 50%;
+                        "></div>
+                        <div style="display: flex; align-items: center; margin-bottom: 15px;">
+                            <div style="
+                                width: 50px;
+                                height: 50px;
+                                background: rgba(255,255,255,0.2);
+                                border-radius: 50%;
+                                display: flex;
+                                align-items: center;
+                                justify-content: center;
+                                font-size: 1.5rem;
+                                margin-right: 15px;
+                            ">🎯</div>
+                            <div>
+                                <h2 style="margin: 0; font-size: 2.5rem; font-weight: 800;">+15%</h2>
+                                <h4 style="margin: 5px 0; font-size: 1.2rem; font-weight: 600;">Detection Accuracy</h4>
+                            </div>
+                        </div>
+                        <div style="margin-left: 65px;">
+                            <p style="margin: 8px 0; font-size: 1rem; opacity: 0.95;"><strong>🔍 Enhanced Pattern Matching:</strong></p>
+                            <p style="margin: 5px 0; font-size: 0.9rem; opacity: 0.9;">• Expanded from 15 to 26+ missing value patterns</p>
+                            <p style="margin: 5px 0; font-size: 0.9rem; opacity: 0.9;">• Added "Not Known" and case variations</p>
+                            <p style="margin: 5px 0; font-size: 0.9rem; opacity: 0.9;">• Improved null detection algorithms</p>
+                            <p style="margin: 5px 0; font-size: 0.9rem; opacity: 0.9;">• Multi-language pattern recognition</p>
+                        </div>
+                        <div style="
+                            margin-top: 15px;
+                            padding: 8px 16px;
+                            background: rgba(255,255,255,0.2);
+                            border-radius: 20px;
+                            display: inline-block;
+                            font-size: 0.85rem;
+                            font-weight: 500;
+                        ">
+                            ✅ Implemented & Validated
+                        </div>
+                    </div>
+                    """, unsafe_allow_html=True)
+                
+                    # Data Coverage Enhancement
+                    st.markdown("""
+                    <div style="
+                        background: linear-gradient(135deg, #2196F3 0%, #1976D2 100%);
+                        color: white;
+                        padding: 30px;
+                        border-radius: 15px;
+                        margin-bottom: 20px;
+                        box-shadow: 0 8px 32px rgba(33, 150, 243, 0.2);
+                        position: relative;
+                        overflow: hidden;
+                        transition: transform 0.3s ease;
+                    ">
+                        <div style="
+                            position: absolute;
+                            top: -20px;
+                            right: -20px;
+                            width: 80px;
+                            height: 80px;
+                            background: rgba(255,255,255,0.1);
+                            border-radius: 50%;
+                        "></div>
+                        <div style="display: flex; align-items: center; margin-bottom: 15px;">
+                            <div style="
+                                width: 50px;
+                                height: 50px;
+                                background: rgba(255,255,255,0.2);
+                                border-radius: 50%;
+                                display: flex;
+                                align-items: center;
+                                justify-content: center;
+                                font-size: 1.5rem;
+                                margin-right: 15px;
+                            ">🗺️</div>
+                            <div>
+                                <h2 style="margin: 0; font-size: 2.5rem; font-weight: 800;">95%+</h2>
+                                <h4 style="margin: 5px 0; font-size: 1.2rem; font-weight: 600;">Data Coverage</h4>
+                            </div>
+                        </div>
+                        <div style="margin-left: 65px;">
+                            <p style="margin: 8px 0; font-size: 1rem; opacity: 0.95;"><strong>🌍 Geographical Mapping:</strong></p>
+                            <p style="margin: 5px 0; font-size: 0.9rem; opacity: 0.9;">• Multi-level postcode validation system</p>
+                            <p style="margin: 5px 0; font-size: 0.9rem; opacity: 0.9;">• Constituency boundary integration</p>
+                            <p style="margin: 5px 0; font-size: 0.9rem; opacity: 0.9;">• Regional distribution analysis</p>
+                            <p style="margin: 5px 0; font-size: 0.9rem; opacity: 0.9;">• Cross-reference validation checks</p>
+                        </div>
+                        <div style="
+                            margin-top: 15px;
+                            padding: 8px 16px;
+                            background: rgba(255,255,255,0.2);
+                            border-radius: 20px;
+                            display: inline-block;
+                            font-size: 0.85rem;
+                            font-weight: 500;
+                        ">
+                            ✅ High Accuracy Achieved
+                        </div>
+                    </div>
+                    """, unsafe_allow_html=True)
+            
+                with col2:
+                    # Processing Speed Enhancement
+                    st.markdown("""
+                    <div style="
+                        background: linear-gradient(135deg, #FF9800 0%, #F57C00 100%);
+                        color: white;
+                        padding: 30px;
+                        border-radius: 15px;
+                        margin-bottom: 20px;
+                        box-shadow: 0 8px 32px rgba(255, 152, 0, 0.2);
+                        position: relative;
+                        overflow: hidden;
+                        transition: transform 0.3s ease;
+                    ">
+                        <div style="
+                            position: absolute;
+                            top: -20px;
+                            right: -20px;
+                            width: 80px;
+                            height: 80px;
+                            background: rgba(255,255,255,0.1);
+                            border-radius: 50%;
+                        "></div>
+                        <div style="display: flex; align-items: center; margin-bottom: 15px;">
+                            <div style="
+                                width: 50px;
+                                height: 50px;
+                                background: rgba(255,255,255,0.2);
+                                border-radius: 50%;
+                                display: flex;
+                                align-items: center;
+                                justify-content: center;
+                                font-size: 1.5rem;
+                                margin-right: 15px;
+                            ">⚡</div>
+                            <div>
+                                <h2 style="margin: 0; font-size: 2.5rem; font-weight: 800;">+40%</h2>
+                                <h4 style="margin: 5px 0; font-size: 1.2rem; font-weight: 600;">Processing Speed</h4>
+                            </div>
+                        </div>
+                        <div style="margin-left: 65px;">
+                            <p style="margin: 8px 0; font-size: 1rem; opacity: 0.95;"><strong>🤖 Automated Validation:</strong></p>
+                            <p style="margin: 5px 0; font-size: 0.9rem; opacity: 0.9;">• Vectorized operations for bulk processing</p>
+                            <p style="margin: 5px 0; font-size: 0.9rem; opacity: 0.9;">• Parallel duplicate detection algorithms</p>
+                            <p style="margin: 5px 0; font-size: 0.9rem; opacity: 0.9;">• Optimized statistical calculations</p>
+                            <p style="margin: 5px 0; font-size: 0.9rem; opacity: 0.9;">• Cached validation results</p>
+                        </div>
+                        <div style="
+                            margin-top: 15px;
+                            padding: 8px 16px;
+                            background: rgba(255,255,255,0.2);
+                            border-radius: 20px;
+                            display: inline-block;
+                            font-size: 0.85rem;
+                            font-weight: 500;
+                        ">
+                            ⚡ Performance Optimized
+                        </div>
+                    </div>
+                    """, unsafe_allow_html=True)
+                
+                    # Quality Grade Enhancement
+                    st.markdown("""
+                    <div style="
+                        background: linear-gradient(135deg, #9C27B0 0%, #7B1FA2 100%);
+                        color: white;
+                        padding: 30px;
+                        border-radius: 15px;
+                        margin-bottom: 20px;
+                        box-shadow: 0 8px 32px rgba(156, 39, 176, 0.2);
+                        position: relative;
+                        overflow: hidden;
+                        transition: transform 0.3s ease;
+                    ">
+                        <div style="
+                            position: absolute;
+                            top: -20px;
+                            right: -20px;
+                            width: 80px;
+                            height: 80px;
+                            background: rgba(255,255,255,0.1);
+                            border-radius: 50%;
+                        "></div>
+                        <div style="display: flex; align-items: center; margin-bottom: 15px;">
+                            <div style="
+                                width: 50px;
+                                height: 50px;
+                                background: rgba(255,255,255,0.2);
+                                border-radius: 50%;
+                                display: flex;
+                                align-items: center;
+                                justify-content: center;
+                                font-size: 1.5rem;
+                                margin-right: 15px;
+                            ">🎓</div>
+                            <div>
+                                <h2 style="margin: 0; font-size: 2.5rem; font-weight: 800;">Grade B</h2>
+                                <h4 style="margin: 5px 0; font-size: 1.2rem; font-weight: 600;">Quality Score: 81%</h4>
+                            </div>
+                        </div>
+                        <div style="margin-left: 65px;">
+                            <p style="margin: 8px 0; font-size: 1rem; opacity: 0.95;"><strong>📊 Comprehensive Assessment:</strong></p>
+                            <p style="margin: 5px 0; font-size: 0.9rem; opacity: 0.9;">• Multi-dimensional quality scoring</p>
+                            <p style="margin: 5px 0; font-size: 0.9rem; opacity: 0.9;">• Automated grading system (A-F scale)</p>
+                            <p style="margin: 5px 0; font-size: 0.9rem; opacity: 0.9;">• Completeness & consistency metrics</p>
+                            <p style="margin: 5px 0; font-size: 0.9rem; opacity: 0.9;">• Parliamentary-ready validation</p>
+                        </div>
+                        <div style="
+                            margin-top: 15px;
+                            padding: 8px 16px;
+                            background: rgba(255,255,255,0.2);
+                            border-radius: 20px;
+                            display: inline-block;
+                            font-size: 0.85rem;
+                            font-weight: 500;
+                        ">
+                            🎯 Quality Assured
+                        </div>
+                    </div>
+                    """, unsafe_allow_html=True)
+            
     
     
     # Section D: Parliamentary Recommendations
@@ -4023,11 +6470,7 @@ def main():
         </div>
         """, unsafe_allow_html=True)
         
-        # Clear cache to ensure fresh data
-        st.cache_data.clear()
-        st.session_state.clear()
-
-        southampton_data = create_southampton_analysis(df, geo_df)
+        southampton_data = get_southampton_analysis(df, geo_df, filters)
         
         if southampton_data:
             # Enhanced Performance Dashboard
@@ -4306,7 +6749,7 @@ def main():
 
             # Geographical distribution analysis - shows Southampton in national context
             st.markdown("### 🗺️ National Geographical Distribution Analysis")
-            geo_chart = create_geographical_distribution_chart(df, geo_df)
+            geo_chart = create_geographical_distribution_chart(df, geo_df, filters)
             if geo_chart:
                 st.plotly_chart(geo_chart, use_container_width=True)
 
@@ -4432,47 +6875,76 @@ def main():
             
             # Enhanced Funding Strategy Dashboard with better UI/UX
             st.markdown("---")
-            st.markdown("""
-            <div style="
-                background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                padding: 25px;
-                border-radius: 15px;
-                margin: 20px 0;
-                box-shadow: 0 8px 32px rgba(0,0,0,0.1);
-            ">
-                <h2 style="color: white; margin: 0; text-align: center; font-size: 2.2rem;">
-                    💰 Strategic Funding Intelligence Hub
-                </h2>
-                <p style="color: rgba(255,255,255,0.9); text-align: center; margin: 10px 0 0 0; font-size: 1.1rem;">
-                    Advanced analytics to maximize NIHR funding opportunities for Southampton, Test
-                </p>
-            </div>
-            """, unsafe_allow_html=True)
+
+            # Southampton, Test uses this page's (filtered) analysis; any other constituency is a
+            # lookup into the batch of profiles, metrics and strategies built once per dataset version
+            strategy_options = ['Southampton, Test'] + [
+                name for name in constituency_strategy_names(df, geo_df) if name != 'Southampton, Test']
+            strategy_constituency = st.selectbox("Constituency", strategy_options, key="strategy_constituency")
+            strategy_data = southampton_data
+            selected_strategy = None
+            if strategy_constituency != 'Southampton, Test':
+                selected_strategy = get_constituency_strategy(df, geo_df, strategy_constituency)
+                strategy_data = selected_strategy['profile'] if selected_strategy is not None else None
+
+            if strategy_data is None:
+                st.info(f"No profile is available for {strategy_constituency} in this dataset; "
+                        "choose another constituency.")
+            else:
+                st.markdown(f"""
+                <div style="
+                    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+                    padding: 25px;
+                    border-radius: 15px;
+                    margin: 20px 0;
+                    box-shadow: 0 8px 32px rgba(0,0,0,0.1);
+                ">
+                    <h2 style="color: white; margin: 0; text-align: center; font-size: 2.2rem;">
+                        💰 Strategic Funding Intelligence Hub
+                    </h2>
+                    <p style="color: rgba(255,255,255,0.9); text-align: center; margin: 10px 0 0 0; font-size: 1.1rem;">
+                        Advanced analytics to maximize NIHR funding opportunities for {strategy_constituency}
+                    </p>
+                </div>
+                """, unsafe_allow_html=True)
+                if len(strategy_options) > 1:
+                    st.caption("Other constituencies are profiled from the whole portfolio; the sidebar filters "
+                               "apply to Southampton, Test only.")
             
-            # Create tabbed interface for better organization
-            tab1, tab2, tab3, tab4 = st.tabs([
-                "📊 Performance Analytics", 
-                "🎯 Strategic Priorities", 
-                "💰 Investment Opportunities", 
-                "🏛️ Parliamentary Actions"
-            ])
+                # Create tabbed interface for better organization
+                # Only the selected tab runs its metrics and strategy; both are cached after first use
+                tab1, tab2, tab3, tab4 = lazy_tabs([
+                    "📊 Performance Analytics", 
+                    "🎯 Strategic Priorities", 
+                    "💰 Investment Opportunities", 
+                    "🏛️ Parliamentary Actions"
+                ], key="strategy_tabs")
             
-            with tab1:
-                st.markdown("### 📈 Success & Performance Analysis")
-                st.markdown("*Real-time insights based on project completion rates and funding efficiency*")
-                
-                success_metrics = calculate_success_metrics(df, southampton_data)
-                if success_metrics:
-                    display_success_analysis(success_metrics, southampton_data)
+                with tab1:
+                    if tab_is_open(tab1):
+                        st.markdown("### 📈 Success & Performance Analysis")
+                        st.markdown("*Real-time insights based on project completion rates and funding efficiency*")
+                    
+                        success_metrics = selected_strategy['metrics'] if selected_strategy else \
+                            get_success_metrics(df, geo_df, southampton_data, filters)
+                        if success_metrics:
+                            display_success_analysis(success_metrics, strategy_data)
             
-            with tab2:
-                display_strategic_priorities(success_metrics, southampton_data)
+                with tab2:
+                    if tab_is_open(tab2):
+                        success_metrics = selected_strategy['metrics'] if selected_strategy else \
+                            get_success_metrics(df, geo_df, southampton_data, filters)
+                        display_strategic_priorities(success_metrics, strategy_data)
             
-            with tab3:
-                display_investment_opportunities(success_metrics, southampton_data)
+                with tab3:
+                    if tab_is_open(tab3):
+                        success_metrics = selected_strategy['metrics'] if selected_strategy else \
+                            get_success_metrics(df, geo_df, southampton_data, filters)
+                        display_investment_opportunities(success_metrics, strategy_data)
             
-            with tab4:
-                display_parliamentary_actions(success_metrics, southampton_data)
+                with tab4:
+                    if tab_is_open(tab4):
+                        display_parliamentary_actions(None, strategy_data)
             
             
     
@@ -4486,6 +6958,10 @@ def main():
     </div>
     """, unsafe_allow_html=True)
 
+    if TIMING_ENABLED:
+        record_span('page.render', time.perf_counter() - page_started, len(df), section=section)
+    display_timing_panel()
+
 if __name__ == "__main__":
     main()
 